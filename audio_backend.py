@@ -0,0 +1,165 @@
+"""
+Audio Backends for Tomb Bound
+The pygame mixer backend plays real audio; the null backend only counts calls,
+for headless simulations, tests and benchmarks
+"""
+
+import pygame
+import os
+from collections import Counter
+from sound_bank import SoundBank, SOUND_FILES
+from music_controller import MusicController
+
+# Environment variable used to pick a backend ('pygame' or 'null')
+BACKEND_ENV_VAR = 'TOMB_BOUND_AUDIO'
+DEFAULT_BACKEND = 'pygame'
+
+
+class PygameMixerBackend:
+    name = 'pygame'
+    has_device = True
+
+    def init(self):
+        """Open the audio device (raises pygame.error if it is unavailable)"""
+        pygame.mixer.init()
+
+    def create_sound_bank(self, volume):
+        return SoundBank(volume=volume)
+
+    def create_music(self, cues, volume):
+        return MusicController(cues, volume)
+
+
+class CountingSoundHandle:
+    """Sound handle that records plays instead of making a sound"""
+    __slots__ = ('name', 'key', 'bank')
+
+    def __init__(self, name, bank):
+        self.name = name
+        self.key = f'play:{name}'
+        self.bank = bank
+
+    def play(self):
+        if self.bank.enabled:
+            self.bank.calls[self.key] += 1
+
+    def stop(self):
+        pass
+
+
+class NullSoundBank:
+    def __init__(self, calls, volume=0.7):
+        """Sound bank with the SoundBank interface that never touches the mixer"""
+        self.calls = calls
+        self.volume = volume
+        self.enabled = True
+        self.sounds = {}
+        self.categories = {}
+        self.handles = {}
+
+    def load(self, sound_files=SOUND_FILES):
+        """Create a handle for every known sound without decoding anything"""
+        for name in sound_files:
+            self.handles[name] = CountingSoundHandle(name, self)
+
+    def get_handle(self, name):
+        handle = self.handles.get(name)
+        if handle is None:
+            handle = self.handles[name] = CountingSoundHandle(name, self)
+        return handle
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+
+class NullMusicController:
+    def __init__(self, calls, cues, volume=0.5):
+        """Music controller with the MusicController interface that only records calls"""
+        self.calls = calls
+        self.cues = cues
+        self.volume = volume
+        self.loaded_file = None
+        self.current_cue = None
+        self.state = 'stopped'
+
+    def play(self, cue, fade_ms=0, restart=True):
+        self.calls['music.play'] += 1
+        self.start(cue, fade_ms, restart)
+
+    def start(self, cue, fade_ms=0, restart=True):
+        self.current_cue = cue
+        self.state = 'playing' if self.cues.get(cue) else 'stopped'
+
+    def pause(self):
+        self.calls['music.pause'] += 1
+        if self.state == 'playing':
+            self.state = 'paused'
+
+    def resume(self):
+        self.calls['music.resume'] += 1
+        if self.state == 'paused':
+            self.state = 'playing'
+
+    def stop(self, fade_ms=0):
+        self.calls['music.stop'] += 1
+        self.state = 'stopped'
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def update(self):
+        pass
+
+
+class NullAudioBackend:
+    name = 'null'
+    has_device = False
+
+    def __init__(self):
+        # Every sound and music call is counted here
+        self.calls = Counter()
+
+    def init(self):
+        """Close the mixer if pygame.init() opened it; the null backend never uses it"""
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+
+    def create_sound_bank(self, volume):
+        return NullSoundBank(self.calls, volume)
+
+    def create_music(self, cues, volume):
+        return NullMusicController(self.calls, cues, volume)
+
+
+BACKENDS = {
+    'pygame': PygameMixerBackend,
+    'null': NullAudioBackend
+}
+
+
+def backend_name(backend=None):
+    """Resolve a backend name from the argument, the environment or the default"""
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV_VAR, DEFAULT_BACKEND)
+    if not isinstance(backend, str):
+        return backend.name
+    return backend.lower()
+
+
+def create_backend(backend=None):
+    """Create a backend from a name, an existing backend instance, or the environment"""
+    if backend is not None and not isinstance(backend, str):
+        return backend
+
+    name = backend_name(backend)
+    if name not in BACKENDS:
+        print(f"Unknown audio backend '{name}', using '{DEFAULT_BACKEND}'")
+        name = DEFAULT_BACKEND
+    return BACKENDS[name]()
+
+
+def configure_environment(backend=None):
+    """Prepare SDL for the chosen backend; call before pygame.init()"""
+    if backend_name(backend) == 'null':
+        # pygame.init() opens the mixer, so point it at a driver with no device
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
@@ -6,27 +6,37 @@ Handles all audio-related functionality including background music and sound eff
 import pygame
 import os
 import time
+from audio_backend import create_backend, NullAudioBackend
 
 class AudioManager:
-    def __init__(self):
-        """Initialize the audio manager"""
+    def __init__(self, backend=None):
+        """Initialize the audio manager with a backend name or instance ('pygame' or 'null')"""
         self.sounds = {}
         self.music_file = None
+        self.music = None
         self.music_volume = 0.5
         self.sound_volume = 0.7
         self.music_enabled = True  # Default music to ON
-        self.sound_enabled = True
+        
+        # Pick the backend from the argument, the TOMB_BOUND_AUDIO variable or the default
+        self.backend = create_backend(backend)
         
         # Try to initialize the mixer
         self.audio_available = False
         try:
-            pygame.mixer.init()
-            self.audio_available = True
-            print("Audio system initialized successfully")
+            self.backend.init()
+            self.audio_available = self.backend.has_device
+            if self.audio_available:
+                print("Audio system initialized successfully")
+            else:
+                print(f"Using '{self.backend.name}' audio backend")
         except pygame.error as e:
             print(f"Audio system initialization failed: {e}")
             print("Game will run without sound")
-            return
+            self.backend = NullAudioBackend()
+        
+        self.bank = self.backend.create_sound_bank(self.sound_volume)
+        self.sound_enabled = True
             
         # Load background music
         self.load_music()
@@ -36,9 +46,6 @@ class AudioManager:
     
     def load_music(self):
         """Load background music from the audio directory"""
-        if not self.audio_available:
-            return
-            
         # Look for background music file in the audio directory
         if os.path.exists('audio'):
             bgm_path = os.path.join('audio', 'gamebgm.mp3')
@@ -50,180 +57,110 @@ class AudioManager:
         
         if not self.music_file:
             print("No background music found in audio directory")
+        
+        # Every cue shares the one background track; game over fades to silence
+        self.music = self.backend.create_music({
+            'menu': self.music_file,
+            'gameplay': self.music_file,
+            'game_over': None
+        }, self.music_volume)
     
     def load_sounds(self):
-        """Load sound effects from the audio directory"""
-        if not self.audio_available:
-            return
-        
-        # Create sound categories
-        self.sound_categories = {
-            'menu': {},    # Menu navigation sounds
-            'player': {},  # Player action sounds
-            'game': {}     # Game event sounds
-        }
-        
-        # Load hurt sound (when player collides with trap)
-        hurt_path = os.path.join('audio', 'hurtsound.mp3')
-        if os.path.exists(hurt_path):
-            try:
-                self.sound_categories['game']['hurt'] = pygame.mixer.Sound(hurt_path)
-                self.sound_categories['game']['hurt'].set_volume(self.sound_volume)
-                print(f"Hurt sound loaded: {hurt_path}")
-            except pygame.error as e:
-                print(f"Could not load hurt sound: {e}")
+        """Load sound effects from the audio directory into the sound bank"""
+        # Decode (or load cached PCM for) every sound and reserve its channels
+        self.bank.volume = self.sound_volume
+        self.bank.load()
         
-        # Jump sound removed as per requirements
+        # Jump, click and hover sounds removed as per requirements
         
-        # Load death sound (when player loses all health)
-        death_path = os.path.join('audio', 'mandeathsound.mp3')
-        if os.path.exists(death_path):
-            try:
-                self.sound_categories['game']['death'] = pygame.mixer.Sound(death_path)
-                self.sound_categories['game']['death'].set_volume(self.sound_volume)
-                print(f"Death sound loaded: {death_path}")
-            except pygame.error as e:
-                print(f"Could not load death sound: {e}")
-        
-        # Load game over sound
-        game_over_path = os.path.join('audio', 'gameover.mp3')
-        if os.path.exists(game_over_path):
-            try:
-                self.sound_categories['game']['game_over'] = pygame.mixer.Sound(game_over_path)
-                self.sound_categories['game']['game_over'].set_volume(self.sound_volume)
-                print(f"Game over sound loaded: {game_over_path}")
-            except pygame.error as e:
-                print(f"Could not load game over sound: {e}")
-                
-        # Load menu sounds
-        # Click sound removed as per requirements
-        
-        # Hover sound removed as per requirements
-        
-        # For backward compatibility, create a flat dictionary of all sounds
-        self.sounds = {}
-        for category in self.sound_categories:
-            for sound_name, sound in self.sound_categories[category].items():
-                self.sounds[sound_name] = sound
+        # Keep the category and flat dictionaries for backward compatibility
+        self.sound_categories = self.bank.categories
+        self.sounds = self.bank.sounds
+    
+    def get_handle(self, sound_name):
+        """Resolve a sound name once to a handle that can be played directly"""
+        return self.bank.get_handle(sound_name)
     
-    def play_music(self):
-        """Start playing background music in a loop"""
-        if not self.audio_available or not self.music_file or not self.music_enabled:
+    def play_music(self, cue='gameplay', fade_ms=0, restart=True):
+        """Play a music cue in a loop, rewinding or resuming the loaded stream"""
+        if not self.music_enabled:
             return
             
         try:
-            pygame.mixer.music.load(self.music_file)
-            pygame.mixer.music.set_volume(self.music_volume)
-            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-            print("Background music started")
+            self.music.play(cue, fade_ms, restart)
         except pygame.error as e:
             print(f"Could not play background music: {e}")
     
-    def stop_music(self):
+    def stop_music(self, fade_ms=0):
         """Stop the background music"""
-        if not self.audio_available:
-            return
-            
         try:
-            pygame.mixer.music.stop()
+            self.music.stop(fade_ms)
             print("Background music stopped")
         except pygame.error as e:
             print(f"Error stopping music: {e}")
     
     def pause_music(self):
         """Pause the background music"""
-        if not self.audio_available:
-            return
-            
-        try:
-            pygame.mixer.music.pause()
-        except pygame.error:
-            pass
+        self.music.pause()
     
     def unpause_music(self):
         """Unpause the background music"""
-        if not self.audio_available:
-            return
-            
-        try:
-            pygame.mixer.music.unpause()
-        except pygame.error:
-            pass
+        self.music.resume()
+    
+    def update(self):
+        """Advance music transitions; call once per frame"""
+        self.music.update()
     
     def play_sound(self, sound_name, category=None):
-        """Play a sound effect by name, optionally from a specific category"""
-        if not self.audio_available or not self.sound_enabled:
-            return
-        
-        # If category is specified, try to play from that category
-        if category and category in self.sound_categories:
-            if sound_name in self.sound_categories[category]:
-                try:
-                    self.sound_categories[category][sound_name].play()
-                    return
-                except pygame.error:
-                    pass
-        
-        # Fall back to flat dictionary if category not specified or sound not found in category
-        if sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except pygame.error:
-                pass
+        """Play a sound effect by name (prefer holding a handle from get_handle)"""
+        self.bank.get_handle(sound_name).play()
     
     def toggle_music(self):
         """Toggle background music on/off"""
-        if not self.audio_available:
-            return
-            
         self.music_enabled = not self.music_enabled
         
-        if self.music_enabled:
-            self.play_music()
-        else:
+        if not self.music_enabled:
             self.stop_music()
+        else:
+            # Restart the cue that was active when music was switched off
+            self.play_music(self.music.current_cue or 'gameplay')
         
         return self.music_enabled
     
+    @property
+    def sound_enabled(self):
+        """Whether sound effects are played"""
+        return self.bank.enabled
+    
+    @sound_enabled.setter
+    def sound_enabled(self, enabled):
+        self.bank.enabled = enabled
+    
     def toggle_sound(self):
         """Toggle sound effects on/off"""
-        if not self.audio_available:
-            return
-            
         self.sound_enabled = not self.sound_enabled
         return self.sound_enabled
     
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
-        if not self.audio_available:
-            return
-            
         self.music_volume = max(0.0, min(1.0, volume))
         try:
-            pygame.mixer.music.set_volume(self.music_volume)
+            self.music.set_volume(self.music_volume)
         except pygame.error:
             pass
     
     def set_sound_volume(self, volume):
         """Set sound effects volume (0.0 to 1.0)"""
-        if not self.audio_available:
-            return
-            
         self.sound_volume = max(0.0, min(1.0, volume))
-        
-        for sound in self.sounds.values():
-            try:
-                sound.set_volume(self.sound_volume)
-            except pygame.error:
-                pass
+        self.bank.set_volume(self.sound_volume)
 
 # Create a global instance for easy importing
 audio_manager = None
 
-def initialize():
-    """Initialize the audio manager"""
+def initialize(backend=None):
+    """Initialize the audio manager, optionally with a specific backend"""
     global audio_manager
-    audio_manager = AudioManager()
+    audio_manager = AudioManager(backend)
     return audio_manager
 
 def get_instance():
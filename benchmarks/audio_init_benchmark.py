@@ -0,0 +1,66 @@
+"""
+Audio init benchmark for Tomb Bound
+Compares loading the sound effects with an empty PCM cache (cold) and a filled one (warm)
+
+Run from anywhere: python benchmarks/audio_init_benchmark.py
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+# Run headless and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import pygame
+from sound_bank import SoundBank
+
+REPEATS = 5
+
+
+def time_load(cache_dir):
+    """Time one full sound bank load using the given cache directory"""
+    bank = SoundBank(cache_dir=cache_dir)
+    start = time.perf_counter()
+    bank.load()
+    elapsed = time.perf_counter() - start
+    return elapsed, bank.cache_hits, bank.cache_misses
+
+
+def main():
+    pygame.mixer.init()
+    cache_dir = tempfile.mkdtemp(prefix='tomb_bound_pcm_')
+    cold_times = []
+    warm_times = []
+
+    try:
+        for _ in range(REPEATS):
+            # Cold: empty the cache so every sound is decoded from MP3
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            elapsed, hits, misses = time_load(cache_dir)
+            assert hits == 0, "cold load should not hit the cache"
+            cold_times.append(elapsed)
+
+            # Warm: the cold run just filled the cache
+            elapsed, hits, misses = time_load(cache_dir)
+            assert misses == 0, "warm load should not decode any sound"
+            warm_times.append(elapsed)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        pygame.mixer.quit()
+
+    cold = min(cold_times) * 1000
+    warm = min(warm_times) * 1000
+    print()
+    print(f"Cold audio init (MP3 decode): {cold:8.2f} ms (best of {REPEATS})")
+    print(f"Warm audio init (PCM cache):  {warm:8.2f} ms (best of {REPEATS})")
+    print(f"Speedup: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
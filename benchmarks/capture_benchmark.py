@@ -0,0 +1,116 @@
+"""
+Frame capture benchmark for Tomb Bound
+Plays the game headless without recording and then recording in each capture format,
+and reports the frame times of the game loop, how many frames were written or dropped,
+and whether the recorded frames match what was presented
+
+Run from anywhere: python benchmarks/capture_benchmark.py
+(set TOMB_BOUND_RENDERER=texture to measure the texture renderer's readback;
+recordings go to a temporary directory that is removed afterwards)
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import numpy
+import pygame
+import tomb_bound
+from capture import FrameRecorder, CAPTURE_FORMATS
+
+FRAMES = 600
+SETTINGS_FILE = 'game_settings.json'
+
+
+def play(game, frames):
+    """Play paced frames; returns the time each frame took to update and draw (and record), in ms"""
+    times = []
+    for i in range(frames):
+        if i % 50 == 0:
+            game.player.jump()
+        start = time.perf_counter()
+        if not game.game_over:
+            game.update_game()
+        else:
+            game.update_game_over()
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000)
+        game.pacer.tick(tomb_bound.FPS)
+    return times
+
+
+def recorded_frame_matches(game, directory):
+    """Record a single raw frame and compare the file with the screen"""
+    game.recorder = FrameRecorder(tomb_bound.screen, (tomb_bound.SCREEN_WIDTH, tomb_bound.SCREEN_HEIGHT), 'raw')
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.recorder.start(tomb_bound.FPS, directory)
+        game.draw()
+        game.recorder.stop()
+    screen = pygame.Surface(tomb_bound.screen.get_size())
+    tomb_bound.screen.capture(screen)
+    expected = pygame.surfarray.array3d(screen).transpose(1, 0, 2)
+    recorded = numpy.fromfile(os.path.join(directory, 'frames.rgb'), numpy.uint8).reshape(expected.shape)
+    return numpy.array_equal(recorded, expected)
+
+
+def measure(game, fmt, directory):
+    """Play FRAMES frames recording in a format (None: not recording) and print the costs"""
+    game.recorder = FrameRecorder(tomb_bound.screen, (tomb_bound.SCREEN_WIDTH, tomb_bound.SCREEN_HEIGHT), fmt)
+    random.seed(1996)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_game('bench')
+        if fmt:
+            game.recorder.start(tomb_bound.FPS, os.path.join(directory, fmt))
+        times = play(game, FRAMES)
+        game.recorder.stop()
+
+    written = dropped = '-'
+    size = 0
+    if fmt:
+        with open(os.path.join(directory, fmt, 'capture.json')) as f:
+            info = json.load(f)
+        written, dropped = info['written'], info['dropped']
+        size = sum(entry.stat().st_size for entry in os.scandir(os.path.join(directory, fmt)))
+
+    times.sort()
+    print(f"{fmt or 'off':<5} {times[len(times) // 2]:7.2f} ms {times[int(len(times) * 0.95)]:7.2f} ms "
+          f"{times[-1]:7.2f} ms {written:>8} {dropped:>8} {size / 2 ** 20:8.1f} MB")
+
+
+def main():
+    # Playing can save a high score; keep the real settings untouched
+    backup = SETTINGS_FILE + '.bench'
+    shutil.copy(SETTINGS_FILE, backup)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = tomb_bound.Game()
+        print(f"Recording {FRAMES} frames of play at {tomb_bound.FPS} FPS per format "
+              f"({tomb_bound.SCREEN_WIDTH}x{tomb_bound.SCREEN_HEIGHT}, {tomb_bound.screen.name} renderer)")
+        print(f"{'fmt':<5} {'frame p50':>10} {'p95':>10} {'max':>10} {'written':>8} {'dropped':>8} {'on disk':>11}")
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt in [None] + CAPTURE_FORMATS:
+                measure(game, fmt, directory)
+
+            # The recorded pixels are the presented ones
+            matches = recorded_frame_matches(game, os.path.join(directory, 'check'))
+            print(f"Recorded frame matches the screen: {'yes' if matches else 'NO'}")
+        game.parallax.stop()
+    finally:
+        shutil.move(backup, SETTINGS_FILE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Idle benchmark for Tomb Bound
+Runs the real game loop for a few seconds per scenario (menu with input, idle menu,
+unfocused window, focus lost during a run) and reports frames drawn and CPU time used
+
+Run from anywhere: python benchmarks/idle_benchmark.py
+(each scenario runs in its own process, since the game loop quits pygame on exit)
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+SECONDS = 8
+IDLE_AFTER_MS = 1000  # Shorter than the game's, so the idle menu shows within the run
+SETTINGS_FILE = 'game_settings.json'
+SCENARIOS = ['menu with input', 'idle menu', 'unfocused', 'focus lost while playing']
+
+
+def run_scenario(name):
+    """Play one scenario in this process and print its results as JSON"""
+    import pygame
+    import tomb_bound
+    import idle
+    from telemetry import telemetry
+    idle.IDLE_AFTER_MS = IDLE_AFTER_MS
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = tomb_bound.Game()
+        if name == 'focus lost while playing':
+            game.start_game('bench')
+    if name == 'menu with input':
+        # Someone moving the mouse over the menu
+        pygame.time.set_timer(pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 10), rel=(1, 0), buttons=(0, 0, 0)), 100)
+    elif name != 'idle menu':
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    pygame.time.set_timer(pygame.QUIT, SECONDS * 1000, loops=1)
+
+    telemetry.reset()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.run()
+    except SystemExit:
+        pass
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    print(json.dumps({'frames': telemetry.frames, 'wall': wall, 'cpu': cpu,
+                      'waits': telemetry.totals['idle.waits'], 'state': game.game_state}))
+
+
+def main():
+    if len(sys.argv) > 1:
+        run_scenario(sys.argv[1])
+        return
+
+    # Playing can save settings; keep the real settings untouched
+    backup = SETTINGS_FILE + '.bench'
+    shutil.copy(SETTINGS_FILE, backup)
+    try:
+        print(f"Game loop for {SECONDS} s per scenario (menus go idle after {IDLE_AFTER_MS} ms without input)")
+        print(f"{'scenario':<26} {'frames':>7} {'fps':>6} {'cpu':>8} {'cpu %':>6} {'waits':>6}  state")
+        for name in SCENARIOS:
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), name],
+                                    capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{name:<26} {result['frames']:>7} {result['frames'] / result['wall']:6.1f} "
+                  f"{result['cpu']:7.2f}s {result['cpu'] / result['wall'] * 100:5.1f}% "
+                  f"{result['waits']:>6}  {result['state']}")
+    finally:
+        shutil.move(backup, SETTINGS_FILE)
+
+
+if __name__ == "__main__":
+    main()
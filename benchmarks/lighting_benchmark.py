@@ -0,0 +1,77 @@
+"""
+Lighting benchmark for Tomb Bound
+Times the torch lighting pass (ambient fill, light pools, multiply and flame glow)
+over a composed world layer at every quality, and checks it against a per-frame budget
+
+Run from anywhere: python benchmarks/lighting_benchmark.py
+(exits with status 1 if any quality goes over the budget)
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import time
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import tomb_bound
+from lighting import TorchLighting, QUALITY_LEVELS
+
+FRAMES_PER_QUALITY = 600
+BUDGET_MS = 1.0  # Per-frame budget for the lighting pass at 1024x600 (p95)
+SETTINGS_FILE = 'game_settings.json'
+
+
+def measure(game, quality):
+    """Light FRAMES_PER_QUALITY frames of scrolling world; returns the p95 in ms"""
+    start = time.perf_counter()
+    lighting = TorchLighting(tomb_bound.screen, (tomb_bound.SCREEN_WIDTH, tomb_bound.SCREEN_HEIGHT),
+                             tomb_bound.UI_SCALE, quality)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    world = tomb_bound.screen.create_layer((tomb_bound.SCREEN_WIDTH, tomb_bound.SCREEN_HEIGHT))
+    times = []
+    for _ in range(FRAMES_PER_QUALITY):
+        for bg in game.backgrounds:
+            bg.update(game.speed)
+        world.blits(game.background_copies(), doreturn=0)
+        lights = game.torch_lights()
+        start = time.perf_counter()
+        lighting.draw(world, lights)
+        times.append(time.perf_counter() - start)
+
+    times.sort()
+    p95 = times[int(len(times) * 0.95)] * 1000
+    print(f"{quality:<5} build {build_ms:7.1f} ms  "
+          f"mean {statistics.mean(times) * 1000:6.3f} ms  p95 {p95:6.3f} ms  "
+          f"max {times[-1] * 1000:6.3f} ms  {'ok' if p95 <= BUDGET_MS else 'OVER BUDGET'}")
+    return p95
+
+
+def main():
+    # Creating a Game can write settings; keep the real settings untouched
+    backup = SETTINGS_FILE + '.bench'
+    shutil.copy(SETTINGS_FILE, backup)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = tomb_bound.Game()
+        game.parallax.stop()
+        print(f"Lighting pass per frame ({FRAMES_PER_QUALITY} frames per quality, "
+              f"{tomb_bound.SCREEN_WIDTH}x{tomb_bound.SCREEN_HEIGHT}, {tomb_bound.screen.name} renderer, "
+              f"budget {BUDGET_MS:.1f} ms)")
+        worst = max(measure(game, quality) for quality in QUALITY_LEVELS)
+    finally:
+        shutil.move(backup, SETTINGS_FILE)
+    sys.exit(0 if worst <= BUDGET_MS else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Frame pacing benchmark for Tomb Bound
+Plays the game with each frame pacing mode and reports present interval jitter
+(p50/p95/p99), dropped frames and the CPU time the mode costs, to pick a mode per machine
+
+Run from anywhere: python benchmarks/pacing_benchmark.py
+(run it on the target machine with SDL_VIDEODRIVER set to its real driver to include
+'vsync'; the dummy driver accepts the vsync flag without ever waiting for a refresh,
+so vsync pacing there falls back to 'tick' after its first frames)
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import time
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import tomb_bound
+from pacing import PACING_MODES
+
+FRAMES_PER_MODE = 600
+SETTINGS_FILE = 'game_settings.json'
+
+
+def measure(game, mode):
+    """Play FRAMES_PER_MODE frames paced by a mode and print its statistics"""
+    game.pacer.set_mode(mode)
+    random.seed(1996)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_game('bench')
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    for i in range(FRAMES_PER_MODE):
+        if i % 50 == 0:
+            game.player.jump()
+        if not game.game_over:
+            game.update_game()
+        else:
+            game.update_game_over()
+        game.draw()
+        game.pacer.tick(tomb_bound.FPS)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+
+    stats = game.pacer.stats()
+    print(f"{mode:<7} {stats['interval_p50']:7.2f} ms {stats['jitter_p50']:7.2f} ms {stats['jitter_p95']:7.2f} ms "
+          f"{stats['jitter_p99']:7.2f} ms {stats['jitter_max']:7.2f} ms {stats['dropped']:8} "
+          f"{cpu / wall * 100:6.1f}%")
+
+
+def main():
+    # Playing can save a high score; keep the real settings untouched
+    backup = SETTINGS_FILE + '.bench'
+    shutil.copy(SETTINGS_FILE, backup)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = tomb_bound.Game()
+        modes = [mode for mode in PACING_MODES
+                 if mode != 'vsync' or os.environ['SDL_VIDEODRIVER'] != 'dummy']
+        print(f"Present intervals over {FRAMES_PER_MODE} frames of play per mode at {tomb_bound.FPS} FPS "
+              f"({1000 / tomb_bound.FPS:.2f} ms frames, {tomb_bound.screen.name} renderer)")
+        print(f"{'mode':<7} {'interval':>10} {'jitter p50':>10} {'p95':>10} {'p99':>10} {'max':>10} "
+              f"{'dropped':>8} {'cpu':>7}")
+        for mode in modes:
+            measure(game, mode)
+        game.parallax.stop()
+    finally:
+        shutil.move(backup, SETTINGS_FILE)
+
+
+if __name__ == "__main__":
+    main()
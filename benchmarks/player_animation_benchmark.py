@@ -0,0 +1,109 @@
+"""
+Player animation micro-benchmark for Tomb Bound
+Reports allocations per frame of Player.update while running, jumping, getting hurt
+and fading out
+
+Run from anywhere: python benchmarks/player_animation_benchmark.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import tomb_bound
+
+FRAMES_PER_SCENARIO = 600
+
+
+def measure(name, player, step):
+    """Run a scenario and report Rect/Surface allocations and heap churn per frame"""
+    new_rects = 0
+    new_surfaces = 0
+    peak_bytes = 0
+    frames = 0
+    start = time.perf_counter()
+
+    # The game's own status prints are silenced while measuring
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        for _ in range(FRAMES_PER_SCENARIO):
+            step(player)
+            rect = player.rect
+            image = player.image
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+            player.update()
+
+            # Transient Python heap growth during this update
+            peak_bytes += tracemalloc.get_traced_memory()[1] - base
+            frames += 1
+
+            # A Rect or Surface object that did not exist before this frame is an allocation
+            if player.rect is not rect:
+                new_rects += 1
+            if player.image is not None and player.image is not image and id(player.image) not in known_images(player):
+                new_surfaces += 1
+        tracemalloc.stop()
+
+    elapsed = time.perf_counter() - start
+    print(f"{name:<14} {frames:6d} frames  "
+          f"rects/frame {new_rects / frames:6.3f}  "
+          f"surfaces/frame {new_surfaces / frames:6.3f}  "
+          f"heap bytes/frame {peak_bytes / frames:8.1f}  "
+          f"update {elapsed / frames * 1e6:7.2f} us")
+
+
+def known_images(player):
+    """Ids of the preloaded frames and the single fade copy made when a fade starts"""
+    images = player.idle_frames + player.run_frames + player.jump_frames + player.hurt_frames
+    ids = {id(image) for image in images}
+    fade_image = getattr(player, 'fade_image', None)
+    if fade_image is not None:
+        ids.add(id(fade_image))
+    return ids
+
+
+def run_step(player):
+    pass
+
+
+def jump_step(player):
+    if not player.is_jumping:
+        player.jump()
+
+
+def hurt_step(player):
+    if not player.is_hurt:
+        player.is_hurt = True
+        player.hurt_timer = 0
+
+
+def fade_step(player):
+    # Restart the fade whenever the previous one has finished
+    if player.image is None or not player.is_dead:
+        player.__init__()
+        player.is_dead = True
+        player.start_disintegration()
+
+
+def main():
+    print(f"Player.update allocations ({FRAMES_PER_SCENARIO} frames per scenario)")
+    measure('run', tomb_bound.Player(), run_step)
+    measure('jump', tomb_bound.Player(), jump_step)
+    measure('hurt', tomb_bound.Player(), hurt_step)
+    measure('disintegrate', tomb_bound.Player(), fade_step)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Render backend benchmark for Tomb Bound
+Times Game.draw on the standard scenes (menu, play, pause, game over) with the
+surface renderer and the texture renderer, and counts texture uploads per frame
+
+Run from anywhere: python benchmarks/render_backend_benchmark.py
+(SDL picks its software renderer under the dummy video driver; set
+SDL_RENDER_DRIVER=software to force it on a machine with a GPU)
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import statistics
+import sys
+import time
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import tomb_bound
+import render_backend
+from telemetry import telemetry
+
+FRAMES_PER_SCENE = 300
+SETTINGS_FILE = 'game_settings.json'
+
+
+def menu_scene(game):
+    game.menu_system.update([])
+
+
+def play_scene(game):
+    # Keep the player alive so every frame is a normal gameplay frame
+    game.player.health = game.player.max_health
+    if random.random() < 0.02:
+        game.player.jump()
+    game.update_game()
+
+
+def pause_scene(game):
+    game.update_pause_menu([])
+
+
+def game_over_scene(game):
+    game.update_game_over()
+
+
+def start_scene(game, name):
+    """Put a fresh game into the state a scene draws"""
+    if name == 'menu':
+        return
+    game.start_game('bench')
+    for _ in range(60):
+        play_scene(game)
+    if name == 'pause':
+        game.game_state = 'paused'
+        game.pause_menu_state = 'main'
+    elif name == 'game over':
+        # Run into traps until the last heart is gone
+        while not game.game_over:
+            trap = tomb_bound.Trap(game.speed)
+            trap.rect.center = game.player.rect.center
+            game.traps.add(trap)
+            game.all_sprites.add(trap)
+            game.player.is_hurt = False
+            game.update_game()
+        game.show_game_over = True
+
+
+SCENES = [
+    ('menu', menu_scene),
+    ('play', play_scene),
+    ('pause', pause_scene),
+    ('game over', game_over_scene)
+]
+
+
+def measure(backend, name, step):
+    """Draw one scene for FRAMES_PER_SCENE frames and report frame time percentiles"""
+    random.seed(1996)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = tomb_bound.Game()
+        start_scene(game, name)
+
+    times = []
+    telemetry.reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(FRAMES_PER_SCENE):
+            step(game)
+            start = time.perf_counter()
+            game.draw()
+            times.append(time.perf_counter() - start)
+            telemetry.end_frame()
+    game.parallax.stop()
+
+    times.sort()
+    print(f"{backend:<8} {name:<10} "
+          f"mean {statistics.mean(times) * 1000:6.2f} ms  "
+          f"p95 {times[int(len(times) * 0.95)] * 1000:6.2f} ms  "
+          f"uploads/frame {telemetry.per_frame('textures.uploaded'):6.2f}")
+
+
+def main():
+    # Playing to game over saves a high score; keep the real settings untouched
+    backup = SETTINGS_FILE + '.bench'
+    shutil.copy(SETTINGS_FILE, backup)
+    try:
+        print(f"Game.draw per frame ({FRAMES_PER_SCENE} frames per scene, "
+              f"{tomb_bound.SCREEN_WIDTH}x{tomb_bound.SCREEN_HEIGHT})")
+        for backend in render_backend.BACKENDS:
+            # Game objects pick up the module's renderer when they are created
+            tomb_bound.screen = render_backend.create_renderer(tomb_bound.window, backend)
+            if tomb_bound.screen.name != backend:
+                print(f"{backend:<8} not available")
+                continue
+            for name, step in SCENES:
+                measure(backend, name, step)
+    finally:
+        shutil.move(backup, SETTINGS_FILE)
+
+
+if __name__ == "__main__":
+    main()
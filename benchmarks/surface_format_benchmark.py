@@ -0,0 +1,130 @@
+"""
+Surface format benchmark for Tomb Bound
+Times blits onto the display of surfaces as they are created (loaded PNGs, text,
+plain and per-pixel alpha surfaces) against the same surfaces after display_format(),
+then plays the game under the format audit and counts blits that still convert
+
+Run from anywhere: python benchmarks/surface_format_benchmark.py
+(the dummy video driver always opens a 32-bit display; formats that already match
+it show no saving here, but do on 16- and 24-bit displays)
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import time
+
+# Run headless, silent and from the game directory so asset paths resolve
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('TOMB_BOUND_AUDIO', 'null')
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(GAME_DIR)
+sys.path.insert(0, GAME_DIR)
+
+import pygame
+import tomb_bound
+import render_backend
+import surface_format
+from surface_format import display_format, describe_format
+
+BLITS_PER_CASE = 2000
+AUDIT_FRAMES = 600
+SETTINGS_FILE = 'game_settings.json'
+
+
+def alpha_shape():
+    surface = pygame.Surface((tomb_bound.px(120), tomb_bound.px(120)), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (200, 160, 60, 180), surface.get_rect().center, tomb_bound.px(55))
+    return surface
+
+
+def plain_24_bit():
+    surface = pygame.Surface((tomb_bound.px(200), tomb_bound.px(120)), 0, 24)
+    surface.fill((90, 70, 50))
+    return surface
+
+
+def text(antialias):
+    font = pygame.font.Font(None, tomb_bound.px(48))
+    return font.render("EXPLORE THE ANCIENT DEPTHS", antialias, (210, 180, 140))
+
+
+CASES = [
+    ('trap PNG', lambda: pygame.image.load('traps/trap1.png')),
+    ('player sheet PNG', lambda: pygame.image.load('player/Run.png')),
+    ('text (antialiased)', lambda: text(True)),
+    ('text (aliased)', lambda: text(False)),
+    ('per-pixel alpha', alpha_shape),
+    ('24-bit plain', plain_24_bit)
+]
+
+
+def time_blits(target, source):
+    """Microseconds per blit of a surface onto the target"""
+    positions = [(random.randrange(0, target.get_width() - 100), random.randrange(0, target.get_height() - 100))
+                 for _ in range(BLITS_PER_CASE)]
+    start = time.perf_counter()
+    for position in positions:
+        target.blit(source, position)
+    return (time.perf_counter() - start) / BLITS_PER_CASE * 1_000_000
+
+
+def measure_case(name, create):
+    random.seed(1996)
+    raw = create()
+    converted = display_format(raw)
+    raw_time = time_blits(tomb_bound.window, raw)
+    converted_time = time_blits(tomb_bound.window, converted)
+    print(f"{name:<20} {describe_format(raw):<34} {raw_time:8.1f} us  "
+          f"{converted_time:8.1f} us  saved {raw_time - converted_time:7.1f} us "
+          f"({(1 - converted_time / raw_time) * 100:5.1f}%)")
+
+
+def audit_play():
+    """Play under the format audit and report blits whose source is not in a display format"""
+    audited = surface_format.FormatAudit(render_backend.SurfaceRenderer(tomb_bound.window))
+    tomb_bound.screen = audited
+    random.seed(1996)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = tomb_bound.Game()
+        for _ in range(60):
+            game.menu_system.update([])
+            game.draw()
+        game.start_game('bench')
+        for i in range(AUDIT_FRAMES):
+            if i % 50 == 0:
+                game.player.jump()
+            if not game.game_over:
+                game.update_game()
+            elif not game.show_game_over:
+                game.update_game_over()
+            game.draw()
+    game.parallax.stop()
+
+    mismatches = sum(audited.sightings.values())
+    print(f"\nFormat audit over the menu and {AUDIT_FRAMES} frames of play: "
+          f"{mismatches} converting blits ({mismatches / (AUDIT_FRAMES + 60):.2f}/frame)")
+    print(audited.report())
+
+
+def main():
+    # Playing can save a high score; keep the real settings untouched
+    backup = SETTINGS_FILE + '.bench'
+    shutil.copy(SETTINGS_FILE, backup)
+    try:
+        display = tomb_bound.window
+        print(f"Blit onto the {display.get_width()}x{display.get_height()} display "
+              f"({describe_format(display)}), {BLITS_PER_CASE} blits per case")
+        print(f"{'source':<20} {'format as created':<34} {'as created':>11}  {'converted':>11}")
+        for name, create in CASES:
+            measure_case(name, create)
+        audit_play()
+    finally:
+        shutil.move(backup, SETTINGS_FILE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Frame Capture for Tomb Bound
+Records the presented frames for support tickets and highlight reels. Each frame is
+read through a buffer view of the screen's 32-bit pixels (no intermediate surface) and
+copied row by row into one slot of a ring preallocated at start; a writer thread
+unpacks the pixels and drains the ring to disk. When the writer falls behind and the
+ring is full, the frame is dropped and counted instead of holding up the game loop
+
+Frames are written as one raw RGB stream or as a numbered PNG sequence, with a
+capture.json describing them (the game keeps its full frame rate while recording, so
+the fps given there is the rate the frames were presented at). A raw stream converts with
+ffmpeg -f rawvideo -pixel_format rgb24 -video_size WxH -framerate FPS -i frames.rgb out.mp4
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+import pygame
+from telemetry import telemetry
+from options import resolve_option
+
+# NumPy is optional; pygame's buffer views (surfarray) need it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Set TOMB_BOUND_CAPTURE to a directory to record from startup (works headless with the
+# dummy video driver), and TOMB_BOUND_CAPTURE_FORMAT to 'raw' or 'png'
+CAPTURE_ENV_VAR = 'TOMB_BOUND_CAPTURE'
+CAPTURE_FORMAT_ENV_VAR = 'TOMB_BOUND_CAPTURE_FORMAT'
+CAPTURE_FORMATS = ['raw', 'png']
+DEFAULT_FORMAT = 'raw'
+CAPTURE_DIR = 'recordings'  # Recordings started in game (F9) go into a folder per recording here
+
+RING_FRAMES = 32  # Frames the writer may fall behind by before frames are dropped
+
+
+def capture_format(setting=None):
+    """Frame format for recordings: 'raw' or 'png'"""
+    return resolve_option(CAPTURE_FORMAT_ENV_VAR, setting, CAPTURE_FORMATS, DEFAULT_FORMAT, 'capture format')
+
+
+def capture_directory():
+    """Directory to record into from startup, or None"""
+    return os.environ.get(CAPTURE_ENV_VAR) or None
+
+
+class FrameRecorder:
+    def __init__(self, renderer, size, fmt=DEFAULT_FORMAT, ring_frames=RING_FRAMES):
+        """Record frames presented by a renderer; nothing is allocated until start()"""
+        self.renderer = renderer
+        self.size = size
+        self.fps = None
+        self.format = fmt
+        self.ring_frames = ring_frames
+        self.ring = None
+        self.staging = None  # 32-bit readback surface for frames not already in one
+        self.thread = None
+        self.directory = None
+
+    @property
+    def recording(self):
+        return self.thread is not None
+
+    def start(self, fps, directory=None):
+        """Start recording frames presented at fps into a directory (a new one under CAPTURE_DIR by default)"""
+        if self.recording:
+            return
+        if numpy is None:
+            print("Frame capture needs NumPy")
+            return
+
+        self.fps = fps
+        self.directory = directory or os.path.join(CAPTURE_DIR, time.strftime('%Y%m%d-%H%M%S'))
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Slots hold whole 32-bit pixels in rows, the same layout as the surface memory,
+        # so filling one is a plain copy; the writer unpacks them with the source's shifts
+        width, height = self.size
+        if self.ring is None or len(self.ring) != self.ring_frames:
+            self.ring = numpy.empty((self.ring_frames, height, width), numpy.uint32)
+        self.shifts = self.source().get_shifts()[:3]
+        self.free = queue.Queue()    # Ring slots the main thread may fill
+        self.filled = queue.Queue()  # (slot, frame number) waiting for the writer, None to stop
+        for slot in range(self.ring_frames):
+            self.free.put(slot)
+        self.frames = 0
+        self.written = 0
+        self.dropped = 0
+
+        self.output = None
+        if self.format == 'raw':
+            self.output = open(os.path.join(self.directory, 'frames.rgb'), 'wb')
+        self.thread = threading.Thread(target=self.work, name='capture', daemon=True)
+        self.thread.start()
+        print(f"Recording {self.format} frames to {self.directory}")
+
+    def source(self):
+        """32-bit surface holding the frame that was just presented"""
+        surface = getattr(self.renderer, 'surface', None)
+        if isinstance(surface, pygame.Surface) and surface.get_bytesize() == 4:
+            return surface
+        # Texture renderers draw on the GPU side, and 16- or 24-bit displays have no
+        # 32-bit view; read the frame back into a reused surface
+        if self.staging is None:
+            self.staging = pygame.Surface(self.size, 0, 32)
+        self.renderer.capture(self.staging)
+        return self.staging
+
+    def capture(self):
+        """Copy the presented frame into the ring; call right after presenting"""
+        if not self.recording:
+            return
+        self.frames += 1
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            # The writer is behind; skip this frame rather than wait for it
+            self.dropped += 1
+            telemetry.count('capture.dropped')
+            return
+
+        view = pygame.surfarray.pixels2d(self.source())
+        self.ring[slot] = view.T  # (x, y) view of rows in memory, copied as rows
+        del view  # Unlock the surface
+        self.filled.put((slot, self.frames - 1))
+        telemetry.count('capture.frames')
+
+    def work(self):
+        """Writer loop: write each filled slot to disk and hand it back, until None arrives"""
+        while True:
+            job = self.filled.get()
+            if job is None:
+                return
+            slot, number = job
+            rgb = self.unpack(self.ring[slot])
+            self.free.put(slot)
+            if self.format == 'raw':
+                # Row-major RGB, as video tools expect
+                self.output.write(rgb.tobytes())
+            else:
+                pygame.image.save(pygame.surfarray.make_surface(rgb.transpose(1, 0, 2)),
+                                  os.path.join(self.directory, f'frame_{number:06d}.png'))
+            self.written += 1
+
+    def unpack(self, frame):
+        """Split a slot's 32-bit pixels into an (y, x, rgb) array"""
+        rgb = numpy.empty(frame.shape + (3,), numpy.uint8)
+        for channel, shift in enumerate(self.shifts):
+            rgb[..., channel] = frame >> shift
+        return rgb
+
+    def stop(self):
+        """Finish writing the queued frames and describe the recording in capture.json"""
+        if not self.recording:
+            return
+        self.filled.put(None)
+        self.thread.join()
+        self.thread = None
+        if self.output is not None:
+            self.output.close()
+
+        width, height = self.size
+        info = {
+            'format': self.format,
+            'pixel_format': 'rgb24',
+            'width': width,
+            'height': height,
+            'fps': self.fps,
+            'frames': self.frames,
+            'written': self.written,
+            'dropped': self.dropped
+        }
+        with open(os.path.join(self.directory, 'capture.json'), 'w') as f:
+            json.dump(info, f, indent=4)
+        print(f"Recorded {self.written} of {self.frames} frames to {self.directory} ({self.dropped} dropped)")
+
+    def toggle(self, fps):
+        if self.recording:
+            self.stop()
+        else:
+            self.start(fps)
@@ -0,0 +1,175 @@
+"""
+Crack Patterns for Tomb Bound
+Seeded crack variants generated once at load time. Each variant is kept as a
+normalized segment list and rendered to ready-to-blit surfaces per size
+"""
+
+import pygame
+import random
+import math
+from surface_format import display_format
+
+# Seed and number of variants per crack kind
+CRACK_SEED = 1996
+CRACK_VARIANTS = 6
+
+# Sizes the patterns are generated at; segments are stored relative to these
+PLAYER_REFERENCE_SIZE = (180, 180)
+SCREEN_REFERENCE_SIZE = (1024, 600)
+
+# Line color per crack kind (segments carry their own alpha)
+CRACK_COLORS = {
+    'player': (0, 0, 0),        # Dark cracks across the stone statue
+    'screen': (255, 255, 255)   # Light cracks across the game over screen
+}
+
+
+class CrackPattern:
+    def __init__(self, segments, reference_size):
+        """Crack segments as (x1, y1, x2, y2, thickness, alpha, depth), with points in 0..1
+        of the reference size; depth is 0 for the main cracks and grows with each branch"""
+        self.segments = segments
+        self.reference_size = reference_size
+
+    def render(self, size, color, max_depth=None):
+        """Draw the pattern at a size, without branches deeper than max_depth;
+        returns the image cropped to the cracks and its offset"""
+        width, height = size
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+
+        # Line thickness follows the width relative to the reference size
+        thickness_scale = width / self.reference_size[0]
+
+        for x1, y1, x2, y2, thickness, alpha, depth in self.segments:
+            if max_depth is not None and depth > max_depth:
+                continue
+            pygame.draw.line(surface, color + (alpha,),
+                             (x1 * width, y1 * height), (x2 * width, y2 * height),
+                             max(1, round(thickness * thickness_scale)))
+
+        # Keep only the area the cracks cover so blits stay small
+        bounds = surface.get_bounding_rect()
+        return display_format(surface.subsurface(bounds)), bounds.topleft
+
+
+def generate_player_pattern(rng, size=PLAYER_REFERENCE_SIZE):
+    """Cracks branching out from the center of the player sprite"""
+    width, height = size
+    segments = []
+
+    def branch(x, y, angle, length, thickness, depth=0):
+        if depth > 3 or length < 5:  # Limit recursion depth and minimum length
+            return
+
+        # Calculate end point, kept within the sprite
+        end_x = max(0, min(width - 1, x + math.cos(angle) * length))
+        end_y = max(0, min(height - 1, y + math.sin(angle) * length))
+        segments.append((x / width, y / height, end_x / width, end_y / height, thickness, 200, depth))
+
+        # Create branches with some probability
+        if rng.random() < 0.7:
+            branch_angle1 = angle + rng.uniform(-0.5, 0.5)
+            branch_angle2 = angle + rng.uniform(-0.5, 0.5)
+            branch_length = length * rng.uniform(0.4, 0.7)
+
+            branch(end_x, end_y, branch_angle1, branch_length, max(1, thickness - 1), depth + 1)
+            branch(end_x, end_y, branch_angle2, branch_length, max(1, thickness - 1), depth + 1)
+
+    # Create main cracks from center
+    for _ in range(rng.randint(4, 7)):
+        branch(width // 2, height // 2, rng.uniform(0, 2 * math.pi), rng.uniform(0.5, 1.0) * width, 2)
+
+    return CrackPattern(segments, size)
+
+
+def generate_screen_pattern(rng, size=SCREEN_REFERENCE_SIZE):
+    """Cracks spreading from the center of the screen"""
+    width, height = size
+    segments = []
+
+    def branch(x, y, angle, length, thickness, depth=0):
+        # Calculate end point
+        end_x = x + math.cos(angle) * length
+        end_y = y + math.sin(angle) * length
+        segments.append((x / width, y / height, end_x / width, end_y / height,
+                         thickness, rng.randint(100, 200), depth))
+
+        # Create branches with some probability
+        if rng.random() < 0.7 and depth < 2:
+            branch_angle1 = angle + rng.uniform(-0.5, 0.5)
+            branch_angle2 = angle + rng.uniform(-0.5, 0.5)
+            branch_length = length * rng.uniform(0.5, 0.8)
+
+            branch(end_x, end_y, branch_angle1, branch_length, max(1, thickness - 1), depth + 1)
+            branch(end_x, end_y, branch_angle2, branch_length, max(1, thickness - 1), depth + 1)
+
+    for _ in range(8):
+        branch(width // 2, height // 2, rng.uniform(0, 2 * math.pi),
+               rng.randint(50, 200), rng.randint(1, 3))
+
+    return CrackPattern(segments, size)
+
+
+PATTERN_GENERATORS = {
+    'player': generate_player_pattern,
+    'screen': generate_screen_pattern
+}
+
+
+class CrackLibrary:
+    def __init__(self, seed=CRACK_SEED, variants=CRACK_VARIANTS):
+        """Generate every crack variant up front from a fixed seed"""
+        rng = random.Random(seed)
+        self.patterns = {
+            kind: [generate(rng) for _ in range(variants)]
+            for kind, generate in PATTERN_GENERATORS.items()
+        }
+
+        # Deepest branch of each kind; a max depth at or past it draws the whole pattern
+        self.max_depths = {
+            kind: max(segment[6] for pattern in patterns for segment in pattern.segments)
+            for kind, patterns in self.patterns.items()
+        }
+
+        # Rendered variants: (kind, size, max depth) -> [(image, offset), ...],
+        # and the sizes prepared per kind (new depths are rendered for them too)
+        self.rendered = {}
+        self.sizes = {kind: set() for kind in self.patterns}
+
+    def depth_limit(self, kind, max_depth):
+        """The max depth that renders differently for a kind (None for the whole pattern)"""
+        if max_depth is None or max_depth >= self.max_depths[kind]:
+            return None
+        return max_depth
+
+    def prepare(self, kind, sizes, depths=(None,)):
+        """Render every variant of a kind at each size and depth ahead of time"""
+        for size in sizes:
+            self.sizes[kind].add(tuple(size))
+            for max_depth in depths:
+                self.get_variants(kind, size, max_depth)
+
+    def prepare_depth(self, max_depth):
+        """Render a depth for every size prepared so far (e.g. after the quality changed)"""
+        for kind, sizes in self.sizes.items():
+            for size in sizes:
+                self.get_variants(kind, size, max_depth)
+
+    def get_variants(self, kind, size, max_depth=None):
+        """Get the rendered variants of a kind at a size, rendering them the first time"""
+        max_depth = self.depth_limit(kind, max_depth)
+        key = (kind, tuple(size), max_depth)
+        variants = self.rendered.get(key)
+        if variants is None:
+            color = CRACK_COLORS[kind]
+            variants = [pattern.render(key[1], color, max_depth) for pattern in self.patterns[kind]]
+            self.rendered[key] = variants
+        return variants
+
+    def pick(self, kind, size, max_depth=None):
+        """Pick a random rendered variant: (image, offset from the top-left of the area)"""
+        return random.choice(self.get_variants(kind, size, max_depth))
+
+
+# Global crack library
+crack_library = CrackLibrary()
@@ -1,89 +1,143 @@
 import pygame
 import random
 import math
+import weakref
+from fragments import FragmentPool, rotations
+from crack_library import crack_library
+from display_config import ui_scale
+from viewport import Viewport
+from quality import quality
 
-class Fragment:
-    def __init__(self, x, y, size, color, velocity_x=0, velocity_y=0):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.original_size = size
-        self.color = color
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-5, 5)
-        self.gravity = random.uniform(0.2, 0.4)
-        self.fade_speed = random.uniform(2, 5)
-        self.alpha = 255
-        self.shape = random.choice(['rect', 'poly'])
-        
-        # For polygon fragments
-        if self.shape == 'poly':
-            self.points = []
-            point_count = random.randint(3, 6)
-            for i in range(point_count):
-                angle = 2 * math.pi * i / point_count
-                dist = size * random.uniform(0.5, 1.0)
-                self.points.append((
-                    math.cos(angle) * dist,
-                    math.sin(angle) * dist
+# NumPy is optional; without it the stone tint and piece split use slower pygame paths
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The statue breaks into square cells of this size
+PIECE_SIZE = 12
+# Cells with fewer opaque pixels than this are dropped
+MIN_PIECE_MASS = 12
+
+# Small loose chips thrown off alongside the statue pieces:
+# (count, min size, max size, max horizontal speed, max upward speed, palette)
+# Colors come from a small fixed palette so chips share pre-rotated stamps
+DEBRIS_CHIPS = (20, 1, 4, 1, 4, [(90, 70, 50), (110, 90, 70), (130, 110, 90)])
+
+def create_stone_image(image):
+    """Grayscale copy of an image with a brownish stone tint; alpha is kept"""
+    stone_image = image.copy()
+    
+    if numpy is not None:
+        # Tint every pixel at once on the surface's own pixel array
+        rgb = pygame.surfarray.pixels3d(stone_image)
+        gray = rgb.sum(axis=2, dtype=numpy.uint16) // 3
+        rgb[..., 0] = numpy.minimum(255, gray + 20)  # More red for brown tint
+        rgb[..., 1] = numpy.minimum(255, gray + 10)  # Less green
+        rgb[..., 2] = gray                           # Even less blue
+        del rgb  # Unlock the surface
+        return stone_image
+    
+    # Convert to grayscale with a stone-like tint
+    for x in range(stone_image.get_width()):
+        for y in range(stone_image.get_height()):
+            color = stone_image.get_at((x, y))
+            if color.a > 0:  # Only process non-transparent pixels
+                # Convert to grayscale
+                gray = (color.r + color.g + color.b) // 3
+                # Add stone tint (slightly brownish gray)
+                stone_image.set_at((x, y), (
+                    min(255, gray + 20),  # More red for brown tint
+                    min(255, gray + 10),  # Less green
+                    min(255, gray),       # Even less blue
+                    color.a
                 ))
     
-    def update(self):
-        # Apply gravity
-        self.velocity_y += self.gravity
-        
-        # Update position
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        
-        # Update rotation
-        self.rotation += self.rotation_speed
-        
-        # Fade out
-        self.alpha -= self.fade_speed
-        
-        # Return True if fragment is still visible
-        return self.alpha > 0
+    return stone_image
+
+def measure_cells(image, cell_size):
+    """Opaque pixel count and centroid of every grid cell: [(column, row, mass, cx, cy)]"""
+    width, height = image.get_size()
+    columns = -(-width // cell_size)
+    rows = -(-height // cell_size)
     
-    def draw(self, surface):
-        # Create a surface for the fragment
-        fragment_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        # Draw the fragment shape
-        if self.shape == 'rect':
-            # Draw a rectangle with rotation
-            rect = pygame.Rect(0, 0, self.size, self.size)
-            rect.center = (self.size, self.size)
-            
-            # Create a temporary surface for rotation
-            temp_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.rect(temp_surf, self.color + (self.alpha,), rect)
-            
-            # Rotate the surface
-            rotated_surf = pygame.transform.rotate(temp_surf, self.rotation)
-            
-            # Blit to fragment surface
-            fragment_surf.blit(rotated_surf, 
-                             (self.size - rotated_surf.get_width() // 2,
-                              self.size - rotated_surf.get_height() // 2))
-            
-        else:  # 'poly'
-            # Draw a polygon with rotation
-            rotated_points = []
-            for x, y in self.points:
-                # Rotate point
-                angle = math.radians(self.rotation)
-                rx = x * math.cos(angle) - y * math.sin(angle)
-                ry = x * math.sin(angle) + y * math.cos(angle)
-                # Translate to center
-                rotated_points.append((rx + self.size, ry + self.size))
+    if numpy is not None:
+        # Pad the opacity mask to whole cells and reduce each cell in one pass
+        opaque = numpy.zeros((columns * cell_size, rows * cell_size), dtype=numpy.float32)
+        opaque[:width, :height] = pygame.surfarray.array_alpha(image) > 0
+        cells = opaque.reshape(columns, cell_size, rows, cell_size)
+        
+        offsets = numpy.arange(cell_size, dtype=numpy.float32)
+        mass = cells.sum(axis=(1, 3))
+        sum_x = numpy.einsum('aibj,i->ab', cells, offsets)
+        sum_y = numpy.einsum('aibj,j->ab', cells, offsets)
+        
+        measured = []
+        for column, row in zip(*numpy.nonzero(mass)):
+            cell_mass = mass[column, row]
+            measured.append((int(column), int(row), int(cell_mass),
+                             float(sum_x[column, row] / cell_mass), float(sum_y[column, row] / cell_mass)))
+        return measured
+    
+    # Without NumPy, let pygame.mask count and average each cell
+    mask = pygame.mask.from_surface(image, 1)
+    measured = []
+    for column in range(columns):
+        for row in range(rows):
+            cell = pygame.Rect(column * cell_size, row * cell_size, cell_size, cell_size).clip(image.get_rect())
+            cell_mask = pygame.Mask(cell.size)
+            cell_mask.draw(mask, (-cell.x, -cell.y))
+            cell_mass = cell_mask.count()
+            if cell_mass:
+                cx, cy = cell_mask.centroid()
+                measured.append((column, row, cell_mass, cx, cy))
+    return measured
+
+class StonePiece:
+    """One cell of a stone statue: its pre-rotated stamps and where its mass sits"""
+    __slots__ = ('stamps', 'x', 'y', 'centroid_x', 'centroid_y', 'mass')
+    
+    def __init__(self, stamps, x, y, centroid_x, centroid_y, mass):
+        self.stamps = stamps
+        self.x = x                     # Cell center, relative to the sprite
+        self.y = y
+        self.centroid_x = centroid_x   # Center of the opaque pixels, relative to the sprite
+        self.centroid_y = centroid_y
+        self.mass = mass               # Opaque pixel count
+
+class StoneStatue:
+    def __init__(self, image, piece_size=PIECE_SIZE):
+        """Stone-tinted copy of a player frame, split into fragment pieces"""
+        self.image = create_stone_image(image)
+        self.pieces = []
+        
+        bounds = self.image.get_rect()
+        for column, row, mass, cx, cy in measure_cells(self.image, piece_size):
+            if mass < MIN_PIECE_MASS:
+                continue
             
-            pygame.draw.polygon(fragment_surf, self.color + (self.alpha,), rotated_points)
-        
-        # Draw the fragment on the main surface
-        surface.blit(fragment_surf, (self.x - self.size, self.y - self.size))
+            # Each piece is drawn from a subsurface of the statue, rotated once per angle step
+            cell = pygame.Rect(column * piece_size, row * piece_size, piece_size, piece_size).clip(bounds)
+            self.pieces.append(StonePiece(
+                rotations(self.image.subsurface(cell)),
+                cell.centerx, cell.centery,
+                cell.x + cx, cell.y + cy, mass
+            ))
+
+# Statues by the frame image they were made from; entries go away with their frame
+stone_statues = weakref.WeakKeyDictionary()
+
+def get_statue(image):
+    """Get the stone statue for a frame image, building it the first time"""
+    statue = stone_statues.get(image)
+    if statue is None:
+        statue = stone_statues[image] = StoneStatue(image)
+    return statue
+
+def prepare_statues(images):
+    """Build statues for frames ahead of time so dying does not have to"""
+    for image in images:
+        get_statue(image)
 
 class DustParticle:
     def __init__(self, x, y):
@@ -116,10 +170,16 @@ class DustParticle:
         # Return True if particle is still visible
         return self.alpha > 0
     
+    def motion(self):
+        return self.x, self.y, self.velocity_x, self.velocity_y, self.size
+    
+    def position(self):
+        return self.x, self.y, self.size
+    
     def draw(self, surface):
         # Draw the dust particle
-        pygame.draw.circle(
-            surface, 
+        surface.draw_shape(
+            pygame.draw.circle,
             self.color + (int(self.alpha),), 
             (int(self.x), int(self.y)), 
             self.size
@@ -130,10 +190,15 @@ class CrumblingDeath:
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
+        self.viewport = Viewport(self.screen_width, self.screen_height)
+        self.quality = quality.settings  # Debris, dust and crack detail
+        
+        # Speeds and distances below are for a 600 pixel high screen
+        self.scale = ui_scale(self.screen_height)
         
         # Store player information
         self.player_rect = player_rect.copy()
-        self.player_image = player_image.copy() if player_image else None
+        self.player_image = player_image
         
         # Animation state
         self.state = 'freeze'  # 'freeze', 'stone', 'crack', 'crumble', 'dust', 'done'
@@ -144,8 +209,18 @@ class CrumblingDeath:
         self.crumble_duration = 60 # 1 second
         self.dust_duration = 120   # 2 seconds
         
+        # Stone version of the player, split into pieces (cached per frame image)
+        if not self.player_image:
+            # Use a plain stone block if player image is not available
+            block = pygame.Surface((self.player_rect.width, self.player_rect.height), pygame.SRCALPHA)
+            block.fill((150, 150, 150, 255))
+            self.statue = StoneStatue(block)
+        else:
+            self.statue = get_statue(self.player_image)
+        self.stone_image = self.statue.image
+        
         # Fragments and particles
-        self.fragments = []
+        self.fragments = FragmentPool(len(self.statue.pieces) + DEBRIS_CHIPS[0], gravity_scale=self.scale)
         self.dust_particles = []
         
         # Screen shake
@@ -154,200 +229,48 @@ class CrumblingDeath:
         self.shake_offset_x = 0
         self.shake_offset_y = 0
         
-        # Create stone version of player
-        self.stone_image = self.create_stone_image()
-        
-        # Create crack overlay
-        self.crack_image = self.create_crack_image()
+        # Pick a pre-rendered crack overlay sized for the player
+        self.crack_image, self.crack_offset = crack_library.pick('player', self.player_rect.size,
+                                                                 self.quality.crack_depth)
         self.crack_alpha = 0
         
         # Generate fragments
         self.generate_fragments()
     
-    def create_stone_image(self):
-        if not self.player_image:
-            # Create a default stone image if player image is not available
-            stone_image = pygame.Surface((self.player_rect.width, self.player_rect.height), pygame.SRCALPHA)
-            stone_image.fill((150, 150, 150, 255))
-            return stone_image
-        
-        # Create a copy of the player image
-        stone_image = self.player_image.copy()
-        
-        # Convert to grayscale with a stone-like tint
-        for x in range(stone_image.get_width()):
-            for y in range(stone_image.get_height()):
-                color = stone_image.get_at((x, y))
-                if color.a > 0:  # Only process non-transparent pixels
-                    # Convert to grayscale
-                    gray = (color.r + color.g + color.b) // 3
-                    # Add stone tint (slightly brownish gray)
-                    stone_image.set_at((x, y), (
-                        min(255, gray + 20),  # More red for brown tint
-                        min(255, gray + 10),  # Less green
-                        min(255, gray),       # Even less blue
-                        color.a
-                    ))
-        
-        return stone_image
-    
-    def create_crack_image(self):
-        # Create a transparent surface for cracks
-        crack_image = pygame.Surface((self.player_rect.width, self.player_rect.height), pygame.SRCALPHA)
-        
-        # Generate random crack patterns
-        center_x = self.player_rect.width // 2
-        center_y = self.player_rect.height // 2
-        
-        # Create main cracks from center
-        for _ in range(random.randint(4, 7)):
-            start_x = center_x
-            start_y = center_y
-            angle = random.uniform(0, 2 * math.pi)
-            length = random.uniform(0.5, 1.0) * self.player_rect.width
-            
-            # Draw branching cracks
-            self.draw_crack(crack_image, start_x, start_y, angle, length, 2)
-        
-        return crack_image
-    
-    def draw_crack(self, surface, x, y, angle, length, thickness, depth=0):
-        if depth > 3 or length < 5:  # Limit recursion depth and minimum length
-            return
-            
-        # Calculate end point
-        end_x = x + math.cos(angle) * length
-        end_y = y + math.sin(angle) * length
-        
-        # Ensure end point is within bounds
-        end_x = max(0, min(surface.get_width() - 1, end_x))
-        end_y = max(0, min(surface.get_height() - 1, end_y))
-        
-        # Draw the crack line
-        pygame.draw.line(surface, (0, 0, 0, 200), (x, y), (end_x, end_y), thickness)
-        
-        # Create branches with some probability
-        if random.random() < 0.7:
-            branch_angle1 = angle + random.uniform(-0.5, 0.5)
-            branch_angle2 = angle + random.uniform(-0.5, 0.5)
-            branch_length = length * random.uniform(0.4, 0.7)
-            
-            self.draw_crack(surface, end_x, end_y, branch_angle1, branch_length, 
-                          max(1, thickness-1), depth+1)
-            self.draw_crack(surface, end_x, end_y, branch_angle2, branch_length, 
-                          max(1, thickness-1), depth+1)
-    
     def generate_fragments(self):
-        if not self.player_image:
-            # Generate default fragments if player image is not available
-            player_width = self.player_rect.width
-            player_height = self.player_rect.height
-            
-            # Generate large chunks
-            for _ in range(10):
-                size = random.randint(5, 15)
-                x = self.player_rect.x + random.randint(0, player_width)
-                y = self.player_rect.y + random.randint(0, player_height)
-                color = (
-                    random.randint(120, 180),
-                    random.randint(100, 160),
-                    random.randint(80, 140)
-                )
-                velocity_x = random.uniform(-3, 3)
-                velocity_y = random.uniform(-8, 0)
-                
-                self.fragments.append(Fragment(x, y, size, color, velocity_x, velocity_y))
+        # Break the statue apart: pieces fly away from the sprite's center,
+        # lighter pieces faster than heavy ones
+        half_width = self.player_rect.width / 2
+        full_mass = PIECE_SIZE * PIECE_SIZE
+        
+        for piece in self.statue.pieces:
+            lightness = min(1.5, math.sqrt(full_mass / piece.mass))
+            direction = (piece.centroid_x - half_width) / half_width
+            velocity_x = (direction * 3 + random.uniform(-0.5, 0.5)) * lightness * self.scale
+            velocity_y = -random.uniform(2, 8) * lightness * self.scale
             
-            # Generate medium chunks
-            for _ in range(20):
-                size = random.randint(3, 8)
-                x = self.player_rect.x + random.randint(0, player_width)
-                y = self.player_rect.y + random.randint(0, player_height)
-                color = (
-                    random.randint(100, 160),
-                    random.randint(80, 140),
-                    random.randint(60, 120)
-                )
-                velocity_x = random.uniform(-2, 2)
-                velocity_y = random.uniform(-6, 0)
-                
-                self.fragments.append(Fragment(x, y, size, color, velocity_x, velocity_y))
+            self.fragments.spawn(self.player_rect.x + piece.x, self.player_rect.y + piece.y,
+                                 piece.stamps, velocity_x, velocity_y)
+        
+        # Scatter small loose chips over the player's area (fewer at lower quality)
+        count, min_size, max_size, speed_x, speed_y, palette = DEBRIS_CHIPS
+        for _ in range(min(count, self.quality.debris_chips)):
+            size = random.randint(min_size, max_size)
+            x = self.player_rect.x + random.randint(0, self.player_rect.width)
+            y = self.player_rect.y + random.randint(0, self.player_rect.height)
+            velocity_x = random.uniform(-speed_x, speed_x) * self.scale
+            velocity_y = random.uniform(-speed_y, 0) * self.scale
             
-            # Generate small chunks
-            for _ in range(30):
-                size = random.randint(1, 4)
-                x = self.player_rect.x + random.randint(0, player_width)
-                y = self.player_rect.y + random.randint(0, player_height)
-                color = (
-                    random.randint(80, 140),
-                    random.randint(60, 120),
-                    random.randint(40, 100)
-                )
-                velocity_x = random.uniform(-1, 1)
-                velocity_y = random.uniform(-4, 0)
-                
-                self.fragments.append(Fragment(x, y, size, color, velocity_x, velocity_y))
-            
-            return
-        
-        # If we have a player image, generate fragments based on it
-        # This is more complex and would analyze the player image to create
-        # fragments that match the player's appearance
-        # For simplicity, we'll use the default approach for now
-        player_width = self.player_rect.width
-        player_height = self.player_rect.height
-        
-        # Generate large chunks
-        for _ in range(10):
-            size = random.randint(5, 15)
-            x = self.player_rect.x + random.randint(0, player_width)
-            y = self.player_rect.y + random.randint(0, player_height)
-            color = (
-                random.randint(120, 180),
-                random.randint(100, 160),
-                random.randint(80, 140)
-            )
-            velocity_x = random.uniform(-3, 3)
-            velocity_y = random.uniform(-8, 0)
-            
-            self.fragments.append(Fragment(x, y, size, color, velocity_x, velocity_y))
-        
-        # Generate medium chunks
-        for _ in range(20):
-            size = random.randint(3, 8)
-            x = self.player_rect.x + random.randint(0, player_width)
-            y = self.player_rect.y + random.randint(0, player_height)
-            color = (
-                random.randint(100, 160),
-                random.randint(80, 140),
-                random.randint(60, 120)
-            )
-            velocity_x = random.uniform(-2, 2)
-            velocity_y = random.uniform(-6, 0)
-            
-            self.fragments.append(Fragment(x, y, size, color, velocity_x, velocity_y))
-        
-        # Generate small chunks
-        for _ in range(30):
-            size = random.randint(1, 4)
-            x = self.player_rect.x + random.randint(0, player_width)
-            y = self.player_rect.y + random.randint(0, player_height)
-            color = (
-                random.randint(80, 140),
-                random.randint(60, 120),
-                random.randint(40, 100)
-            )
-            velocity_x = random.uniform(-1, 1)
-            velocity_y = random.uniform(-4, 0)
-            
-            self.fragments.append(Fragment(x, y, size, color, velocity_x, velocity_y))
+            self.fragments.spawn_shape(x, y, size, random.choice(palette), velocity_x, velocity_y)
     
     def add_dust_particles(self, count, x, y):
+        # The quality level caps how many dust particles are alive at once
+        count = min(count, self.quality.dust_cap - len(self.dust_particles))
         for _ in range(count):
             self.dust_particles.append(DustParticle(x, y))
     
     def trigger_screen_shake(self, amount=10):
-        self.shake_amount = amount
+        self.shake_amount = amount * self.scale
     
     def update_screen_shake(self):
         if self.shake_amount > 0:
@@ -389,58 +312,53 @@ class CrumblingDeath:
         
         # Update fragments
         if self.state in ['crumble', 'dust']:
-            # Update existing fragments
-            for fragment in self.fragments[:]:
-                if not fragment.update():
-                    self.fragments.remove(fragment)
+            # Update existing fragments (faded ones, and ones that fell off screen, return to the pool)
+            self.fragments.update(self.viewport)
             
             # Add dust particles where fragments hit the ground
             for fragment in self.fragments:
-                if fragment.y > self.screen_height - 50 and random.random() < 0.05:
+                if fragment.y > self.screen_height - 50 * self.scale and random.random() < 0.05:
                     self.add_dust_particles(random.randint(1, 3), fragment.x, fragment.y)
         
-        # Update dust particles
-        for particle in self.dust_particles[:]:
-            if not particle.update():
-                self.dust_particles.remove(particle)
+        # Update dust particles, dropping faded ones and ones that left the screen
+        live = [particle for particle in self.dust_particles if particle.update()]
+        self.dust_particles = self.viewport.drop_escaped('dust', live, DustParticle.motion)
     
-    def draw(self):
-        # Apply screen shake offset
-        original_rect = self.screen.get_rect()
-        shake_rect = original_rect.copy()
-        shake_rect.x += self.shake_offset_x
-        shake_rect.y += self.shake_offset_y
+    def draw(self, surface=None):
+        # Draw onto the given surface (e.g. the game's world buffer), or the screen;
+        # the shake offset is applied by whoever presents that surface
+        if surface is None:
+            surface = self.screen
         
         # Draw based on current state
         if self.state == 'freeze':
             # Draw original player image
             if self.player_image:
-                self.screen.blit(self.player_image, self.player_rect)
+                surface.blit(self.player_image, self.player_rect)
         
         elif self.state == 'stone':
             # Draw stone version of player
             if self.stone_image:
-                self.screen.blit(self.stone_image, self.player_rect)
+                surface.blit(self.stone_image, self.player_rect)
         
         elif self.state == 'crack':
             # Draw stone with cracks
             if self.stone_image:
-                self.screen.blit(self.stone_image, self.player_rect)
+                surface.blit(self.stone_image, self.player_rect)
             
             # Draw cracks with increasing opacity
             if self.crack_image:
-                crack_with_alpha = self.crack_image.copy()
-                crack_with_alpha.set_alpha(self.crack_alpha)
-                self.screen.blit(crack_with_alpha, self.player_rect)
+                self.crack_image.set_alpha(self.crack_alpha)
+                surface.blit(self.crack_image, (self.player_rect.x + self.crack_offset[0],
+                                                self.player_rect.y + self.crack_offset[1]))
         
         elif self.state in ['crumble', 'dust', 'done']:
-            # Draw all fragments
-            for fragment in self.fragments:
-                fragment.draw(self.screen)
+            # Draw the fragments on screen from their pre-rotated stamps
+            self.fragments.draw(surface, self.viewport)
             
-            # Draw all dust particles
-            for particle in self.dust_particles:
-                particle.draw(self.screen)
+            # Draw the dust particles on screen
+            for particle in self.viewport.visible_items('dust', self.dust_particles, DustParticle.position):
+                particle.draw(surface)
     
     def is_finished(self):
         return self.state == 'done'
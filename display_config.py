@@ -0,0 +1,111 @@
+"""
+Display Configuration for Tomb Bound
+Picks the internal render resolution and opens the window that presents it.
+Layout values are designed for a 1024x600 screen and scaled by height
+"""
+
+import pygame
+import os
+import json
+
+# Reference resolution every layout value in the game was designed for
+BASE_WIDTH = 1024
+BASE_HEIGHT = 600
+
+# Environment variable overriding the render resolution ('512x300', 'low', 'native', ...)
+RESOLUTION_ENV_VAR = 'TOMB_BOUND_RESOLUTION'
+SETTINGS_FILE = 'game_settings.json'
+
+# Whether vsync was asked for and set_mode accepted it (set by open_window); some drivers
+# (dummy, software renderers) accept the flag without waiting for the refresh, so this
+# says nothing about whether presenting really blocks
+vsync_requested = False
+
+# Named render resolutions
+RESOLUTION_PRESETS = {
+    'low': (512, 300),     # Weak kiosks
+    'medium': (768, 450),
+    'high': (BASE_WIDTH, BASE_HEIGHT)
+}
+
+
+def read_settings(path=SETTINGS_FILE):
+    """Read the saved settings needed before the window opens (empty if unavailable)"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def resolution_size(value):
+    """Turn [width, height] or '512x300' into a (width, height) tuple, or raise ValueError"""
+    if not isinstance(value, (list, tuple)):
+        value = str(value).strip().lower().split('x')
+    if len(value) != 2:
+        raise ValueError("expected 'WIDTHxHEIGHT' or [width, height]")
+    try:
+        width, height = int(value[0]), int(value[1])
+    except TypeError:
+        raise ValueError("expected whole numbers")
+    if width < 1 or height < 1:
+        raise ValueError("width and height must be at least 1")
+    return width, height
+
+
+def parse_resolution(value):
+    """Turn '512x300', a preset name or 'native' into a (width, height) tuple, or None"""
+    if not value:
+        return None
+    if not isinstance(value, (list, tuple)):
+        name = str(value).strip().lower()
+        if name in RESOLUTION_PRESETS:
+            return RESOLUTION_PRESETS[name]
+        if name == 'native':
+            sizes = pygame.display.get_desktop_sizes()
+            return sizes[0] if sizes else (BASE_WIDTH, BASE_HEIGHT)
+
+    try:
+        return resolution_size(value)
+    except ValueError:
+        print(f"Unknown render resolution '{value}', using {BASE_WIDTH}x{BASE_HEIGHT}")
+        return None
+
+
+def render_resolution(settings, default=None):
+    """Resolve the internal resolution from the environment, the settings, the given
+    default (e.g. the graphics preset's) or the reference size"""
+    size = parse_resolution(os.environ.get(RESOLUTION_ENV_VAR))
+    if size is None:
+        size = parse_resolution(settings.get('render_resolution'))
+    if size is None:
+        size = parse_resolution(default)
+    return size or (BASE_WIDTH, BASE_HEIGHT)
+
+
+def ui_scale(height):
+    """Scale factor from the reference layout to a screen of this height"""
+    return height / BASE_HEIGHT
+
+
+def scaled(value, scale):
+    """Scale a reference length, rounded to whole pixels"""
+    return int(round(value * scale))
+
+
+def open_window(size, fullscreen=False, vsync=True):
+    """Open the window; SCALED lets SDL stretch the internal resolution to the display"""
+    global vsync_requested
+    flags = pygame.SCALED
+    if fullscreen:
+        flags |= pygame.FULLSCREEN
+
+    try:
+        window = pygame.display.set_mode(size, flags, vsync=1 if vsync else 0)
+        vsync_requested = vsync
+        return window
+    except pygame.error as e:
+        # The driver refused the vsync flag outright
+        print(f"Vsync not available: {e}")
+        vsync_requested = False
+        return pygame.display.set_mode(size, flags)
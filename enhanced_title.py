@@ -2,12 +2,29 @@ import pygame
 import math
 import random
 import os
+from display_config import ui_scale, scaled
+from surface_format import display_format
+from render_cache import ParticleSprites
+from viewport import Viewport
+from quality import quality
+
+# Particles are [x, y, speed_x, speed_y, size, color, lifetime]; these read them for viewport culling
+def particle_motion(particle):
+    return particle[0], particle[1], particle[2], particle[3], particle[4]
+
+def particle_position(particle):
+    return particle[0], particle[1], particle[4]
 
 class EnhancedTitle:
     def __init__(self, screen, width, height):
         self.screen = screen
         self.screen_width = width
         self.screen_height = height
+        self.viewport = Viewport(width, height)
+        self.quality = quality.settings  # Glow rings and particle rate
+        
+        # Layout values below are for a 600 pixel high screen
+        self.scale = ui_scale(height)
         
         # Title text
         self.title_text = "TOMB BOUND"
@@ -27,25 +44,26 @@ class EnhancedTitle:
         self.glow_intensity = 0
         self.particle_timer = 0
         self.particles = []
+        self.particle_sprites = ParticleSprites()  # One surface per size and color
         
         # Load fonts
         try:
             # Try to load a more thematic font if available
             font_path = os.path.join('fonts', 'ancient.ttf')
             if os.path.exists(font_path):
-                self.main_font = pygame.font.Font(font_path, 80)
-                self.shadow_font = pygame.font.Font(font_path, 80)
-                self.small_font = pygame.font.Font(font_path, 30)
+                self.main_font = pygame.font.Font(font_path, self.px(80))
+                self.shadow_font = pygame.font.Font(font_path, self.px(80))
+                self.small_font = pygame.font.Font(font_path, self.px(30))
             else:
                 # Fallback to default fonts
-                self.main_font = pygame.font.Font(None, 80)
-                self.shadow_font = pygame.font.Font(None, 80)
-                self.small_font = pygame.font.Font(None, 30)
+                self.main_font = pygame.font.Font(None, self.px(80))
+                self.shadow_font = pygame.font.Font(None, self.px(80))
+                self.small_font = pygame.font.Font(None, self.px(30))
         except:
             # Further fallback
-            self.main_font = pygame.font.SysFont('Arial', 80)
-            self.shadow_font = pygame.font.SysFont('Arial', 80)
-            self.small_font = pygame.font.SysFont('Arial', 30)
+            self.main_font = pygame.font.SysFont('Arial', self.px(80))
+            self.shadow_font = pygame.font.SysFont('Arial', self.px(80))
+            self.small_font = pygame.font.SysFont('Arial', self.px(30))
         
         # Load decorative elements
         self.decorations = []
@@ -61,7 +79,7 @@ class EnhancedTitle:
                 if os.path.exists(path):
                     img = pygame.image.load(path).convert_alpha()
                     # Scale to appropriate size
-                    img = pygame.transform.scale(img, (60, 60))
+                    img = pygame.transform.scale(img, (self.px(60), self.px(60)))
                     self.decorations.append(img)
         except:
             # No decorations if loading fails
@@ -70,21 +88,28 @@ class EnhancedTitle:
         # Create surfaces for the title components
         self.create_title_surfaces()
         
+    def px(self, value):
+        """Scale a reference length to this screen"""
+        return scaled(value, self.scale)
+    
     def create_title_surfaces(self):
         # Main title text with gradient
         self.title_surface = self.create_gradient_text(self.main_font, self.title_text, 
                                                       self.light_gold, self.dark_gold)
         
         # Shadow for depth
-        self.shadow_surface = self.shadow_font.render(self.title_text, True, self.black)
+        self.shadow_surface = display_format(self.shadow_font.render(self.title_text, True, self.black))
         
         # Glow surface (will be updated during animation)
-        self.glow_surface = pygame.Surface((self.title_surface.get_width() + 20, 
-                                           self.title_surface.get_height() + 20), 
-                                          pygame.SRCALPHA)
+        self.glow_surface = display_format(pygame.Surface((self.title_surface.get_width() + 20, 
+                                                          self.title_surface.get_height() + 20), 
+                                                         pygame.SRCALPHA))
+        
+        # The title in the glow color, faded per glow ring
+        self.glow_text = display_format(self.main_font.render(self.title_text, True, self.light_gold))
         
         # Subtitle
-        self.subtitle_surface = self.small_font.render("EXPLORE THE ANCIENT DEPTHS", True, self.sand_color)
+        self.subtitle_surface = display_format(self.small_font.render("EXPLORE THE ANCIENT DEPTHS", True, self.sand_color))
         
     def create_gradient_text(self, font, text, color1, color2):
         # Create initial text surface
@@ -109,7 +134,7 @@ class EnhancedTitle:
         # Apply text as a mask
         gradient_surface.blit(base, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         
-        return gradient_surface
+        return display_format(gradient_surface)
     
     def update_glow(self):
         # Clear the glow surface
@@ -122,7 +147,8 @@ class EnhancedTitle:
         original_width, original_height = self.title_surface.get_size()
         max_glow = 10
         
-        for i in range(1, max_glow + 1):
+        # Lower quality levels draw only the innermost, brightest rings
+        for i in range(1, min(max_glow, self.quality.glow_rings) + 1):
             size = i / max_glow
             alpha = int(255 * (1 - size) * self.glow_intensity)
             
@@ -133,8 +159,8 @@ class EnhancedTitle:
             # Create a larger surface for this glow layer
             glow_layer = pygame.Surface((original_width + i*2, original_height + i*2), pygame.SRCALPHA)
             
-            # Create a copy of the title with the glow color
-            glow_text = self.main_font.render(self.title_text, True, self.light_gold)
+            # The title in the glow color
+            glow_text = self.glow_text
             glow_text.set_alpha(alpha)
             
             # Position in the center of the larger surface
@@ -150,7 +176,7 @@ class EnhancedTitle:
     def update_particles(self):
         # Add new particles occasionally
         self.particle_timer += 1
-        if self.particle_timer >= 5:  # Every 5 frames
+        if self.particle_timer >= self.quality.title_particle_interval:  # Every 5 frames at high quality
             self.particle_timer = 0
             
             # Add 1-3 new particles
@@ -159,14 +185,14 @@ class EnhancedTitle:
                 title_width = self.title_surface.get_width()
                 x = random.randint(self.screen_width//2 - title_width//2, 
                                   self.screen_width//2 + title_width//2)
-                y = random.randint(80, 120)
+                y = random.randint(self.px(80), self.px(120))
                 
                 # Random movement
-                speed_x = random.uniform(-0.5, 0.5)
-                speed_y = random.uniform(-1.5, -0.5)
+                speed_x = random.uniform(-0.5, 0.5) * self.scale
+                speed_y = random.uniform(-1.5, -0.5) * self.scale
                 
                 # Random size and color
-                size = random.randint(2, 5)
+                size = max(1, self.px(random.randint(2, 5)))
                 color = random.choice([self.light_gold, self.gold, self.sand_color])
                 
                 # Random lifetime
@@ -176,24 +202,25 @@ class EnhancedTitle:
                 self.particles.append([x, y, speed_x, speed_y, size, color, lifetime])
         
         # Update existing particles
-        for particle in self.particles[:]:
+        for particle in self.particles:
             # Move particle
             particle[0] += particle[2]  # x position
             particle[1] += particle[3]  # y position
             
             # Decrease lifetime
             particle[6] -= 1
-            
-            # Remove if lifetime is over
-            if particle[6] <= 0:
-                self.particles.remove(particle)
+        
+        # Remove particles whose lifetime is over or that floated off the screen
+        live = [particle for particle in self.particles if particle[6] > 0]
+        self.particles = self.viewport.drop_escaped('title_particles', live, particle_motion, gravity=False)
     
     def update(self):
         # Update time
         self.time += 1
         
-        # Update glow effect
+        # Update glow effect (redrawn in place, so the renderer is told it changed)
         self.update_glow()
+        self.screen.refresh(self.glow_surface)
         
         # Update particles
         self.update_particles()
@@ -201,39 +228,39 @@ class EnhancedTitle:
     def draw(self):
         # Calculate title position (center of screen)
         title_x = self.screen_width // 2 - self.title_surface.get_width() // 2
-        title_y = 80  # Position from top
+        title_y = self.px(80)  # Position from top
         
         # Draw decorative elements if available
         if self.decorations:
             # Left decoration
             if len(self.decorations) > 0:
-                left_x = title_x - self.decorations[0].get_width() - 20
+                left_x = title_x - self.decorations[0].get_width() - self.px(20)
                 left_y = title_y + self.title_surface.get_height() // 2 - self.decorations[0].get_height() // 2
                 self.screen.blit(self.decorations[0], (left_x, left_y))
             
             # Right decoration
             if len(self.decorations) > 1:
-                right_x = title_x + self.title_surface.get_width() + 20
+                right_x = title_x + self.title_surface.get_width() + self.px(20)
                 right_y = title_y + self.title_surface.get_height() // 2 - self.decorations[1].get_height() // 2
                 self.screen.blit(self.decorations[1], (right_x, right_y))
         
         # Draw horizontal decorative lines
-        line_y = title_y + self.title_surface.get_height() + 10
-        line_width = self.title_surface.get_width() + 100
+        line_y = title_y + self.title_surface.get_height() + self.px(10)
+        line_width = self.title_surface.get_width() + self.px(100)
         line_x = self.screen_width // 2 - line_width // 2
         
         # Draw main line
-        pygame.draw.line(self.screen, self.gold, 
+        self.screen.draw_shape(pygame.draw.line, self.gold, 
                         (line_x, line_y), 
-                        (line_x + line_width, line_y), 3)
+                        (line_x + line_width, line_y), max(1, self.px(3)))
         
         # Draw smaller accent lines
-        pygame.draw.line(self.screen, self.dark_gold, 
-                        (line_x + 20, line_y + 5), 
-                        (line_x + line_width - 20, line_y + 5), 1)
+        self.screen.draw_shape(pygame.draw.line, self.dark_gold, 
+                        (line_x + self.px(20), line_y + self.px(5)), 
+                        (line_x + line_width - self.px(20), line_y + self.px(5)), 1)
         
-        # Draw particles
-        for particle in self.particles:
+        # Draw the particles on screen
+        for particle in self.viewport.visible_items('title_particles', self.particles, particle_position):
             # Extract particle properties
             x, y, _, _, size, color, lifetime = particle
             
@@ -241,9 +268,7 @@ class EnhancedTitle:
             alpha = min(255, lifetime * 3)
             
             # Draw the particle
-            particle_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (*color, alpha), (size, size), size)
-            self.screen.blit(particle_surface, (x - size, y - size))
+            self.screen.blit(self.particle_sprites.get(size, color, alpha), (x - size, y - size))
         
         # Draw glow effect
         glow_x = title_x - 10  # Offset to account for glow size
@@ -251,7 +276,7 @@ class EnhancedTitle:
         self.screen.blit(self.glow_surface, (glow_x, glow_y))
         
         # Draw shadow (offset slightly)
-        shadow_offset = 3
+        shadow_offset = max(1, self.px(3))
         self.screen.blit(self.shadow_surface, (title_x + shadow_offset, title_y + shadow_offset))
         
         # Draw main title
@@ -259,7 +284,7 @@ class EnhancedTitle:
         
         # Draw subtitle
         subtitle_x = self.screen_width // 2 - self.subtitle_surface.get_width() // 2
-        subtitle_y = title_y + self.title_surface.get_height() + 20
+        subtitle_y = title_y + self.title_surface.get_height() + self.px(20)
         self.screen.blit(self.subtitle_surface, (subtitle_x, subtitle_y))
         
         # Draw hieroglyphic-style border elements
@@ -267,21 +292,21 @@ class EnhancedTitle:
     
     def draw_border_elements(self):
         # Draw corner elements
-        corner_size = 30
-        margin = 20
+        corner_size = self.px(30)
+        margin = self.px(20)
         
         # Define hieroglyphic-like symbols
         symbols = [
             # Simple eye symbol
-            lambda surface, x, y, size: pygame.draw.ellipse(surface, self.gold, 
+            lambda surface, x, y, size: surface.draw_shape(pygame.draw.ellipse, self.gold, 
                                                           (x, y, size, size//2), 2),
             # Ankh-like symbol
             lambda surface, x, y, size: (
-                pygame.draw.line(surface, self.gold, (x+size//2, y), (x+size//2, y+size), 2),
-                pygame.draw.ellipse(surface, self.gold, (x, y, size, size//2), 2)
+                surface.draw_shape(pygame.draw.line, self.gold, (x+size//2, y), (x+size//2, y+size), 2),
+                surface.draw_shape(pygame.draw.ellipse, self.gold, (x, y, size, size//2), 2)
             ),
             # Pyramid
-            lambda surface, x, y, size: pygame.draw.polygon(surface, self.gold, 
+            lambda surface, x, y, size: surface.draw_shape(pygame.draw.polygon, self.gold, 
                                                           [(x, y+size), (x+size//2, y), (x+size, y+size)], 2)
         ]
         
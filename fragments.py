@@ -0,0 +1,180 @@
+"""
+Fragment Effects for Tomb Bound
+Pooled fragments drawn from stamps that are rotated once at fixed angle steps,
+so animating fragments never creates surfaces
+"""
+
+import pygame
+import random
+import math
+from surface_format import display_format
+from telemetry import telemetry
+
+# Rotation is quantized to this many steps per full turn
+ANGLE_STEPS = 16
+ANGLE_STEP = 360 / ANGLE_STEPS
+
+# Fragment outlines: a square, or one of a few fixed polygons (angle offsets, radius factors)
+POLYGON_TEMPLATES = [
+    [(0.0, 0.9), (2.2, 0.6), (4.1, 1.0)],
+    [(0.3, 1.0), (1.8, 0.7), (3.3, 0.9), (4.9, 0.6)],
+    [(0.0, 0.8), (1.2, 1.0), (2.5, 0.6), (3.7, 0.9), (5.0, 0.7)]
+]
+SHAPES = ['rect'] + [f'poly{i}' for i in range(len(POLYGON_TEMPLATES))]
+
+
+def rotations(surface, steps=ANGLE_STEPS):
+    """Rotate a surface once per angle step; returns (image, half width, half height) tuples"""
+    stamps = []
+    for i in range(steps):
+        rotated = display_format(pygame.transform.rotate(surface, i * 360 / steps))
+        stamps.append((rotated, rotated.get_width() // 2, rotated.get_height() // 2))
+    return stamps
+
+
+class FragmentStamps:
+    def __init__(self):
+        """Library of pre-rotated fragment images, shared by every effect"""
+        self.stamps = {}
+
+    def get_shape(self, shape, size, color):
+        """Get the rotations of a solid fragment shape, rendering them the first time"""
+        key = (shape, size, color)
+        stamps = self.stamps.get(key)
+        if stamps is None:
+            stamps = self.stamps[key] = rotations(self.render_shape(shape, size, color))
+        return stamps
+
+    def get_image(self, key, surface):
+        """Get the rotations of an arbitrary image (e.g. a piece of a sprite) under a key"""
+        stamps = self.stamps.get(key)
+        if stamps is None:
+            stamps = self.stamps[key] = rotations(surface)
+        return stamps
+
+    def render_shape(self, shape, size, color):
+        """Draw one unrotated fragment centered in a (2*size x 2*size) surface"""
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        if shape == 'rect':
+            rect = pygame.Rect(0, 0, size, size)
+            rect.center = (size, size)
+            pygame.draw.rect(surface, color, rect)
+        else:
+            template = POLYGON_TEMPLATES[int(shape[4:])]
+            points = [(size + math.cos(angle) * size * radius, size + math.sin(angle) * size * radius)
+                      for angle, radius in template]
+            pygame.draw.polygon(surface, color, points)
+        return surface
+
+
+class Fragment:
+    __slots__ = ('x', 'y', 'velocity_x', 'velocity_y', 'gravity', 'fade_speed',
+                 'alpha', 'rotation', 'rotation_speed', 'stamps')
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.gravity = 0.0
+        self.fade_speed = 0.0
+        self.alpha = 0.0
+        self.rotation = 0.0
+        self.rotation_speed = 0.0
+        self.stamps = None
+
+
+class FragmentPool:
+    def __init__(self, capacity, stamps=None, gravity_scale=1.0):
+        """Pre-allocate fragments; the first `active` entries are alive"""
+        self.fragments = [Fragment() for _ in range(capacity)]
+        self.active = 0
+        self.stamps = stamps if stamps is not None else fragment_stamps
+        self.gravity_scale = gravity_scale  # Follows the render resolution
+
+    def __len__(self):
+        return self.active
+
+    def __iter__(self):
+        return iter(self.fragments[:self.active])
+
+    def clear(self):
+        self.active = 0
+
+    def spawn(self, x, y, stamps, velocity_x=0, velocity_y=0):
+        """Activate a pooled fragment drawn with the given stamp rotations"""
+        if self.active == len(self.fragments):
+            return None
+
+        fragment = self.fragments[self.active]
+        self.active += 1
+        fragment.x = x
+        fragment.y = y
+        fragment.velocity_x = velocity_x
+        fragment.velocity_y = velocity_y
+        fragment.rotation = random.uniform(0, 360)
+        fragment.rotation_speed = random.uniform(-5, 5)
+        fragment.gravity = random.uniform(0.2, 0.4) * self.gravity_scale
+        fragment.fade_speed = random.uniform(2, 5)
+        fragment.alpha = 255
+        fragment.stamps = stamps
+        return fragment
+
+    def spawn_shape(self, x, y, size, color, velocity_x=0, velocity_y=0):
+        """Activate a solid fragment of a random shape"""
+        stamps = self.stamps.get_shape(random.choice(SHAPES), size, color)
+        return self.spawn(x, y, stamps, velocity_x, velocity_y)
+
+    def update(self, viewport=None):
+        """Move, spin and fade every live fragment, recycling the ones that faded out
+        (or that left the viewport for good)"""
+        fragments = self.fragments
+        escaped = 0
+        i = 0
+        while i < self.active:
+            fragment = fragments[i]
+
+            # Apply gravity and update position
+            fragment.velocity_y += fragment.gravity
+            fragment.x += fragment.velocity_x
+            fragment.y += fragment.velocity_y
+
+            # Update rotation and fade out
+            fragment.rotation += fragment.rotation_speed
+            fragment.alpha -= fragment.fade_speed
+
+            if fragment.alpha > 0:
+                # Half width plus half height covers the stamp at any rotation
+                _, half_width, half_height = fragment.stamps[0]
+                if viewport is None or not viewport.escaped(fragment.x, fragment.y, fragment.velocity_x,
+                                                            fragment.velocity_y, half_width + half_height):
+                    i += 1
+                    continue
+                escaped += 1
+
+            # Swap the faded fragment out of the live range
+            self.active -= 1
+            fragments[i] = fragments[self.active]
+            fragments[self.active] = fragment
+
+        if escaped:
+            telemetry.count('cull.fragments.dropped', escaped)
+
+    def draw(self, surface, viewport=None):
+        """Blit every live fragment (on screen) from its stamp for the current angle step"""
+        skipped = 0
+        for i in range(self.active):
+            fragment = self.fragments[i]
+            image, half_width, half_height = fragment.stamps[int(fragment.rotation // ANGLE_STEP) % ANGLE_STEPS]
+            if viewport is not None and not viewport.visible(fragment.x, fragment.y, max(half_width, half_height)):
+                skipped += 1
+                continue
+            image.set_alpha(int(fragment.alpha))
+            surface.blit(image, (int(fragment.x) - half_width, int(fragment.y) - half_height))
+
+        if skipped:
+            telemetry.count('cull.fragments.skipped', skipped)
+
+
+# Global stamp library shared by every fragment pool
+fragment_stamps = FragmentStamps()
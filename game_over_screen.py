@@ -2,26 +2,45 @@ import pygame
 import math
 import random
 import os
+from telemetry import telemetry
+from crack_library import crack_library
+from display_config import ui_scale, scaled
+from surface_format import display_format
+from render_cache import ParticleSprites
+from viewport import Viewport
+from quality import quality
+
+# Dust particles are dicts; these read them for viewport culling
+def particle_motion(particle):
+    return particle['x'], particle['y'], particle['speed_x'], particle['speed_y'], particle['size']
+
+def particle_position(particle):
+    return particle['x'], particle['y'], particle['size']
 
 class GameOverScreen:
     def __init__(self, screen, screen_width, screen_height):
         self.screen = screen
         self.width = screen_width
         self.height = screen_height
+        self.viewport = Viewport(screen_width, screen_height)
+        self.quality = quality.settings  # Particles, glow rings and crack detail
+        
+        # Layout values below are for a 600 pixel high screen
+        self.scale = ui_scale(screen_height)
         
         # Animation timers and states
         self.time = 0
         self.fade_in = 0  # 0 to 255
         self.particles = []
-        self.cracks = []
+        self.particle_sprites = ParticleSprites()  # One surface per size and color
         
         # Load fonts
         try:
-            self.title_font = pygame.font.Font(None, 80)
-            self.main_font = pygame.font.Font(None, 36)
+            self.title_font = pygame.font.Font(None, self.px(80))
+            self.main_font = pygame.font.Font(None, self.px(36))
         except:
-            self.title_font = pygame.font.SysFont('Arial', 80)
-            self.main_font = pygame.font.SysFont('Arial', 36)
+            self.title_font = pygame.font.SysFont('Arial', self.px(80))
+            self.main_font = pygame.font.SysFont('Arial', self.px(36))
         
         # Load decorative elements
         self.decorations = []
@@ -34,7 +53,7 @@ class GameOverScreen:
             for path in decoration_paths:
                 if os.path.exists(path):
                     img = pygame.image.load(path).convert_alpha()
-                    img = pygame.transform.scale(img, (60, 60))
+                    img = pygame.transform.scale(img, (self.px(60), self.px(60)))
                     self.decorations.append(img)
         except Exception as e:
             print(f"Error loading decorations: {e}")
@@ -51,13 +70,29 @@ class GameOverScreen:
         self.subtitle_surface = self.create_gradient_text(self.main_font, self.subtitle_text,
                                                         (180, 180, 180), (100, 100, 100))
         
-        # Initialize crack effect
-        self.generate_cracks()
+        # The title in the glow color, and the options with their key highlights,
+        # rendered once and faded with surface alpha while drawing
+        self.glow_text = display_format(self.title_font.render(self.title_text, True, (255, 0, 0)))
+        self.restart_surface = display_format(self.main_font.render(self.restart_text, True, (200, 200, 200)))
+        self.r_highlight = display_format(self.main_font.render("R", True, (255, 255, 0)))
+        self.menu_surface = display_format(self.main_font.render(self.menu_text, True, (200, 200, 200)))
+        self.m_highlight = display_format(self.main_font.render("M", True, (255, 255, 0)))
+        
+        # Background gradient, drawn once and faded in with surface alpha
+        self.bg_surface = self.create_background()
+        
+        # Pick a pre-rendered crack pattern for the screen
+        self.crack_image, self.crack_offset = crack_library.pick('screen', (self.width, self.height),
+                                                                 self.quality.crack_depth)
         
         # Initialize particles
-        for _ in range(30):
+        for _ in range(self.quality.game_over_particles):
             self.add_particle()
     
+    def px(self, value):
+        """Scale a reference length to this screen"""
+        return scaled(value, self.scale)
+    
     def create_gradient_text(self, font, text, color1, color2):
         base = font.render(text, True, color1)
         width, height = base.get_size()
@@ -74,54 +109,28 @@ class GameOverScreen:
             pygame.draw.line(gradient_surface, color, (0, y), (width, y))
         
         gradient_surface.blit(base, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        return gradient_surface
+        return display_format(gradient_surface)
     
-    def generate_cracks(self):
-        # Create crack patterns emanating from center
-        center_x, center_y = self.width // 2, self.height // 2
-        
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            length = random.randint(50, 200)
-            thickness = random.randint(1, 3)
-            
-            # Create branching cracks
-            self.create_crack_branch(center_x, center_y, angle, length, thickness)
+    def create_background(self):
+        bg_surface = pygame.Surface((self.width, self.height)).convert()
+        for y in range(self.height):
+            ratio = y / self.height
+            color = (int(20 * (1-ratio)), int(10 * (1-ratio)), int(30 * (1-ratio)))
+            pygame.draw.line(bg_surface, color, (0, y), (self.width, y))
+        telemetry.count('surfaces.overlay_created')
+        return bg_surface
     
-    def create_crack_branch(self, x, y, angle, length, thickness, depth=0):
-        if depth > 3:  # Limit recursion depth
-            return
-            
-        # Calculate end point
-        end_x = x + math.cos(angle) * length
-        end_y = y + math.sin(angle) * length
-        
-        # Add this crack segment
-        self.cracks.append({
-            'start': (x, y),
-            'end': (end_x, end_y),
-            'thickness': thickness,
-            'alpha': random.randint(100, 200)
-        })
-        
-        # Create branches with some probability
-        if random.random() < 0.7 and depth < 2:
-            branch_angle1 = angle + random.uniform(-0.5, 0.5)
-            branch_angle2 = angle + random.uniform(-0.5, 0.5)
-            branch_length = length * random.uniform(0.5, 0.8)
-            
-            self.create_crack_branch(end_x, end_y, branch_angle1, branch_length, 
-                                   max(1, thickness-1), depth+1)
-            self.create_crack_branch(end_x, end_y, branch_angle2, branch_length, 
-                                   max(1, thickness-1), depth+1)
+    def is_opaque(self):
+        """True once the background has faded in fully and hides everything behind it"""
+        return self.fade_in >= 255
     
     def add_particle(self):
         # Add dust/debris particle
         x = random.randint(0, self.width)
         y = random.randint(0, self.height)
-        size = random.randint(1, 4)
-        speed_x = random.uniform(-0.5, 0.5)
-        speed_y = random.uniform(-0.5, 0.5)
+        size = max(1, self.px(random.randint(1, 4)))
+        speed_x = random.uniform(-0.5, 0.5) * self.scale
+        speed_y = random.uniform(-0.5, 0.5) * self.scale
         lifetime = random.randint(100, 200)
         color = random.choice([(100, 100, 100), (150, 150, 150), (200, 200, 200)])
         
@@ -140,115 +149,88 @@ class GameOverScreen:
             self.fade_in = min(255, self.fade_in + 5)
         
         # Update particles
-        for particle in self.particles[:]:
+        for particle in self.particles:
             particle['x'] += particle['speed_x']
             particle['y'] += particle['speed_y']
             particle['lifetime'] -= 1
-            
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
-                self.add_particle()
         
-        # Add new particles occasionally
-        if random.random() < 0.1:
+        # Replace the particles that faded out or drifted off the screen
+        count = len(self.particles)
+        live = [particle for particle in self.particles if particle['lifetime'] > 0]
+        self.particles = self.viewport.drop_escaped('game_over_dust', live, particle_motion, gravity=False)
+        for _ in range(count - len(self.particles)):
+            self.add_particle()
+        
+        # Add new particles occasionally, up to twice the starting number
+        if random.random() < 0.1 and len(self.particles) < self.quality.game_over_particles * 2:
             self.add_particle()
     
     def draw(self):
         # Draw background gradient
-        bg_surface = pygame.Surface((self.width, self.height))
-        for y in range(self.height):
-            ratio = y / self.height
-            color = (int(20 * (1-ratio)), int(10 * (1-ratio)), int(30 * (1-ratio)))
-            pygame.draw.line(bg_surface, color, (0, y), (self.width, y))
-        
-        bg_surface.set_alpha(self.fade_in)
-        self.screen.blit(bg_surface, (0, 0))
+        self.bg_surface.set_alpha(self.fade_in)
+        self.screen.blit(self.bg_surface, (0, 0))
         
-        # Draw particles
-        for particle in self.particles:
+        # Draw the particles on screen
+        for particle in self.viewport.visible_items('game_over_dust', self.particles, particle_position):
             alpha = int(255 * (particle['lifetime'] / particle['max_lifetime']))
-            color = particle['color'] + (alpha,)
-            
-            particle_surf = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color, (particle['size'], particle['size']), particle['size'])
+            particle_surf = self.particle_sprites.get(particle['size'], particle['color'], alpha)
             self.screen.blit(particle_surf, (particle['x'] - particle['size'], particle['y'] - particle['size']))
         
-        # Draw cracks
-        for crack in self.cracks:
-            # Make cracks pulse slightly
-            alpha = crack['alpha'] + int(20 * math.sin(self.time * 0.05))
-            alpha = max(0, min(255, alpha))
-            
-            # Draw the crack with alpha
-            crack_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            pygame.draw.line(crack_surf, (255, 255, 255, alpha), 
-                           crack['start'], crack['end'], crack['thickness'])
-            self.screen.blit(crack_surf, (0, 0))
+        # Draw cracks, pulsing the whole pattern slightly with surface alpha
+        self.crack_image.set_alpha(235 + int(20 * math.sin(self.time * 0.05)))
+        self.screen.blit(self.crack_image, self.crack_offset)
         
         # Draw decorative elements if available
         if self.decorations:
             # Position decorations
             if len(self.decorations) > 0:
                 # Left decoration with slight animation
-                left_x = self.width // 2 - 200 + int(5 * math.sin(self.time * 0.03))
-                left_y = self.height // 2 - 100
+                left_x = self.width // 2 - self.px(200) + int(self.px(5) * math.sin(self.time * 0.03))
+                left_y = self.height // 2 - self.px(100)
                 self.screen.blit(self.decorations[0], (left_x, left_y))
             
             if len(self.decorations) > 1:
                 # Right decoration with slight animation
-                right_x = self.width // 2 + 150 + int(5 * math.sin(self.time * 0.03 + math.pi))
-                right_y = self.height // 2 - 100
+                right_x = self.width // 2 + self.px(150) + int(self.px(5) * math.sin(self.time * 0.03 + math.pi))
+                right_y = self.height // 2 - self.px(100)
                 self.screen.blit(self.decorations[1], (right_x, right_y))
         
         # Draw main title with glow effect
         glow_intensity = abs(math.sin(self.time * 0.05)) * 0.5 + 0.5
         
-        # Draw multiple layers for glow effect
-        for i in range(1, 10):
+        # Draw multiple layers for glow effect; each ring is centred on the title, so it is
+        # the glow text blitted straight there with its own alpha
+        title_x = self.width // 2 - self.title_surface.get_width() // 2
+        title_y = self.height // 2 - self.px(100)
+        for i in range(1, min(9, self.quality.glow_rings) + 1):
             alpha = int(150 * (1 - i/10) * glow_intensity)
-            glow_surf = pygame.Surface((self.title_surface.get_width() + i*2, 
-                                      self.title_surface.get_height() + i*2), pygame.SRCALPHA)
-            glow_text = self.title_font.render(self.title_text, True, (255, 0, 0))
-            glow_text.set_alpha(alpha)
-            
-            x = (glow_surf.get_width() - self.title_surface.get_width()) // 2
-            y = (glow_surf.get_height() - self.title_surface.get_height()) // 2
-            glow_surf.blit(glow_text, (x, y))
-            
-            title_x = self.width // 2 - glow_surf.get_width() // 2
-            title_y = self.height // 2 - 100 - i
-            self.screen.blit(glow_surf, (title_x, title_y))
+            self.glow_text.set_alpha(alpha)
+            self.screen.blit(self.glow_text, (title_x, title_y))
         
         # Draw main title
-        title_x = self.width // 2 - self.title_surface.get_width() // 2
-        title_y = self.height // 2 - 100
         self.screen.blit(self.title_surface, (title_x, title_y))
         
         # Draw subtitle
         subtitle_x = self.width // 2 - self.subtitle_surface.get_width() // 2
-        subtitle_y = self.height // 2 - 40
+        subtitle_y = self.height // 2 - self.px(40)
         self.screen.blit(self.subtitle_surface, (subtitle_x, subtitle_y))
         
         # Draw restart option with highlighted R
-        restart_text = self.main_font.render(self.restart_text, True, (200, 200, 200))
-        restart_x = self.width // 2 - restart_text.get_width() // 2
-        restart_y = self.height // 2 + 50
-        self.screen.blit(restart_text, (restart_x, restart_y))
+        restart_x = self.width // 2 - self.restart_surface.get_width() // 2
+        restart_y = self.height // 2 + self.px(50)
+        self.screen.blit(self.restart_surface, (restart_x, restart_y))
         
         # Draw pulsing highlight for R key
-        r_highlight = self.main_font.render("R", True, (255, 255, 0))
         r_glow = abs(math.sin(self.time * 0.1)) * 0.5 + 0.5
-        r_highlight.set_alpha(int(255 * r_glow))
-        self.screen.blit(r_highlight, (restart_x, restart_y))
+        self.r_highlight.set_alpha(int(255 * r_glow))
+        self.screen.blit(self.r_highlight, (restart_x, restart_y))
         
         # Draw menu option with highlighted M
-        menu_text = self.main_font.render(self.menu_text, True, (200, 200, 200))
-        menu_x = self.width // 2 - menu_text.get_width() // 2
-        menu_y = self.height // 2 + 100
-        self.screen.blit(menu_text, (menu_x, menu_y))
+        menu_x = self.width // 2 - self.menu_surface.get_width() // 2
+        menu_y = self.height // 2 + self.px(100)
+        self.screen.blit(self.menu_surface, (menu_x, menu_y))
         
         # Draw pulsing highlight for M key
-        m_highlight = self.main_font.render("M", True, (255, 255, 0))
         m_glow = abs(math.sin(self.time * 0.1 + math.pi)) * 0.5 + 0.5
-        m_highlight.set_alpha(int(255 * m_glow))
-        self.screen.blit(m_highlight, (menu_x, menu_y))
+        self.m_highlight.set_alpha(int(255 * m_glow))
+        self.screen.blit(self.m_highlight, (menu_x, menu_y))
@@ -0,0 +1,107 @@
+"""
+Idle Throttling for Tomb Bound
+The game redraws every frame at full rate while it is played. When nobody is looking
+(the window lost focus or was minimised) or nobody has touched the menu or pause
+screen for a while, frames are drawn at a low rate instead, and the time in between
+is spent blocked in pygame.event.wait so any input wakes the game straight back up
+"""
+
+import pygame
+from telemetry import telemetry
+from options import resolve_option
+
+# Set TOMB_BOUND_IDLE to 'on' or 'off' to override the saved setting
+IDLE_ENV_VAR = 'TOMB_BOUND_IDLE'
+DEFAULT_IDLE = 'on'
+
+IDLE_AFTER_MS = 5000  # Time without input before the menus slow down
+IDLE_FPS = 10         # Menu and pause screens with no input
+UNFOCUSED_FPS = 5     # Window in the background
+MINIMIZED_FPS = 2     # Window minimised or hidden (nothing is drawn)
+
+# Events that count as the player doing something
+INPUT_EVENTS = {
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION, pygame.JOYHATMOTION,
+    pygame.FINGERDOWN, pygame.FINGERMOTION
+}
+
+# Screens that may slow down when idle; gameplay always runs at full rate
+IDLE_STATES = ('menu', 'paused')
+
+
+def idle_setting(setting=None):
+    """Whether idle throttling is on ('on' or 'off')"""
+    return resolve_option(IDLE_ENV_VAR, setting, ('on', 'off'), DEFAULT_IDLE, 'idle setting') == 'on'
+
+
+class IdlePolicy:
+    def __init__(self, enabled=True):
+        """Track input and window focus, and pick the frame rate for the next frame"""
+        self.enabled = enabled
+        self.focused = True
+        self.minimized = False
+        self.last_input = pygame.time.get_ticks()
+        self.mode = 'active'
+        self.woken = None  # Event that ended the last wait, for the next frame to handle first
+
+    def handle(self, events):
+        """Look at a frame's events; returns True if the window lost focus or was hidden among them
+
+        Recreating the display hides and shows the window again, so being hidden
+        is tracked apart from focus
+        """
+        focus_lost = False
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                self.last_input = pygame.time.get_ticks()
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                focus_lost = True
+                self.focused = False
+            elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                focus_lost = True
+                self.minimized = True
+            elif event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+                # Coming back counts as input
+                if event.type == pygame.WINDOWFOCUSGAINED:
+                    self.focused = True
+                else:
+                    self.minimized = False
+                self.last_input = pygame.time.get_ticks()
+        # Only if the window is still away after the whole batch (hidden, then shown again, is not)
+        return focus_lost and (self.minimized or not self.focused)
+
+    def frame_rate(self, state, animating, full_rate):
+        """Frame rate for a frame in this game state; animating keeps the menus at full rate"""
+        mode = 'active'
+        if self.enabled:
+            if self.minimized:
+                mode = 'minimized'
+            elif not self.focused:
+                mode = 'unfocused'
+            elif (state in IDLE_STATES and not animating
+                  and pygame.time.get_ticks() - self.last_input >= IDLE_AFTER_MS):
+                mode = 'idle'
+
+        if mode != self.mode:
+            print(f"Frame rate {self.mode} -> {mode}")
+            self.mode = mode
+        rate = {'active': full_rate, 'idle': IDLE_FPS,
+                'unfocused': UNFOCUSED_FPS, 'minimized': MINIMIZED_FPS}[mode]
+        return min(rate, full_rate)
+
+    def wait(self, rate, frame_ms):
+        """Block until the next frame at this rate is due or an event arrives
+
+        frame_ms is how long the frame took so far. An event that wakes the wait
+        is kept in self.woken; it came before anything still on the queue, so the
+        next frame handles it first
+        """
+        timeout = int(1000 / rate - frame_ms)
+        if timeout <= 0:
+            return
+        telemetry.count('idle.waits')
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            self.woken = event
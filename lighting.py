@@ -0,0 +1,151 @@
+"""
+Torch Lighting for Tomb Bound
+The world is darkened with a multiply blend of a light layer. Each frame the layer is
+cleared to the ambient light and a light pool is added around every torch. The pools
+are a small ring of flicker frames precomputed at load, so a frame only fills and blits
+"""
+
+import pygame
+import math
+from telemetry import telemetry
+from surface_format import display_format
+from viewport import Viewport
+from options import resolve_option
+
+# NumPy is optional; without it the light maps are drawn as rings of circles
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Set TOMB_BOUND_LIGHTING to 'off', 'low' or 'high' to override the saved setting
+LIGHTING_ENV_VAR = 'TOMB_BOUND_LIGHTING'
+QUALITY_LEVELS = ['off', 'low', 'high']
+DEFAULT_QUALITY = 'high'
+
+# Flicker frames in the ring, and whether flames get an additive glow, per quality
+QUALITY_SETTINGS = {
+    'low': {'frames': 4, 'glow': False},
+    'high': {'frames': 12, 'glow': True}
+}
+
+# Light the world is multiplied by away from the torches, and at a torch
+AMBIENT_LIGHT = (105, 90, 95)
+TORCH_LIGHT = (255, 205, 150)
+GLOW_COLOR = (110, 60, 15)  # Added over the flame after the multiply
+
+# Sizes for a 600 pixel high screen
+POOL_RADIUS = 190
+GLOW_RADIUS = 34
+
+FLICKER_HOLD = 4  # Frames each flicker frame is shown for
+
+
+def flicker(index, frames):
+    """(intensity, radius scale) of a flicker frame; the ring loops smoothly"""
+    phase = 2 * math.pi * index / frames
+    intensity = 0.88 + 0.08 * math.sin(phase) + 0.04 * math.sin(3 * phase + 1.3)
+    radius = 0.96 + 0.04 * math.sin(2 * phase + 0.4)
+    return intensity, radius
+
+
+def light_map(size, radius, color, exponent):
+    """Opaque square with a radial falloff of color from its center to black at radius
+
+    Drawn with an additive blend, the black outside the radius adds nothing
+    """
+    surface = pygame.Surface((size, size)).convert()
+    surface.fill((0, 0, 0))
+    center = size / 2
+
+    if numpy is not None:
+        # Falloff for every pixel at once, written straight into the surface
+        coords = numpy.arange(size) + 0.5 - center
+        distance = numpy.hypot(coords[:, None], coords[None, :])
+        falloff = numpy.clip(1.0 - distance / radius, 0.0, 1.0) ** exponent
+        rgb = pygame.surfarray.pixels3d(surface)
+        for channel, value in enumerate(color):
+            rgb[..., channel] = (falloff * value).astype(numpy.uint8)
+        del rgb  # Unlock the surface
+        return display_format(surface)
+
+    # Concentric circles from the outside in, each a little brighter
+    steps = max(1, int(radius) // 2)
+    for i in range(steps):
+        r = radius * (1 - i / steps)
+        falloff = (i / steps) ** exponent
+        pygame.draw.circle(surface, [int(value * falloff) for value in color], (center, center), r)
+    return display_format(surface)
+
+
+def lighting_quality(setting=None):
+    """Lighting quality, one of QUALITY_LEVELS"""
+    return resolve_option(LIGHTING_ENV_VAR, setting, QUALITY_LEVELS, DEFAULT_QUALITY, 'lighting quality')
+
+
+def next_quality(quality):
+    """The quality after this one, wrapping around (for a toggle key)"""
+    return QUALITY_LEVELS[(QUALITY_LEVELS.index(quality) + 1) % len(QUALITY_LEVELS)]
+
+
+class TorchLighting:
+    def __init__(self, renderer, size, scale=1.0, quality=DEFAULT_QUALITY):
+        """Lighting pass for the world layer; light maps are built per quality on first use"""
+        self.renderer = renderer
+        self.size = size
+        self.scale = scale
+        self.viewport = Viewport(*size)
+        self.layer = None  # Light layer, created with the first lit frame
+        self.maps = {}     # quality -> (pool frames, glow frames)
+        self.tick = 0
+        self.set_quality(quality)
+
+    def set_quality(self, quality):
+        self.quality = quality
+        if quality != 'off' and quality not in self.maps:
+            self.maps[quality] = self.build(QUALITY_SETTINGS[quality])
+
+    def build(self, settings):
+        """Precompute the ring of pool (and glow) frames for one quality"""
+        frames = settings['frames']
+        pool_radius = POOL_RADIUS * self.scale
+        glow_radius = GLOW_RADIUS * self.scale
+        pools = []
+        glows = []
+        for i in range(frames):
+            intensity, radius = flicker(i, frames)
+            # The pool adds on top of the ambient light, up to the torch light at the center
+            color = [int((torch - ambient) * intensity) for torch, ambient in zip(TORCH_LIGHT, AMBIENT_LIGHT)]
+            pools.append(light_map(int(pool_radius * 2), pool_radius * radius, color, 1.5))
+            if settings['glow']:
+                color = [int(value * intensity) for value in GLOW_COLOR]
+                glows.append(light_map(int(glow_radius * 2), glow_radius * radius, color, 2.0))
+        return pools, glows
+
+    def draw(self, world, lights):
+        """Light a world layer from torches given as (x, y, flicker offset) flame centers"""
+        if self.quality == 'off':
+            return
+        if self.layer is None:
+            self.layer = self.renderer.create_layer(self.size)
+
+        pools, glows = self.maps[self.quality]
+        step = self.tick // FLICKER_HOLD
+        self.tick += 1
+
+        # Only torches whose pool reaches the screen are drawn
+        half = pools[0].get_width() // 2
+        lights = self.viewport.visible_items('lights', lights, lambda light: (light[0], light[1], half))
+
+        # Ambient light everywhere, with the pools added around the torches
+        self.layer.fill(AMBIENT_LIGHT)
+        self.layer.blits([(pools[(step + offset) % len(pools)], (x - half, y - half), None, pygame.BLEND_ADD)
+                          for x, y, offset in lights], doreturn=0)
+        world.blit(self.layer, (0, 0), special_flags=pygame.BLEND_MULT)
+
+        # Flames glow over the darkened world
+        if glows:
+            half = glows[0].get_width() // 2
+            world.blits([(glows[(step + offset) % len(glows)], (x - half, y - half), None, pygame.BLEND_ADD)
+                         for x, y, offset in lights], doreturn=0)
+        telemetry.count('lighting.lights', len(lights))
@@ -0,0 +1,117 @@
+"""
+Music Controller for Tomb Bound
+Keeps the background music stream loaded and switches between music cues
+without reloading files or blocking the frame loop
+"""
+
+import pygame
+
+
+class MusicController:
+    def __init__(self, cues, volume=0.5):
+        """Create a controller for a mapping of cue name -> music file (None for silence)"""
+        self.cues = cues
+        self.volume = volume
+
+        # The file currently loaded into pygame.mixer.music, if any
+        self.loaded_file = None
+        self.current_cue = None
+
+        # 'stopped', 'playing', 'paused' or 'fading' (fading out before the next cue)
+        self.state = 'stopped'
+
+        # Cue waiting for the current fade-out to finish: (cue, fade_in_ms)
+        self.pending = None
+        self.fade_deadline = 0
+
+    def ensure_loaded(self, music_file):
+        """Load a music file into the stream only if it is not loaded already"""
+        if music_file == self.loaded_file:
+            return False
+
+        pygame.mixer.music.load(music_file)
+        self.loaded_file = music_file
+        print(f"Music stream loaded: {music_file}")
+        return True
+
+    def play(self, cue, fade_ms=0, restart=True):
+        """Switch to a cue, fading out the current stream first if its file differs"""
+        music_file = self.cues.get(cue)
+
+        # Different file (or silence) while music is audible: fade out, finish in update()
+        if fade_ms > 0 and self.state == 'playing' and music_file != self.loaded_file:
+            pygame.mixer.music.fadeout(fade_ms)
+            self.pending = (cue, fade_ms)
+            self.fade_deadline = pygame.time.get_ticks() + fade_ms
+            self.state = 'fading'
+            return
+
+        self.start(cue, fade_ms, restart)
+
+    def start(self, cue, fade_ms=0, restart=True):
+        """Start a cue immediately, rewinding or resuming the loaded stream"""
+        self.current_cue = cue
+        self.pending = None
+        music_file = self.cues.get(cue)
+
+        if music_file is None:
+            self.stop(fade_ms)
+            return
+
+        # A newly loaded file always starts from the beginning
+        if self.ensure_loaded(music_file):
+            restart = True
+
+        if not restart:
+            if self.state == 'paused':
+                self.resume()
+                return
+            if self.state == 'playing':
+                return
+
+        # Replaying the loaded stream rewinds it without reopening the file
+        pygame.mixer.music.set_volume(self.volume)
+        pygame.mixer.music.play(-1, fade_ms=fade_ms)  # -1 means loop indefinitely
+        self.state = 'playing'
+
+    def pause(self):
+        """Pause the stream, keeping its position"""
+        if self.state == 'playing':
+            pygame.mixer.music.pause()
+            self.state = 'paused'
+
+    def resume(self):
+        """Resume a paused stream"""
+        if self.state == 'paused':
+            pygame.mixer.music.unpause()
+            self.state = 'playing'
+
+    def stop(self, fade_ms=0):
+        """Stop the stream, optionally fading it out; the file stays loaded"""
+        self.pending = None
+        if self.state == 'stopped':
+            return
+
+        if fade_ms > 0 and self.state == 'playing':
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+        self.state = 'stopped'
+
+    def set_volume(self, volume):
+        """Set the stream volume (0.0 to 1.0)"""
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
+
+    def update(self):
+        """Advance a pending transition; call once per frame"""
+        if self.state != 'fading':
+            return
+
+        # The fade-out is finished once the stream stops or its time is up
+        if pygame.mixer.music.get_busy() and pygame.time.get_ticks() < self.fade_deadline:
+            return
+
+        cue, fade_ms = self.pending
+        self.state = 'stopped'
+        self.start(cue, fade_ms)
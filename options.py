@@ -0,0 +1,21 @@
+"""
+Option Resolution for Tomb Bound
+Options chosen from a fixed list of names are looked up the same way everywhere: an
+environment variable first (for kiosks, benchmarks and headless runs), then the saved
+setting, then the default
+"""
+
+import os
+
+
+def resolve_option(env_var, setting, choices, default, label):
+    """Resolve an option from env_var, the saved setting or the default
+
+    Names are lower-cased; an unknown one is reported (as 'Unknown <label>') and
+    replaced by the default
+    """
+    value = (os.environ.get(env_var) or setting or default).lower()
+    if value not in choices:
+        print(f"Unknown {label} '{value}', using '{default}'")
+        value = default
+    return value
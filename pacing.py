@@ -0,0 +1,160 @@
+"""
+Frame Pacing for Tomb Bound
+Waits out the rest of each frame and records how evenly frames reach the screen.
+clock.tick sleeps in whole milliseconds and often oversleeps, which shows as judder in
+the constant-speed parallax scroll; the other modes trade CPU time for steadier frames:
+
+- 'tick': pygame's Clock.tick (sleeps; the cheapest)
+- 'busy': Clock.tick_busy_loop (spins for the whole wait; the most precise)
+- 'hybrid': sleeps until SPIN_MS before the frame is due, then spins the rest
+- 'vsync': presenting blocks until the display refreshes, with Clock.tick as a backstop
+  cap. Drivers may accept the vsync flag without honouring it, so the first frames are
+  checked: if they arrive well under a frame apart (no vsync, or a display refreshing
+  faster than the frame rate, which would speed up the per-frame motion), it falls
+  back to 'tick'
+"""
+
+import time
+from collections import deque
+import display_config
+from telemetry import telemetry
+from options import resolve_option
+
+# Set TOMB_BOUND_PACING to a mode to override the saved setting
+PACING_ENV_VAR = 'TOMB_BOUND_PACING'
+PACING_MODES = ['tick', 'busy', 'hybrid', 'vsync']
+DEFAULT_PACING = 'tick'
+
+SPIN_MS = 2.0          # Hybrid: time before the deadline spent spinning instead of sleeping
+DROP_FACTOR = 1.5      # A present interval this many frames long missed a frame
+HISTORY = 600          # Present intervals kept for the statistics
+VSYNC_PROBE_FRAMES = 30  # Presents checked before trusting vsync
+VSYNC_PROBE_CAP = 2.0    # While checking, cap at this many times the frame rate
+VSYNC_MIN_INTERVAL = 0.75  # Fraction of a frame the median interval must reach to keep vsync
+
+
+def pacing_mode(setting=None):
+    """Frame pacing mode, one of PACING_MODES"""
+    return resolve_option(PACING_ENV_VAR, setting, PACING_MODES, DEFAULT_PACING, 'frame pacing')
+
+
+def percentile(ordered, fraction):
+    """Value at a fraction of a sorted list"""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def missed_frames(interval, target):
+    """Frames that should have been presented during a long interval"""
+    return max(1, round(interval / target) - 1)
+
+
+class FramePacer:
+    def __init__(self, clock, mode=DEFAULT_PACING):
+        """Pace frames with a pygame Clock and keep present interval statistics"""
+        self.clock = clock
+        self.intervals = deque(maxlen=HISTORY)  # (interval, target) in seconds
+        self.last_present = None
+        self.deadline = None
+        self.presents = 0
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        if mode == 'vsync' and not display_config.vsync_requested:
+            print("Vsync pacing needs vsync on the display, using 'tick'")
+            mode = 'tick'
+        self.mode = mode
+        self.vsync_checked = False
+        self.deadline = None
+        self.reset()
+
+    def tick(self, fps):
+        """Wait until the next frame at this rate is due"""
+        if self.mode == 'tick':
+            self.clock.tick(fps)
+        elif self.mode == 'busy':
+            self.clock.tick_busy_loop(fps)
+        elif self.mode == 'vsync':
+            # Backstop in case presenting does not block; looser while vsync is being
+            # checked so that a display without it shows up as short intervals
+            self.clock.tick(fps if self.vsync_checked else fps * VSYNC_PROBE_CAP)
+        else:
+            self.wait_hybrid(1 / fps)
+            self.clock.tick()  # Keeps the clock's frame rate readout going
+
+    def wait_hybrid(self, frame_time):
+        """Sleep most of the way to the frame deadline, then spin to it"""
+        now = time.perf_counter()
+        if self.deadline is None or now - self.deadline > frame_time:
+            # First frame, or a whole frame late: start over instead of rushing to catch up
+            self.deadline = now
+        self.deadline += frame_time
+
+        sleep = self.deadline - now - SPIN_MS / 1000
+        if sleep > 0:
+            time.sleep(sleep)
+        while time.perf_counter() < self.deadline:
+            pass
+
+    def presented(self, fps):
+        """Record a finished frame; call right after presenting it"""
+        now = time.perf_counter()
+        if self.last_present is not None:
+            interval = now - self.last_present
+            target = 1 / fps
+            self.intervals.append((interval, target))
+            if interval > target * DROP_FACTOR:
+                telemetry.count('pacing.dropped', missed_frames(interval, target))
+        self.last_present = now
+        if self.mode == 'vsync' and not self.vsync_checked and len(self.intervals) >= VSYNC_PROBE_FRAMES:
+            self.check_vsync()
+
+        # Report alongside the frame telemetry when it is printed
+        self.presents += 1
+        if telemetry.enabled and self.presents % telemetry.report_interval == 0:
+            print(self.report())
+
+    def check_vsync(self):
+        """Keep vsync pacing only if presents really arrive about a frame apart"""
+        self.vsync_checked = True
+        median = percentile(sorted(interval / target for interval, target in self.intervals), 0.5)
+        if median < VSYNC_MIN_INTERVAL:
+            print(f"Presents arrive {median:.2f} frames apart with vsync pacing; "
+                  f"the display does not wait for a refresh at the frame rate, using 'tick'")
+            self.set_mode('tick')
+
+    def interrupt(self):
+        """The next interval is not paced (e.g. the game slept while idle); leave it out"""
+        self.last_present = None
+        self.deadline = None
+
+    def reset(self):
+        """Forget the recorded intervals"""
+        self.intervals.clear()
+        self.last_present = None
+
+    def stats(self):
+        """Interval and jitter (distance from the frame time) percentiles in ms, and dropped frames"""
+        if not self.intervals:
+            return None
+        intervals = sorted(interval * 1000 for interval, _ in self.intervals)
+        jitter = sorted(abs(interval - target) * 1000 for interval, target in self.intervals)
+        return {
+            'frames': len(self.intervals),
+            'interval_p50': percentile(intervals, 0.5),
+            'jitter_p50': percentile(jitter, 0.5),
+            'jitter_p95': percentile(jitter, 0.95),
+            'jitter_p99': percentile(jitter, 0.99),
+            'jitter_max': jitter[-1],
+            'dropped': sum(missed_frames(interval, target) for interval, target in self.intervals
+                           if interval > target * DROP_FACTOR)
+        }
+
+    def report(self):
+        """Format the statistics of the recorded intervals"""
+        stats = self.stats()
+        if stats is None:
+            return f"Frame pacing ({self.mode}): no frames recorded"
+        return (f"Frame pacing ({self.mode}) over {stats['frames']} frames: "
+                f"interval p50 {stats['interval_p50']:.2f} ms, jitter p50 {stats['jitter_p50']:.2f} ms, "
+                f"p95 {stats['jitter_p95']:.2f} ms, p99 {stats['jitter_p99']:.2f} ms, "
+                f"max {stats['jitter_max']:.2f} ms, dropped {stats['dropped']}")
@@ -0,0 +1,90 @@
+"""
+Parallax Compositing for Tomb Bound
+The background layers of a frame are composed into one of two world buffers on a
+worker thread while the main thread updates sprites and checks collisions
+"""
+
+import threading
+
+
+class ParallaxCompositor:
+    def __init__(self, buffers, backdrop_color, threaded=True):
+        """Compose parallax layers into two alternating world buffers (render layers)"""
+        self.buffers = buffers
+        self.backdrop_color = backdrop_color
+        self.index = 0        # Buffer of the frame being composed or drawn
+        self.pending = False  # A frame was submitted and not yet taken by result()
+
+        # Handoff: the main thread fills self.job and sets `requested`; the worker
+        # clears `finished` while it composes and sets it again when done
+        self.job = None
+        self.requested = threading.Event()
+        self.finished = threading.Event()
+        self.finished.set()
+
+        self.thread = None
+        if threaded:
+            self.thread = threading.Thread(target=self.work, name='parallax', daemon=True)
+            self.thread.start()
+
+    def compose(self, buffer, copies):
+        """Clear a buffer and blit the background copies, back to front"""
+        buffer.fill(self.backdrop_color)
+        buffer.blits(copies, doreturn=0)
+
+    def work(self):
+        """Worker loop: compose each submitted frame, until a None job arrives"""
+        while True:
+            self.requested.wait()
+            self.requested.clear()
+            job = self.job
+            if job is None:
+                self.finished.set()
+                return
+            self.compose(*job)
+            self.finished.set()
+
+    def submit(self, copies):
+        """Start composing the next frame from a list of (image, position) copies
+
+        The list is built on the main thread right after the backgrounds move, so the
+        worker never reads positions that are still changing
+        """
+        self.finished.wait()  # Only one frame is ever in flight
+        self.index ^= 1
+        buffer = self.buffers[self.index]
+        self.pending = True
+
+        if self.thread is None:
+            self.compose(buffer, copies)
+            return
+
+        self.job = (buffer, copies)
+        self.finished.clear()
+        self.requested.set()
+
+    def result(self, build_copies):
+        """Get the world buffer with this frame's backgrounds, ready for sprites
+
+        Waits for the submitted frame; frames that did not move the backgrounds
+        (game over, pause) are composed here from the copies build_copies() returns,
+        which is only called for them
+        """
+        if not self.pending:
+            self.finished.wait()
+            self.index ^= 1
+            self.compose(self.buffers[self.index], build_copies())
+            return self.buffers[self.index]
+
+        self.finished.wait()
+        self.pending = False
+        return self.buffers[self.index]
+
+    def stop(self):
+        """Let the worker finish its frame and exit"""
+        if self.thread is not None:
+            self.finished.wait()
+            self.job = None
+            self.requested.set()
+            self.thread.join()
+            self.thread = None
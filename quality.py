@@ -0,0 +1,195 @@
+"""
+Graphics Quality for Tomb Bound
+Effect detail comes from a graphics preset saved in the settings: 'high', 'medium' or
+'low' fix a quality level, 'custom' takes its values from the 'graphics_custom' setting,
+and 'auto' adapts. All motion in the game is per frame, so a frame that takes longer
+than its budget slows the whole game down; in 'auto' the controller watches how long
+recent frames took and steps the level down when they run over the budget and back
+up when there is headroom again
+"""
+
+from collections import deque
+import display_config
+from options import resolve_option
+
+# Set TOMB_BOUND_QUALITY to a preset name to override the saved preset
+QUALITY_ENV_VAR = 'TOMB_BOUND_QUALITY'
+PRESETS = ['auto', 'high', 'medium', 'low', 'custom']
+DEFAULT_PRESET = 'auto'
+
+# Quality levels from best to cheapest
+QUALITY_LEVELS = [
+    {
+        'name': 'high',
+        'glow_rings': 10,               # Glow rings drawn around the menu and game over titles
+        'title_particle_interval': 5,   # Frames between menu title particle bursts
+        'game_over_particles': 30,      # Dust particles on the game over screen
+        'spark_count': 15,              # Particles per destroyed trap
+        'debris_chips': 20,             # Loose chips thrown off a crumbling player
+        'dust_cap': 200,                # Most dust particles alive while crumbling
+        'crack_depth': 3,               # Branching depth of the crack patterns drawn
+        'pause_title_pulse': True,      # Pulse the pause title through its scaled frames
+        'dropped_layers': [],           # Parallax layers that are not drawn
+        'render_resolution': 'high',    # Internal resolution (display_config presets; needs a restart)
+        'fps_cap': 60                   # Frame rate cap; motion is per frame, so lower caps slow the game
+    },
+    {
+        'name': 'medium',
+        'glow_rings': 5,
+        'title_particle_interval': 10,
+        'game_over_particles': 20,
+        'spark_count': 10,
+        'debris_chips': 10,
+        'dust_cap': 80,
+        'crack_depth': 2,
+        'pause_title_pulse': True,
+        'dropped_layers': [],
+        'render_resolution': 'medium',
+        'fps_cap': 60
+    },
+    {
+        'name': 'low',
+        'glow_rings': 2,
+        'title_particle_interval': 20,
+        'game_over_particles': 10,
+        'spark_count': 6,
+        'debris_chips': 0,
+        'dust_cap': 30,
+        'crack_depth': 1,
+        'pause_title_pulse': False,
+        'dropped_layers': ['background2'],
+        'render_resolution': 'low',
+        'fps_cap': 60
+    }
+]
+
+# Frame time window and hysteresis: step down when the window's mean work time is over
+# the budget, step up only after several windows in a row well under it
+WINDOW_FRAMES = 60
+DOWNGRADE_AT = 1.0      # Fraction of the budget
+UPGRADE_AT = 0.6        # Fraction of the budget
+UPGRADE_WINDOWS = 3     # Calm windows in a row before stepping up
+
+
+def custom_value(key, value, default):
+    """Coerce a custom quality value to the type of the high level's value, or raise ValueError"""
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ValueError("expected true or false")
+        return value
+    if isinstance(default, int):
+        if isinstance(value, bool):
+            raise ValueError("expected a number")
+        value = int(value)
+        # Counts can be zero; the frame rate cap has to be at least 1
+        lowest = 1 if key == 'fps_cap' else 0
+        if value < lowest:
+            print(f"Custom quality setting '{key}' raised from {value} to {lowest}")
+            value = lowest
+        return value
+    if isinstance(default, list):
+        if not isinstance(value, list):
+            raise ValueError("expected a list")
+        return [str(item) for item in value]
+    if key == 'render_resolution':
+        # A preset name, 'native', 'WIDTHxHEIGHT' or [width, height]
+        name = str(value).strip().lower()
+        if name in display_config.RESOLUTION_PRESETS or name == 'native':
+            return name
+        return list(display_config.resolution_size(value))
+    return str(value)
+
+
+def quality_preset(setting=None):
+    """Graphics preset, one of PRESETS"""
+    return resolve_option(QUALITY_ENV_VAR, setting, PRESETS, DEFAULT_PRESET, 'graphics preset')
+
+
+class QualitySettings:
+    def __init__(self, values):
+        """Resolved values of a quality level as attributes (settings.spark_count, ...)
+
+        Effects keep the game's one instance from their construction on; it is
+        updated in place whenever the level changes
+        """
+        self.apply(values)
+
+    def apply(self, values):
+        self.__dict__.update(values)
+
+
+class QualityController:
+    def __init__(self, preset=DEFAULT_PRESET, custom=None, levels=QUALITY_LEVELS):
+        """Resolve a graphics preset into quality settings, adapting them in 'auto'"""
+        self.levels = levels
+        self.names = [level['name'] for level in levels]
+        self.settings = QualitySettings(levels[0])
+        self.frame_times = deque(maxlen=WINDOW_FRAMES)
+        self.transitions = 0
+        self.configure(preset, custom)
+
+    @property
+    def name(self):
+        return self.settings.name
+
+    def configure(self, preset, custom=None):
+        """Switch to a preset; 'custom' overrides the high level with the given values"""
+        self.preset = preset
+        self.adaptive = preset == 'auto'
+        if preset == 'custom':
+            self.index = 0
+            values = dict(self.levels[0], name='custom')
+            for key, value in (custom or {}).items():
+                if key not in values or key == 'name':
+                    print(f"Unknown custom quality setting '{key}'")
+                    continue
+                try:
+                    values[key] = custom_value(key, value, values[key])
+                except (TypeError, ValueError) as e:
+                    print(f"Ignoring custom quality setting '{key}' = {value!r}: {e}")
+            self.settings.apply(values)
+        else:
+            self.index = 0 if self.adaptive else self.names.index(preset)
+            self.settings.apply(self.levels[self.index])
+
+        self.budget_ms = 1000 / self.settings.fps_cap
+        self.frame_times.clear()
+        self.calm_windows = 0
+
+    def set_level(self, name, reason=None):
+        """Switch to a level by name and log the transition"""
+        index = self.names.index(name)
+        if index == self.index and self.settings.name == name:
+            return
+        print(f"Quality {self.name} -> {name}" + (f" ({reason})" if reason else ""))
+        self.index = index
+        self.settings.apply(self.levels[index])
+        self.transitions += 1
+        self.frame_times.clear()
+        self.calm_windows = 0
+
+    def frame(self, work_ms):
+        """Record how long a frame took to update and draw (without the frame rate wait)"""
+        if not self.adaptive:
+            return
+        self.frame_times.append(work_ms)
+        if len(self.frame_times) < WINDOW_FRAMES:
+            return
+
+        mean = sum(self.frame_times) / len(self.frame_times)
+        reason = f"mean frame {mean:.1f} ms over {len(self.frame_times)} frames, budget {self.budget_ms:.1f} ms"
+        if mean > self.budget_ms * DOWNGRADE_AT and self.index < len(self.levels) - 1:
+            self.set_level(self.names[self.index + 1], reason)
+        elif mean < self.budget_ms * UPGRADE_AT and self.index > 0:
+            # A window's worth of fast frames; only step up after several in a row
+            self.calm_windows += 1
+            self.frame_times.clear()
+            if self.calm_windows >= UPGRADE_WINDOWS:
+                self.set_level(self.names[self.index - 1], reason)
+        else:
+            self.calm_windows = 0
+            self.frame_times.clear()
+
+
+# Global controller shared by the game and its effects (configured from the settings at startup)
+quality = QualityController()
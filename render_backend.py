@@ -0,0 +1,274 @@
+"""
+Render Backends for Tomb Bound
+Drawing code talks to a renderer with surface-style calls (blit, fill, ...).
+The surface renderer blits onto the display surface in software; the texture
+renderer uploads each image once as an SDL texture and composes with texture copies
+"""
+
+import pygame
+import os
+import weakref
+from telemetry import telemetry
+
+# The SDL2 renderer bindings are optional; without them only the surface renderer exists
+try:
+    from pygame._sdl2 import video
+    from pygame._sdl2.sdl2 import error as SDLError
+except ImportError:
+    video = None
+    SDLError = pygame.error
+
+# Environment variable used to pick a backend ('surface' or 'texture')
+BACKEND_ENV_VAR = 'TOMB_BOUND_RENDERER'
+DEFAULT_BACKEND = 'surface'
+
+# SDL texture blend modes
+BLENDMODE_NONE = 0
+BLENDMODE_BLEND = 1
+BLENDMODE_ADD = 2
+BLENDMODE_MOD = 4
+
+# Surface blit flags the texture renderer can reproduce with a texture blend mode
+SPECIAL_FLAG_BLEND_MODES = {
+    pygame.BLEND_ADD: BLENDMODE_ADD,
+    pygame.BLEND_MULT: BLENDMODE_MOD
+}
+
+
+class SurfaceRenderer:
+    name = 'surface'
+
+    def __init__(self, surface):
+        """Draw with software blits onto a surface (the display, or an offscreen layer)"""
+        self.surface = surface
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def get_width(self):
+        return self.surface.get_width()
+
+    def get_height(self):
+        return self.surface.get_height()
+
+    def get_rect(self, **kwargs):
+        return self.surface.get_rect(**kwargs)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Draw a surface or a layer of this renderer"""
+        if isinstance(source, SurfaceRenderer):
+            source = source.surface
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        """Draw many surfaces at once (lets sprite groups draw straight onto the renderer)"""
+        return self.surface.blits(blit_sequence, doreturn)
+
+    def fill(self, color, rect=None):
+        return self.surface.fill(color, rect)
+
+    def draw_shape(self, function, *args, **kwargs):
+        """Draw a pygame.draw primitive, e.g. draw_shape(pygame.draw.circle, color, center, radius)"""
+        return function(self.surface, *args, **kwargs)
+
+    def create_layer(self, size):
+        """Offscreen layer with the same interface, drawn onto this renderer with blit()"""
+        return SurfaceRenderer(pygame.Surface(size).convert())
+
+    def capture(self, surface):
+        """Copy everything drawn so far into a surface of the same size"""
+        surface.blit(self.surface, (0, 0))
+
+    def refresh(self, image):
+        """Note that an image's pixels changed after it was drawn (surfaces need nothing)"""
+
+    def present(self):
+        pygame.display.flip()
+
+
+class TextureContext:
+    def __init__(self, renderer):
+        """SDL renderer state shared by the screen and its layers"""
+        self.renderer = renderer
+        self.target = None  # Layer the renderer is currently drawing into
+
+        # Textures uploaded from surfaces: surface -> (texture, has per-pixel alpha);
+        # an entry goes away when its surface is freed
+        self.textures = weakref.WeakKeyDictionary()
+
+    def get_texture(self, image):
+        """Get the texture for a surface, uploading it the first time it is drawn"""
+        entry = self.textures.get(image)
+        if entry is None:
+            texture = video.Texture.from_surface(self.renderer, image)
+            blended = bool(image.get_flags() & pygame.SRCALPHA) or image.get_colorkey() is not None
+            entry = self.textures[image] = (texture, blended)
+            telemetry.count('textures.uploaded')
+        return entry
+
+
+class TextureRenderer:
+    name = 'texture'
+
+    def __init__(self, context, size):
+        """Compose into a target texture (the frame, or an offscreen layer) with texture copies"""
+        self.context = context
+        self.size = tuple(size)
+        self.texture = video.Texture(context.renderer, self.size, target=True)
+
+        # pygame.draw primitives are drawn into a transparent surface and copied over
+        # whenever something else is drawn, so the drawing order is kept
+        self.shapes = None
+        self.shapes_texture = None
+        self.shapes_dirty = None
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def bind(self):
+        """Point the SDL renderer at this layer and draw any pending primitives first"""
+        context = self.context
+        if context.target is not self:
+            context.renderer.target = self.texture
+            context.target = self
+        if self.shapes_dirty is not None:
+            self.flush_shapes()
+
+    def flush_shapes(self):
+        """Copy the part of the primitives surface drawn since the last flush"""
+        rect = self.shapes_dirty.clip(self.shapes.get_rect())
+        self.shapes_dirty = None
+        if rect.width and rect.height:
+            self.shapes_texture.update(self.shapes.subsurface(rect), rect)
+            self.shapes_texture.draw(rect, rect)
+            self.shapes.fill((0, 0, 0, 0), rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Draw a surface (uploaded once) or a layer of this renderer"""
+        if isinstance(source, TextureRenderer):
+            source.bind()  # Finish the layer's own primitives before it is copied
+            texture = source.texture
+            blended = False
+            alpha = 255
+        else:
+            texture, blended = self.context.get_texture(source)
+            alpha = source.get_alpha()
+            if alpha is None:
+                alpha = 255
+        self.bind()
+
+        blend_mode = SPECIAL_FLAG_BLEND_MODES.get(special_flags)
+        if blend_mode is None:
+            blend_mode = BLENDMODE_BLEND if blended or alpha < 255 else BLENDMODE_NONE
+        texture.blend_mode = blend_mode
+        texture.alpha = alpha
+
+        x, y = dest[0], dest[1]
+        if area is None:
+            texture.draw(None, (x, y))
+            return pygame.Rect(x, y, texture.width, texture.height)
+        area = pygame.Rect(area).clip(texture.get_rect())
+        rect = pygame.Rect(x, y, area.width, area.height)
+        texture.draw(area, rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*args) for args in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None):
+        self.bind()
+        renderer = self.context.renderer
+        renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            renderer.clear()
+            return self.get_rect()
+        rect = pygame.Rect(rect)
+        renderer.fill_rect(rect)
+        return rect
+
+    def draw_shape(self, function, *args, **kwargs):
+        """Draw a pygame.draw primitive, e.g. draw_shape(pygame.draw.circle, color, center, radius)"""
+        if self.shapes is None:
+            self.shapes = pygame.Surface(self.size, pygame.SRCALPHA)
+            self.shapes_texture = video.Texture(self.context.renderer, self.size, streaming=True)
+            self.shapes_texture.blend_mode = BLENDMODE_BLEND
+        rect = function(self.shapes, *args, **kwargs)
+        self.shapes_dirty = rect if self.shapes_dirty is None else self.shapes_dirty.union(rect)
+        return rect
+
+    def create_layer(self, size):
+        return TextureRenderer(self.context, size)
+
+    def capture(self, surface):
+        """Read everything drawn so far back into a surface of the same size"""
+        self.bind()
+        self.context.renderer.to_surface(surface)
+        self.refresh(surface)
+
+    def refresh(self, image):
+        """Re-upload an image whose pixels changed after it was drawn"""
+        self.context.textures.pop(image, None)
+
+    def present(self):
+        """Copy the finished frame to the window"""
+        self.bind()
+        context = self.context
+        context.renderer.target = None
+        context.target = None
+        self.texture.blend_mode = BLENDMODE_NONE
+        self.texture.draw()
+        context.renderer.present()
+
+
+def create_texture_renderer(window):
+    """Texture renderer on the SDL renderer pygame created for the SCALED window"""
+    renderer = video.Renderer.from_window(video.Window.from_display_module())
+    return TextureRenderer(TextureContext(renderer), window.get_size())
+
+
+BACKENDS = {
+    'surface': SurfaceRenderer,
+    'texture': create_texture_renderer
+}
+
+
+def backend_name(backend=None):
+    """Resolve a backend name from the argument, the environment or the default"""
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV_VAR, DEFAULT_BACKEND)
+    return backend.lower()
+
+
+def create_renderer(window, backend=None):
+    """Create the renderer that draws to the window (the display surface from set_mode)"""
+    name = backend_name(backend)
+    if name not in BACKENDS:
+        print(f"Unknown render backend '{name}', using '{DEFAULT_BACKEND}'")
+        name = DEFAULT_BACKEND
+
+    if name == 'texture':
+        if video is None:
+            print("pygame._sdl2 is not available, using the surface renderer")
+            name = DEFAULT_BACKEND
+        else:
+            try:
+                return create_texture_renderer(window)
+            except (pygame.error, SDLError) as e:
+                # e.g. a window opened without SCALED has no SDL renderer to share
+                print(f"Could not create the texture renderer: {e}")
+                name = DEFAULT_BACKEND
+
+    return BACKENDS[name](window)
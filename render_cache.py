@@ -0,0 +1,76 @@
+"""
+Render Caches for Tomb Bound
+Surfaces that are expensive to create are built once and reused between frames
+"""
+
+import pygame
+from telemetry import telemetry
+from surface_format import display_format
+
+
+class OverlayCache:
+    def __init__(self):
+        """Cache of full-screen tinted layers keyed by size, color and alpha"""
+        self.overlays = {}
+
+    def get(self, size, color, alpha):
+        """Get a tinted overlay, creating it only the first time it is needed"""
+        key = (size, color, alpha)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            # An opaque surface with surface alpha blends faster than a per-pixel alpha one
+            overlay = pygame.Surface(size).convert()
+            overlay.fill(color)
+            overlay.set_alpha(alpha)
+            self.overlays[key] = overlay
+            telemetry.count('surfaces.overlay_created')
+        return overlay
+
+    def blit(self, surface, color, alpha):
+        """Tint a whole surface with a cached overlay"""
+        surface.blit(self.get(surface.get_size(), color, alpha), (0, 0))
+        telemetry.count('overlay.blits')
+
+    def clear(self):
+        """Drop every cached overlay (e.g. after the screen size changes)"""
+        self.overlays.clear()
+
+
+class ScaledFrames:
+    def __init__(self, surface, min_scale, max_scale, steps=12):
+        """Smoothscale a surface once at evenly spaced scales between min_scale and max_scale"""
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.frames = []
+
+        width, height = surface.get_size()
+        for i in range(steps):
+            scale = min_scale + (max_scale - min_scale) * i / (steps - 1)
+            size = (int(width * scale), int(height * scale))
+            self.frames.append(pygame.transform.smoothscale(surface, size))
+        telemetry.count('surfaces.scaled_frames', steps)
+
+    def get(self, scale):
+        """Get the precomputed frame closest to a scale"""
+        position = (scale - self.min_scale) / (self.max_scale - self.min_scale)
+        index = round(position * (len(self.frames) - 1))
+        return self.frames[max(0, min(len(self.frames) - 1, index))]
+
+
+class ParticleSprites:
+    def __init__(self):
+        """Cache of round particles keyed by size and color, faded with surface alpha when drawn"""
+        self.sprites = {}
+
+    def get(self, size, color, alpha):
+        """Get a particle of a radius and color, set to an alpha for the next blit"""
+        key = (size, color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            sprite = display_format(sprite)
+            self.sprites[key] = sprite
+            telemetry.count('surfaces.particle_created')
+        sprite.set_alpha(alpha)
+        return sprite
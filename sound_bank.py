@@ -0,0 +1,192 @@
+"""
+Sound Bank for Tomb Bound
+Caches decoded sound effects on disk and plays them on reserved mixer channels
+"""
+
+import pygame
+import os
+import json
+
+# Directory used to store decoded PCM data between runs
+CACHE_DIR = os.path.join('audio', 'cache')
+
+# Number of mixer channels reserved for each sound category
+CATEGORY_CHANNELS = {
+    'game': 3,    # Hurt, death and game over can overlap
+    'player': 1,  # Player action sounds
+    'menu': 2     # Menu navigation sounds
+}
+
+# Sound effects to load: name -> (category, file name)
+SOUND_FILES = {
+    'hurt': ('game', 'hurtsound.mp3'),
+    'death': ('game', 'mandeathsound.mp3'),
+    'game_over': ('game', 'gameover.mp3')
+}
+
+
+class SoundHandle:
+    """A sound resolved to its mixer channel, ready to play without lookups"""
+    __slots__ = ('name', 'sound', 'channel', 'bank')
+
+    def __init__(self, name, sound, channel, bank):
+        self.name = name
+        self.sound = sound
+        self.channel = channel
+        self.bank = bank
+
+    def play(self):
+        """Play the sound on its reserved channel"""
+        if self.bank.enabled:
+            self.channel.play(self.sound)
+
+    def stop(self):
+        """Stop the sound if it is playing"""
+        self.channel.stop()
+
+
+class NullSoundHandle:
+    """Handle for a sound that is not available; playing it does nothing"""
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def play(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class SoundBank:
+    def __init__(self, audio_dir='audio', cache_dir=CACHE_DIR, volume=0.7):
+        """Create an empty sound bank; call load() once the mixer is initialized"""
+        self.audio_dir = audio_dir
+        self.cache_dir = cache_dir
+        self.volume = volume
+        self.enabled = True
+
+        # Loaded sounds by name and by category
+        self.sounds = {}
+        self.categories = {category: {} for category in CATEGORY_CHANNELS}
+
+        # Pre-resolved handles by name
+        self.handles = {}
+
+        # Reserved channels per category and the next channel to hand out
+        self.channels = {}
+        self.next_channel = {}
+
+        # Load statistics for the last load() call
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def reserve_channels(self):
+        """Reserve dedicated mixer channels for each sound category"""
+        reserved = sum(CATEGORY_CHANNELS.values())
+
+        # Keep the default channels available for unreserved playback
+        if pygame.mixer.get_num_channels() < reserved + 8:
+            pygame.mixer.set_num_channels(reserved + 8)
+        pygame.mixer.set_reserved(reserved)
+
+        # Hand out reserved channel ids in category order
+        channel_id = 0
+        for category, count in CATEGORY_CHANNELS.items():
+            self.channels[category] = [pygame.mixer.Channel(channel_id + i) for i in range(count)]
+            self.next_channel[category] = 0
+            channel_id += count
+
+    def load(self, sound_files=SOUND_FILES):
+        """Load all sound effects, using decoded PCM from the cache when possible"""
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        if not self.channels:
+            self.reserve_channels()
+
+        for name, (category, file_name) in sound_files.items():
+            path = os.path.join(self.audio_dir, file_name)
+            if not os.path.exists(path):
+                continue
+
+            try:
+                sound = self.load_sound(name, path)
+            except pygame.error as e:
+                print(f"Could not load {name} sound: {e}")
+                continue
+
+            sound.set_volume(self.volume)
+            self.sounds[name] = sound
+            self.categories[category][name] = sound
+            self.handles[name] = SoundHandle(name, sound, self.assign_channel(category), self)
+            print(f"{name.replace('_', ' ').capitalize()} sound loaded: {path}")
+
+    def load_sound(self, name, path):
+        """Load one sound from the PCM cache, decoding and caching it on a miss"""
+        cache_path = os.path.join(self.cache_dir, f'{name}.pcm')
+        key = self.cache_key(path)
+
+        # Warm start: reuse the decoded samples if the source and mixer format match
+        raw = self.read_cache(cache_path, key)
+        if raw is not None:
+            self.cache_hits += 1
+            return pygame.mixer.Sound(buffer=raw)
+
+        # Cold start: decode the MP3 and store the samples for next time
+        self.cache_misses += 1
+        sound = pygame.mixer.Sound(path)
+        self.write_cache(cache_path, key, sound.get_raw())
+        return sound
+
+    def cache_key(self, path):
+        """Describe the source file and mixer format the cached samples depend on"""
+        stat = os.stat(path)
+        return {
+            'source': os.path.basename(path),
+            'size': stat.st_size,
+            'mtime': int(stat.st_mtime),
+            'mixer': list(pygame.mixer.get_init() or ())
+        }
+
+    def read_cache(self, cache_path, key):
+        """Return cached raw samples, or None if the cache is missing or stale"""
+        try:
+            with open(cache_path, 'rb') as f:
+                header = json.loads(f.readline())
+                if header != key:
+                    return None
+                return f.read()
+        except (OSError, ValueError):
+            return None
+
+    def write_cache(self, cache_path, key, raw):
+        """Store raw samples with a one-line JSON header describing them"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(json.dumps(key).encode() + b'\n')
+                f.write(raw)
+        except OSError as e:
+            print(f"Could not write sound cache {cache_path}: {e}")
+
+    def assign_channel(self, category):
+        """Pick the next reserved channel of a category for a new handle"""
+        channels = self.channels[category]
+        index = self.next_channel[category]
+        self.next_channel[category] = (index + 1) % len(channels)
+        return channels[index]
+
+    def get_handle(self, name):
+        """Get the handle for a sound, or a silent handle if it is not loaded"""
+        handle = self.handles.get(name)
+        if handle is None:
+            return NullSoundHandle(name)
+        return handle
+
+    def set_volume(self, volume):
+        """Set the volume of every loaded sound"""
+        self.volume = volume
+        for sound in self.sounds.values():
+            sound.set_volume(volume)
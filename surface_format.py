@@ -0,0 +1,111 @@
+"""
+Surface Formats for Tomb Bound
+Long-lived surfaces are converted to the display's pixel format once after they are
+created, so blitting them never converts pixels on the way. Set
+TOMB_BOUND_FORMAT_AUDIT=1 to report surfaces that still reach the renderer in
+another format, with the line that drew them
+"""
+
+import pygame
+import os
+import sys
+import atexit
+from collections import Counter
+
+# Set TOMB_BOUND_FORMAT_AUDIT=1 to wrap the renderer in a FormatAudit
+AUDIT_ENV_VAR = 'TOMB_BOUND_FORMAT_AUDIT'
+
+# Frames in these files are skipped when looking for the line that drew a surface
+PYGAME_DIR = os.path.dirname(pygame.__file__)
+SKIPPED_FILES = (os.path.abspath(__file__), os.path.join(os.path.dirname(os.path.abspath(__file__)), 'render_backend.py'))
+
+
+def display_format(surface):
+    """Convert a surface to the display's format, keeping per-pixel alpha if it has any"""
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def format_key(surface):
+    return surface.get_bitsize(), surface.get_masks()
+
+
+def describe_format(surface):
+    """Short description of a surface's pixel format, e.g. '32-bit ARGB (per-pixel alpha)'"""
+    bits = surface.get_bitsize()
+    if bits == 8:
+        return '8-bit palette'
+    masks = surface.get_masks()
+    order = ''.join(name for mask, name in sorted(zip(masks, 'RGBA'), reverse=True) if mask)
+    alpha = ' (per-pixel alpha)' if masks[3] else ''
+    return f"{bits}-bit {order}{alpha}"
+
+
+class FormatAudit:
+    def __init__(self, renderer, sightings=None):
+        """Renderer wrapper that reports sources whose format differs from the display"""
+        self.renderer = renderer
+
+        # Formats a blit can copy without converting: the display's, and convert_alpha()'s
+        display = pygame.display.get_surface()
+        alpha = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        self.display_formats = {format_key(display), format_key(alpha)}
+
+        # (call site, format) -> number of blits; shared with the renderer's layers
+        self.sightings = sightings if sightings is not None else Counter()
+
+    def __getattr__(self, name):
+        return getattr(self.renderer, name)
+
+    def check(self, source):
+        """Record a source surface that is not in a display format"""
+        if format_key(source) in self.display_formats:
+            return
+        key = (call_site(), describe_format(source), source.get_size())
+        if key not in self.sightings:
+            print(f"Format audit: {key[1]} surface {key[2]} drawn at {key[0]}")
+        self.sightings[key] += 1
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if isinstance(source, FormatAudit):
+            source = source.renderer
+        elif isinstance(source, pygame.Surface):
+            self.check(source)
+        return self.renderer.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        for args in blit_sequence:
+            self.check(args[0])
+        return self.renderer.blits(blit_sequence, doreturn)
+
+    def create_layer(self, size):
+        return FormatAudit(self.renderer.create_layer(size), self.sightings)
+
+    def report(self):
+        """Format every mismatching call site with its blit count, most frequent first"""
+        lines = [f"Format audit: {len(self.sightings)} call sites blit surfaces in another format"]
+        for (site, description, size), count in self.sightings.most_common():
+            lines.append(f"  {count:7d}  {description} {size}  {site}")
+        return "\n".join(lines)
+
+
+def call_site():
+    """'file:line (function)' of the game code that made the current blit"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if not (filename.startswith(PYGAME_DIR) or filename in SKIPPED_FILES):
+            return f"{os.path.basename(filename)}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return '?'
+
+
+def audit(renderer):
+    """Wrap a renderer in a FormatAudit when TOMB_BOUND_FORMAT_AUDIT is set"""
+    if os.environ.get(AUDIT_ENV_VAR, '') in ('', '0'):
+        return renderer
+    audited = FormatAudit(renderer)
+    atexit.register(lambda: print(audited.report()))
+    return audited
@@ -0,0 +1,62 @@
+"""
+Frame Telemetry for Tomb Bound
+Counts per-frame events such as surface allocations and cache rebuilds,
+and reports their averages per frame
+"""
+
+import os
+from collections import Counter
+
+# Set TOMB_BOUND_TELEMETRY=1 to print a report every REPORT_INTERVAL frames
+ENV_VAR = 'TOMB_BOUND_TELEMETRY'
+REPORT_INTERVAL = 600
+
+
+class FrameTelemetry:
+    def __init__(self, enabled=None, report_interval=REPORT_INTERVAL):
+        """Create a telemetry collector; printing follows TOMB_BOUND_TELEMETRY by default"""
+        if enabled is None:
+            enabled = os.environ.get(ENV_VAR, '') not in ('', '0')
+        self.enabled = enabled
+        self.report_interval = report_interval
+
+        # Counts for the frame in progress and totals since the last reset
+        self.frame_counts = Counter()
+        self.totals = Counter()
+        self.frames = 0
+
+    def count(self, name, amount=1):
+        """Record an event for the current frame"""
+        self.frame_counts[name] += amount
+
+    def end_frame(self):
+        """Fold the current frame into the totals; call once per frame after drawing"""
+        self.totals.update(self.frame_counts)
+        self.frame_counts.clear()
+        self.frames += 1
+
+        if self.enabled and self.frames % self.report_interval == 0:
+            print(self.report())
+
+    def per_frame(self, name):
+        """Average count of an event per frame since the last reset"""
+        if self.frames == 0:
+            return 0.0
+        return self.totals[name] / self.frames
+
+    def report(self):
+        """Format the per-frame averages of every recorded event"""
+        lines = [f"Frame telemetry over {self.frames} frames:"]
+        for name in sorted(self.totals):
+            lines.append(f"  {name}: {self.totals[name]} total, {self.per_frame(name):.3f}/frame")
+        return "\n".join(lines)
+
+    def reset(self):
+        """Forget all recorded events"""
+        self.frame_counts.clear()
+        self.totals.clear()
+        self.frames = 0
+
+
+# Global instance shared by every module
+telemetry = FrameTelemetry()
@@ -4,7 +4,25 @@ import sys
 import os
 import json
 import math
+import time
 import audio_manager  # Import our custom audio manager
+import audio_backend
+import display_config
+import render_backend
+import surface_format
+from surface_format import display_format
+from render_cache import OverlayCache, ScaledFrames
+from parallax import ParallaxCompositor
+from viewport import Viewport
+from quality import quality, quality_preset, PRESETS, QUALITY_LEVELS
+from lighting import TorchLighting, lighting_quality, next_quality
+from idle import IdlePolicy, idle_setting
+from pacing import FramePacer, pacing_mode
+from capture import FrameRecorder, capture_format, capture_directory
+from telemetry import telemetry
+
+# Keep pygame.init() off the audio device when the null audio backend is selected
+audio_backend.configure_environment()
 
 # Initialize pygame
 pygame.init()
@@ -13,14 +31,32 @@ pygame.font.init()
 # Initialize audio manager
 audio = audio_manager.initialize()
 
+# Pre-resolved menu sound handles
+click_sound = audio.get_handle('click')
+hover_sound = audio.get_handle('hover')
+
 # Import game components
 from game_over_screen import GameOverScreen
+from crack_library import crack_library
 from enhanced_title import EnhancedTitle
 
+# Graphics preset: TOMB_BOUND_QUALITY, the 'graphics_preset' setting, or 'auto'
+display_settings = display_config.read_settings()
+quality.configure(quality_preset(display_settings.get('graphics_preset')), display_settings.get('graphics_custom'))
+
+# Internal render resolution: TOMB_BOUND_RESOLUTION, the 'render_resolution' setting,
+# the graphics preset's resolution, or 1024x600
+SCREEN_WIDTH, SCREEN_HEIGHT = display_config.render_resolution(display_settings, quality.settings.render_resolution)
+
+# Layout values are written for the 1024x600 reference screen and scaled by height with px()
+UI_SCALE = display_config.ui_scale(SCREEN_HEIGHT)
+
+def px(value):
+    """Scale a reference length to the internal resolution"""
+    return display_config.scaled(value, UI_SCALE)
+
 # Constants
-SCREEN_WIDTH = 1024
-SCREEN_HEIGHT = 600
-GROUND_HEIGHT = 560  # Further adjusted to ensure character and traps touch the ground
+GROUND_HEIGHT = SCREEN_HEIGHT - px(40)  # Further adjusted to ensure character and traps touch the ground
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 GRAY = (100, 100, 100)
@@ -28,27 +64,46 @@ DARK_GRAY = (50, 50, 50)
 LIGHT_BLUE = (173, 216, 230)
 LIGHT_GRAY = (200, 200, 200)
 HIGHLIGHT_COLOR = (255, 215, 0)  # Gold color for highlighting
+BACKDROP_COLOR = (50, 50, 80)  # Dark blue-gray behind the menu and the game world
 FPS = 60
+MUSIC_FADE_MS = 800  # Fade time for music cue transitions
+
+# Render layers, drawn from back to front
+LAYER_BACKGROUND = 0  # Parallax layers, drawn by Background.draw
+LAYER_TRAPS = 1
+LAYER_PLAYER = 2
+LAYER_EFFECTS = 3
+LAYER_HUD = 4
 
 # Set all text to use white color
 TEXT_COLOR = WHITE
 TEXT_SHADOW_COLOR = DARK_GRAY
 
-# Create the screen
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# Create the window, presented scaled to the display (and fullscreen if the setting asks for it)
+window = display_config.open_window((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                    fullscreen=display_settings.get('fullscreen', False),
+                                    vsync=display_settings.get('vsync', True))
+
+# Everything is drawn through the renderer picked by TOMB_BOUND_RENDERER ('surface' or 'texture');
+# it takes the same blit/fill calls as a surface
+# (wrapped in a pixel format audit when TOMB_BOUND_FORMAT_AUDIT=1)
+screen = surface_format.audit(render_backend.create_renderer(window))
 pygame.display.set_caption("Tomb Bound")
+
+# Visible area the effects cull their particles against
+viewport = Viewport(SCREEN_WIDTH, SCREEN_HEIGHT)
 clock = pygame.time.Clock()
 
 # Load fonts
 try:
-    title_font = pygame.font.Font(None, 60)  # Larger font for titles
-    main_font = pygame.font.Font(None, 36)   # Main font for most text
-    score_font = pygame.font.Font(None, 26)  # Smaller font for scores
+    title_font = pygame.font.Font(None, px(60))  # Larger font for titles
+    main_font = pygame.font.Font(None, px(36))   # Main font for most text
+    score_font = pygame.font.Font(None, px(26))  # Smaller font for scores
 except:
     # Fallback to system font if custom font loading fails
-    title_font = pygame.font.SysFont('Arial', 60)
-    main_font = pygame.font.SysFont('Arial', 36)
-    score_font = pygame.font.SysFont('Arial', 26)
+    title_font = pygame.font.SysFont('Arial', px(60))
+    main_font = pygame.font.SysFont('Arial', px(36))
+    score_font = pygame.font.SysFont('Arial', px(26))
 
 # Function to render text with border
 def render_text_with_border(font, text, text_color, border_color):
@@ -85,6 +140,9 @@ class Button:
         self.target_scale = 1.0
         self.scale_speed = 0.05
         
+        # Rendered button faces by (text, hovered, width, height)
+        self.faces = {}
+        
     def update(self, mouse_pos, mouse_clicked):
         # Store previous hover state
         prev_hovered = self.hovered
@@ -109,12 +167,12 @@ class Button:
         if self.hovered and mouse_clicked and self.active:
             self.clicked = True
             # Play click sound from menu category
-            audio.play_sound('click', 'menu')
+            click_sound.play()
             return True
         
         # Play hover sound when first hovering
         if self.hovered and not prev_hovered:
-            audio.play_sound('hover', 'menu')
+            hover_sound.play()
             
         self.clicked = False
         return False
@@ -128,13 +186,20 @@ class Button:
         x_offset = (scaled_width - self.rect.width) // 2
         y_offset = (scaled_height - self.rect.height) // 2
         
-        # Draw button background with hover effect
-        button_rect = pygame.Rect(
-            self.rect.x - x_offset, 
-            self.rect.y - y_offset, 
-            scaled_width, 
-            scaled_height
-        )
+        # Hover scale only takes a few distinct values, so each face is rendered once
+        key = (self.text, self.hovered, scaled_width, scaled_height)
+        face = self.faces.get(key)
+        if face is None:
+            face = self.render_face(scaled_width, scaled_height)
+            self.faces[key] = face
+        
+        surface.blit(face, (self.rect.x - x_offset, self.rect.y - y_offset))
+    
+    def render_face(self, width, height):
+        """Render the button background, border and text at one size"""
+        # One extra column, because the gradient lines include their right end point
+        face = pygame.Surface((width + 1, height)).convert()
+        button_rect = pygame.Rect(0, 0, width, height)
         
         # Draw button with gradient effect
         if self.hovered:
@@ -154,14 +219,14 @@ class Button:
                 int(color_top[1] * (1 - progress) + color_bottom[1] * progress),
                 int(color_top[2] * (1 - progress) + color_bottom[2] * progress)
             )
-            pygame.draw.line(surface, color, 
+            pygame.draw.line(face, color, 
                             (button_rect.left, button_rect.top + i),
                             (button_rect.right, button_rect.top + i))
         
         # Draw border (thicker when hovered)
-        border_thickness = 3 if self.hovered else 2
+        border_thickness = max(1, px(3 if self.hovered else 2))
         border_color = HIGHLIGHT_COLOR if self.hovered else GRAY
-        pygame.draw.rect(surface, border_color, button_rect, border_thickness, border_radius=10)
+        pygame.draw.rect(face, border_color, button_rect, border_thickness, border_radius=px(10))
         
         # Render text with border
         text_color = HIGHLIGHT_COLOR if self.hovered else TEXT_COLOR
@@ -169,7 +234,9 @@ class Button:
         
         # Center text on button
         text_rect = text_surf.get_rect(center=button_rect.center)
-        surface.blit(text_surf, text_rect)
+        face.blit(text_surf, text_rect)
+        telemetry.count('button.faces_rendered')
+        return face
         
     def set_text(self, new_text):
         self.text = new_text
@@ -197,6 +264,38 @@ class ToggleButton(Button):
             self.state = state
             self.update_text()
 
+# Button that cycles through a list of options when clicked
+class ChoiceButton(Button):
+    def __init__(self, x, y, width, height, options, font=main_font, action=None, choice=None):
+        super().__init__(x, y, width, height, "", font, action)
+        self.options = options
+        self.choice = choice if choice in options else options[0]
+        self.update_text()
+        
+    def update(self, mouse_pos, mouse_clicked):
+        if super().update(mouse_pos, mouse_clicked):
+            self.choice = self.options[(self.options.index(self.choice) + 1) % len(self.options)]
+            self.update_text()
+            return True
+        return False
+        
+    def set_choice(self, choice):
+        self.choice = choice
+        self.update_text()
+        
+    def update_text(self):
+        self.text = f"{self.action}: {self.choice.title()}"
+
+def set_graphics_preset(settings_manager, preset):
+    """Switch to a graphics preset and save it; a new render resolution applies on the next start"""
+    quality.configure(preset, settings_manager.get('graphics_custom'))
+    settings_manager.set('graphics_preset', preset)
+    # The built-in levels' cracks are rendered at startup; a custom depth is rendered here
+    crack_library.prepare_depth(quality.settings.crack_depth)
+    size = display_config.render_resolution(settings_manager.settings, quality.settings.render_resolution)
+    if size != (SCREEN_WIDTH, SCREEN_HEIGHT):
+        print(f"Render resolution {size[0]}x{size[1]} applies after a restart")
+
 # Slider for volume controls
 class Slider:
     def __init__(self, x, y, width, height, min_val, max_val, current_val, label):
@@ -209,8 +308,8 @@ class Slider:
         self.hovered = False
         
         # Calculate handle position
-        self.handle_width = 20
-        self.handle_height = height + 10
+        self.handle_width = px(20)
+        self.handle_height = height + px(10)
         self.update_handle_pos()
         
     def update_handle_pos(self):
@@ -222,7 +321,7 @@ class Slider:
             position = (self.current_val - self.min_val) / value_range
         
         handle_x = self.rect.x + int(position * self.rect.width) - self.handle_width // 2
-        self.handle_rect = pygame.Rect(handle_x, self.rect.y - 5, self.handle_width, self.handle_height)
+        self.handle_rect = pygame.Rect(handle_x, self.rect.y - px(5), self.handle_width, self.handle_height)
         
     def update(self, mouse_pos, mouse_pressed):
         prev_hovered = self.hovered
@@ -230,7 +329,7 @@ class Slider:
         
         # Play hover sound when first hovering
         if self.hovered and not prev_hovered:
-            audio.play_sound('hover', 'menu')
+            hover_sound.play()
         
         # Check for click on handle
         if mouse_pressed[0]:
@@ -241,7 +340,7 @@ class Slider:
                 self.set_value_from_mouse_x(mouse_pos[0])
                 self.active = True
                 # Play click sound
-                audio.play_sound('click', 'menu')
+                click_sound.play()
         else:
             self.active = False
             
@@ -270,21 +369,21 @@ class Slider:
         # Draw label above the slider with enough space
         label_text = f"{self.label}: {int(self.current_val * 100)}%"
         label_surf = render_text_with_border(main_font, label_text, TEXT_COLOR, BLACK)
-        label_rect = label_surf.get_rect(midtop=(self.rect.centerx, self.rect.y - 40))
+        label_rect = label_surf.get_rect(midtop=(self.rect.centerx, self.rect.y - px(40)))
         surface.blit(label_surf, label_rect)
         
         # Draw slider background
-        pygame.draw.rect(surface, DARK_GRAY, self.rect, border_radius=5)
+        surface.draw_shape(pygame.draw.rect, DARK_GRAY, self.rect, border_radius=px(5))
         
         # Draw filled portion
         fill_width = int((self.current_val - self.min_val) / (self.max_val - self.min_val) * self.rect.width)
         fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
-        pygame.draw.rect(surface, LIGHT_BLUE, fill_rect, border_radius=5)
+        surface.draw_shape(pygame.draw.rect, LIGHT_BLUE, fill_rect, border_radius=px(5))
         
         # Draw handle
         handle_color = HIGHLIGHT_COLOR if self.hovered or self.active else WHITE
-        pygame.draw.rect(surface, handle_color, self.handle_rect, border_radius=5)
-        pygame.draw.rect(surface, BLACK, self.handle_rect, 2, border_radius=5)
+        surface.draw_shape(pygame.draw.rect, handle_color, self.handle_rect, border_radius=px(5))
+        surface.draw_shape(pygame.draw.rect, BLACK, self.handle_rect, max(1, px(2)), border_radius=px(5))
         
     def set_value(self, value):
         self.current_val = max(self.min_val, min(self.max_val, value))
@@ -324,18 +423,36 @@ for layer_name in background_layers:
     except pygame.error as e:
         print(f"Could not load background image {layer_name}.png: {e}")
 
+# Wall torches mounted on the pillars, as fractions of the pillar image (two pillars per copy)
+TORCH_MOUNTS = [(0.165, 0.42), (0.63, 0.42)]
+TORCH_FLAME = (0.5, 0.15)  # Flame center as a fraction of the torch image
+
+try:
+    torch_image = pygame.image.load(os.path.join('decorations', 'torch.png')).convert_alpha()
+    torch_image = pygame.transform.scale(torch_image, (px(60), px(60)))
+except (pygame.error, FileNotFoundError) as e:
+    print(f"Could not load torch image: {e}")
+    torch_image = None
+
+def torch_extent(torch):
+    """(center x, center y, radius) of a torch given as (top left, flicker offset), for culling"""
+    (x, y), _ = torch
+    return x + px(30), y + px(30), px(43)
+
 # Background class for parallax scrolling
 class Background:
-    def __init__(self, image, speed):
+    def __init__(self, image, speed, name=None):
         self.image = image
         self.speed = speed
+        self.name = name  # Layer name from background_layers
         self.width = image.get_width()
+        self.overlap = px(20)  # Copies overlap slightly to hide seams
         # Start with three copies to ensure full coverage
-        self.positions = [0, self.width - 20, self.width * 2 - 40]  # Overlap by 20 pixels
+        self.positions = [0, self.width - self.overlap, self.width * 2 - self.overlap * 2]
     
     def update(self, game_speed):
         # Adjust speed based on current game speed to keep backgrounds in sync with traps
-        actual_speed = self.speed * (game_speed / 8.0)
+        actual_speed = self.speed * (game_speed / 8.0) * UI_SCALE
         
         # Move all copies of the background
         for i in range(len(self.positions)):
@@ -346,33 +463,42 @@ class Background:
                 # Find the rightmost position
                 rightmost = max(self.positions)
                 # Place this image to the right of the rightmost one
-                self.positions[i] = rightmost + self.width - 20  # Overlap by 20 pixels
+                self.positions[i] = rightmost + self.width - self.overlap
     
-    def draw(self, surface, offset_x=0, offset_y=0):
-        # Draw all copies of the background
-        for pos in self.positions:
-            surface.blit(self.image, (pos + offset_x, offset_y))
+    def copies(self, offset_x=0, offset_y=0):
+        """(image, position) pairs for every copy of the background on screen"""
+        copies = [(self.image, (pos + offset_x, offset_y)) for pos in self.positions]
         
-        # Draw an extra copy if needed to fill any gaps at the right edge
+        # Add an extra copy if needed to fill any gaps at the right edge
         rightmost = max(self.positions)
         if rightmost < SCREEN_WIDTH:
-            surface.blit(self.image, (rightmost + self.width - 20 + offset_x, offset_y))  # Overlap by 20 pixels
+            copies.append((self.image, (rightmost + self.width - self.overlap + offset_x, offset_y)))
+        return copies
+    
+    def draw(self, surface, offset_x=0, offset_y=0):
+        # Draw all copies of the background
+        surface.blits(self.copies(offset_x, offset_y), doreturn=0)
 
 # Heart class for health display
 class Heart(pygame.sprite.Sprite):
+    _layer = LAYER_HUD
+    
     def __init__(self, x, y):
         super().__init__()
         # Create heart shapes
-        self.full_heart = pygame.Surface((30, 30), pygame.SRCALPHA)  # Larger hearts
-        self.empty_heart = pygame.Surface((30, 30), pygame.SRCALPHA)
+        size = px(30)  # Larger hearts
+        self.full_heart = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.empty_heart = pygame.Surface((size, size), pygame.SRCALPHA)
+        points = [(x * UI_SCALE, y * UI_SCALE)
+                  for x, y in [(15, 9), (21, 3), (27, 9), (27, 15), (15, 27), (3, 15), (3, 9), (9, 3)]]
         
         # Draw a red heart shape
-        pygame.draw.polygon(self.full_heart, (255, 0, 0), 
-                           [(15, 9), (21, 3), (27, 9), (27, 15), (15, 27), (3, 15), (3, 9), (9, 3)])
+        pygame.draw.polygon(self.full_heart, (255, 0, 0), points)
         
         # Draw a gray heart outline
-        pygame.draw.polygon(self.empty_heart, (100, 100, 100), 
-                           [(15, 9), (21, 3), (27, 9), (27, 15), (15, 27), (3, 15), (3, 9), (9, 3)], 2)
+        pygame.draw.polygon(self.empty_heart, (100, 100, 100), points, max(1, px(2)))
+        self.full_heart = display_format(self.full_heart)
+        self.empty_heart = display_format(self.empty_heart)
         
         self.image = self.full_heart
         self.rect = self.image.get_rect()
@@ -384,8 +510,114 @@ class Heart(pygame.sprite.Sprite):
         if is_full is not None and is_full != self.is_full:
             self.is_full = is_full
             self.image = self.full_heart if is_full else self.empty_heart
+
+# HUD layer drawn over the game world
+class HudLayer:
+    def __init__(self):
+        """Score, high score, player name and hearts, redrawn only when one of them changes"""
+        # The layer covers the top band of the screen down to the hearts
+        text_height = score_font.get_height() + 2  # Text is rendered with a 1 pixel border
+        height = max(px(40) + text_height, px(10) + text_height + px(5) + px(30))
+        self.surface = display_format(pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA))
+        self.key = None  # Inputs the layer was last drawn from
+    
+    def draw(self, surface, score, high_score, player_name, hearts):
+        """Present the layer with one blit, rebuilding it first if an input changed"""
+        key = (score, high_score, player_name, tuple(heart.is_full for heart in hearts))
+        if key != self.key:
+            self.key = key
+            self.rebuild(score, high_score, player_name, hearts)
+            surface.refresh(self.surface)
+        surface.blit(self.surface, (0, 0))
+        telemetry.count('hud.draws')
+    
+    def rebuild(self, score, high_score, player_name, hearts):
+        self.surface.fill((0, 0, 0, 0))
+        
+        # Draw score (formatted as 4 digits, 0000) with smaller font and border
+        score_text = render_text_with_border(score_font, f"Score: {score:04d}", TEXT_COLOR, BLACK)
+        self.surface.blit(score_text, (px(10), px(10)))
+        
+        # Draw high score with border (without player name during gameplay)
+        high_score_text = render_text_with_border(score_font, f"High Score: {high_score:04d}", TEXT_COLOR, BLACK)
+        self.surface.blit(high_score_text, (px(10), px(40)))  # Adjusted position due to smaller font
+        
+        # Draw player name with border
+        name_text = render_text_with_border(score_font, f"Player: {player_name}", TEXT_COLOR, BLACK)
+        name_x = SCREEN_WIDTH - name_text.get_width() - px(20)
+        name_y = px(10)
+        self.surface.blit(name_text, (name_x, name_y))
+        
+        # Lay the hearts out below the player name
+        heart_y = name_y + name_text.get_height() + px(5)
+        for i, heart in enumerate(hearts):
+            heart.rect.x = SCREEN_WIDTH - px(50) - (i * px(35))
+            heart.rect.y = heart_y
+        hearts.draw(self.surface)
+        telemetry.count('hud.rebuilds')
+# Player animation table: state -> (sprite sheet, frame count, how the frame is chosen)
+# 'loop' advances on a timer, 'velocity' follows the jump arc, 'timer' follows the hurt timer
+PLAYER_ANIMATIONS = {
+    'idle': ('Idle.png', 6, 'loop'),
+    'run': ('Run.png', 8, 'loop'),
+    'jump': ('Jump.png', 10, 'velocity'),
+    'hurt': ('Hurt.png', 3, 'timer')
+}
+PLAYER_WIDTH = px(180)  # Width every player frame is scaled to
+
+# Animation frame with its size precomputed, so switching frames never needs a new Rect
+class AnimationFrame:
+    __slots__ = ('image', 'width', 'height')
+    
+    def __init__(self, image):
+        self.image = image
+        self.width, self.height = image.get_size()
+
+# Split a sprite sheet into frames scaled to the player width
+def split_sprite_sheet(sheet_path, frame_count):
+    frames = []
+    try:
+        # Load the sprite sheet
+        sheet = pygame.image.load(sheet_path).convert_alpha()
+        sheet_width = sheet.get_width()
+        sheet_height = sheet.get_height()
+        
+        # Calculate frame width (total width divided by number of frames)
+        frame_width = sheet_width // frame_count
+        
+        # Extract each frame
+        for i in range(frame_count):
+            # Create a new surface for the frame
+            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
+            # Copy the specific portion of the sprite sheet
+            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
+            # Scale the frame to desired size (maintain aspect ratio)
+            scale_factor = PLAYER_WIDTH / frame_width  # Larger character size
+            new_height = int(sheet_height * scale_factor)
+            frame = pygame.transform.scale(frame, (PLAYER_WIDTH, new_height))
+            frames.append(display_format(frame))
+        
+        print(f"Loaded {frame_count} frames from {sheet_path}")
+    except pygame.error as e:
+        print(f"Could not load animation from {sheet_path}: {e}")
+    
+    return frames
+
+# Player animations are loaded once and shared by every Player instance
+player_animations = {}
+
+def load_player_animations():
+    """Load (once) and return the player animation frames by state"""
+    if not player_animations:
+        for state, (sheet, frame_count, _) in PLAYER_ANIMATIONS.items():
+            frames = split_sprite_sheet(os.path.join('player', sheet), frame_count)
+            player_animations[state] = [AnimationFrame(frame) for frame in frames]
+    return player_animations
+
 # Player class
 class Player(pygame.sprite.Sprite):
+    _layer = LAYER_PLAYER
+    
     def __init__(self):
         super().__init__()
         
@@ -405,72 +637,35 @@ class Player(pygame.sprite.Sprite):
         self.disintegration_duration = 15  # Frames to show disintegration (0.25 seconds at 60 FPS)
         self.opacity = 255  # Full opacity to start
         
-        # Animation variables
-        self.current_frame = 0
-        self.animation_speed = 0.08  # Faster animation speed for smoother transitions
-        self.animation_timer = 0
-        self.current_animation = 'idle'  # Current animation state
+        # Precomputed opacity for each disintegration frame
+        self.fade_ramp = [
+            int(max(0, 255 - (255 * t / self.disintegration_duration)))
+            for t in range(1, self.disintegration_duration + 1)
+        ]
+        self.fade_image = None  # Copy of the death frame, made once when disintegration starts
         
         # Jump mechanics
         self.velocity = 0
-        self.jump_power = -22  # Enhanced jump power for easier gameplay
-        self.gravity = 0.9  # Slightly reduced gravity for longer jumps
+        self.jump_power = -22 * UI_SCALE  # Enhanced jump power for easier gameplay
+        self.gravity = 0.9 * UI_SCALE  # Slightly reduced gravity for longer jumps
         self.is_jumping = False
         
-        # Load player animations
-        self.idle_frames = []
-        self.run_frames = []
-        self.jump_frames = []
-        self.hurt_frames = []
-        self.dead_frames = []
+        # Sound handles resolved once instead of looked up on every play
+        self.jump_sound = audio.get_handle('jump')
+        self.hurt_sound = audio.get_handle('hurt')
         
-        # Function to split sprite sheets into frames
-        def split_sprite_sheet(sheet_path, frame_count):
-            frames = []
-            try:
-                # Load the sprite sheet
-                sheet = pygame.image.load(sheet_path).convert_alpha()
-                sheet_width = sheet.get_width()
-                sheet_height = sheet.get_height()
-                
-                # Calculate frame width (total width divided by number of frames)
-                frame_width = sheet_width // frame_count
-                
-                # Extract each frame
-                for i in range(frame_count):
-                    # Create a new surface for the frame
-                    frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-                    # Copy the specific portion of the sprite sheet
-                    frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-                    # Scale the frame to desired size (maintain aspect ratio)
-                    scale_factor = 180 / frame_width  # Larger character size
-                    new_width = 180
-                    new_height = int(sheet_height * scale_factor)
-                    frame = pygame.transform.scale(frame, (new_width, new_height))
-                    frames.append(frame)
-                
-                print(f"Loaded {frame_count} frames from {sheet_path}")
-            except pygame.error as e:
-                print(f"Could not load animation from {sheet_path}: {e}")
-            
-            return frames
-        
-        # Load idle animation (6 frames)
-        self.idle_frames = split_sprite_sheet(os.path.join('player', 'Idle.png'), 6)
-        
-        # Load run animation (8 frames)
-        self.run_frames = split_sprite_sheet(os.path.join('player', 'Run.png'), 8)
-        
-        # Load jump animation (10 frames)
-        self.jump_frames = split_sprite_sheet(os.path.join('player', 'Jump.png'), 10)
+        # Load player animations (shared between players)
+        self.animations = load_player_animations()
         
-        # Load hurt animation (3 frames)
-        self.hurt_frames = split_sprite_sheet(os.path.join('player', 'Hurt.png'), 3)
+        # Plain frame lists for code that needs the images themselves
+        self.idle_frames = [frame.image for frame in self.animations['idle']]
+        self.run_frames = [frame.image for frame in self.animations['run']]
+        self.jump_frames = [frame.image for frame in self.animations['jump']]
+        self.hurt_frames = [frame.image for frame in self.animations['hurt']]
         
         # No Dead.png file, so use the last hurt frame for death
-        self.dead_frames = []
-        if self.hurt_frames:
-            self.dead_frames = [self.hurt_frames[-1]]
+        self.dead_frame = self.animations['hurt'][-1] if self.animations['hurt'] else None
+        self.dead_frames = [self.dead_frame.image] if self.dead_frame else []
         
         # Set initial image
         if self.idle_frames:
@@ -479,23 +674,24 @@ class Player(pygame.sprite.Sprite):
             self.image = self.run_frames[0]
         else:
             # Fallback to rectangle if images couldn't be loaded
-            self.image = pygame.Surface((40, 60))
+            self.image = pygame.Surface((px(40), px(60))).convert()
             self.image.fill(BLACK)
         
         self.rect = self.image.get_rect()
         self.rect.bottom = GROUND_HEIGHT
-        self.rect.left = 50
+        self.rect.left = px(50)
         
         # Animation variables
         self.current_frame = 0
         self.animation_speed = 0.15
         self.animation_timer = 0
         self.current_animation = 'idle'  # Current animation state
+        self.frame_ticks = FPS * self.animation_speed  # Frames per looping animation step
         
         # Jump mechanics
         self.velocity = 0
-        self.jump_power = -15
-        self.gravity = 0.8
+        self.jump_power = -15 * UI_SCALE
+        self.gravity = 0.8 * UI_SCALE
         self.is_jumping = False
     
     def update(self):
@@ -538,96 +734,59 @@ class Player(pygame.sprite.Sprite):
         # Use idle animation for the start screen
         self.animate_idle()
     
-    def animate_idle(self):
-        if not self.idle_frames:
+    def show_frame(self, frame):
+        """Show an animation frame, keeping the feet anchored by mutating the rect in place"""
+        if frame.image is self.image:
             return
-            
-        # Update animation frame
-        self.animation_timer += 1
-        if self.animation_timer >= FPS * self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.idle_frames)
-            
-            # Store the old rect position
-            old_bottom = self.rect.bottom
-            old_left = self.rect.left
-            
-            # Update image
-            self.image = self.idle_frames[self.current_frame]
-            
-            # Reset the rect with the new image and restore position
-            self.rect = self.image.get_rect()
-            self.rect.bottom = old_bottom
-            self.rect.left = old_left
-    
-    def animate_run(self):
-        if not self.run_frames:
-            return
-            
-        # Update animation frame at a consistent rate
-        self.animation_timer += 1
-        if self.animation_timer >= FPS * self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.run_frames)
-            
-            # Store the old rect position
-            old_bottom = self.rect.bottom
-            old_left = self.rect.left
-            
-            # Update image
-            self.image = self.run_frames[self.current_frame]
-            
-            # Reset the rect with the new image and restore position
-            self.rect = self.image.get_rect()
-            self.rect.bottom = old_bottom
-            self.rect.left = old_left
+        
+        bottom = self.rect.bottom
+        self.image = frame.image
+        self.rect.width = frame.width
+        self.rect.height = frame.height
+        self.rect.bottom = bottom
     
-    def animate_jump(self):
-        if not self.jump_frames:
+    def animate(self, state):
+        """Advance the animation for a state using its entry in PLAYER_ANIMATIONS"""
+        frames = self.animations[state]
+        if not frames:
             return
-            
-        # Store the old rect position
-        old_bottom = self.rect.bottom
-        old_left = self.rect.left
         
-        # For jump animation, use different frames based on the jump phase
-        # Going up: use first half of frames
-        # Going down: use second half of frames
-        if self.velocity < 0:  # Going up
-            frame_index = min(int(abs(self.velocity) / 3), len(self.jump_frames) // 2 - 1)
-        else:  # Going down
-            frame_index = min(len(self.jump_frames) // 2 + int(self.velocity / 3), len(self.jump_frames) - 1)
+        self.current_animation = state
+        mode = PLAYER_ANIMATIONS[state][2]
         
-        self.image = self.jump_frames[frame_index]
+        if mode == 'loop':
+            # Update animation frame at a consistent rate
+            self.animation_timer += 1
+            if self.animation_timer < self.frame_ticks:
+                return
+            self.animation_timer = 0
+            self.current_frame = (self.current_frame + 1) % len(frames)
+            frame_index = self.current_frame
+        elif mode == 'velocity':
+            # Going up: use first half of frames, going down: use second half
+            half = len(frames) // 2
+            step = 3 * UI_SCALE  # Velocity change per frame of the jump animation
+            if self.velocity < 0:
+                frame_index = min(int(-self.velocity / step), half - 1)
+            else:
+                frame_index = min(half + int(self.velocity / step), len(frames) - 1)
+        else:
+            # The hurt timer determines which frame to show, one third each
+            frame_index = min(int(self.hurt_timer * len(frames) / self.hurt_duration), len(frames) - 1)
         
-        # Reset the rect with the new image and restore position
-        self.rect = self.image.get_rect()
-        self.rect.bottom = old_bottom
-        self.rect.left = old_left
+        self.show_frame(frames[frame_index])
+    
+    def animate_idle(self):
+        self.animate('idle')
+    
+    def animate_run(self):
+        self.animate('run')
+    
+    def animate_jump(self):
+        self.animate('jump')
     
     def animate_hurt(self):
-        if not self.hurt_frames:
-            return
-            
-        # Store the old rect position
-        old_bottom = self.rect.bottom
-        old_left = self.rect.left
-        
-        # Use a single frame for hurt animation to avoid the "5 people" issue
-        # The hurt timer determines which frame to show
-        if self.hurt_timer < self.hurt_duration / 3:
-            frame_index = 0
-        elif self.hurt_timer < 2 * self.hurt_duration / 3:
-            frame_index = 1
-        else:
-            frame_index = 2
-            
-        self.image = self.hurt_frames[frame_index]
-        
-        # Reset the rect with the new image and restore position
-        self.rect = self.image.get_rect()
-        self.rect.bottom = old_bottom
-        self.rect.left = old_left
+        self.animate('hurt')
     
     def animate_dead(self):
         # Use crumbling death effect if enabled
@@ -643,23 +802,23 @@ class Player(pygame.sprite.Sprite):
                     self.image = None
                     return
         # Simple fade away effect
-        elif self.is_dead and hasattr(self, 'disintegrating') and self.disintegrating:
+        elif self.is_dead and self.disintegrating:
             # Increment the timer
             self.disintegration_timer += 1
             
-            # Calculate opacity based on timer (fade out quickly)
-            self.opacity = max(0, 255 - (255 * self.disintegration_timer / self.disintegration_duration))
+            # Look up the opacity for this frame (fade out quickly)
+            self.opacity = self.fade_ramp[min(self.disintegration_timer, self.disintegration_duration) - 1]
             
-            # Apply fading effect to player sprite
-            if self.hurt_frames:
-                # Use the last hurt frame
-                self.image = self.hurt_frames[-1].copy()
-                # Apply fading
-                self.image.set_alpha(int(self.opacity))
+            # Apply fading to the copy of the death frame made when disintegration started
+            if self.fade_image:
+                self.fade_image.set_alpha(self.opacity)
+                self.image = self.fade_image
+                self.rect.width = self.dead_frame.width
+                self.rect.height = self.dead_frame.height
             
             # Position the character
             self.rect.bottom = GROUND_HEIGHT
-            self.rect.left = 50
+            self.rect.left = px(50)
             
             # If disintegration is complete, make the player invisible
             if self.disintegration_timer >= self.disintegration_duration:
@@ -670,25 +829,30 @@ class Player(pygame.sprite.Sprite):
                 return
         else:
             # Regular death animation (non-disintegrating)
-            if not self.hurt_frames:
+            if not self.dead_frame:
                 return
                 
             # Use the last hurt frame for death
-            self.image = self.hurt_frames[-1]
-            
-            # Create a new rect for the position
-            self.rect = self.image.get_rect()
+            self.show_frame(self.dead_frame)
             
             # Position the character
             self.rect.bottom = GROUND_HEIGHT
-            self.rect.left = 50
+            self.rect.left = px(50)
+    
+    def start_disintegration(self):
+        """Fall back to the simple fade-out death"""
+        self.disintegrating = True
+        self.disintegration_timer = 0
+        self.opacity = 255  # Reset opacity to full
+        if self.dead_frame:
+            self.fade_image = self.dead_frame.image.copy()
     
     def jump(self):
         if not self.is_jumping and not self.is_hurt and not self.is_dead:
             self.is_jumping = True
             self.velocity = self.jump_power
             # Play jump sound from player category (or no sound if not available)
-            audio.play_sound('jump', 'player')
+            self.jump_sound.play()
     
     def take_damage(self):
         if not self.is_hurt and not self.is_dead:
@@ -706,30 +870,37 @@ class Player(pygame.sprite.Sprite):
                 try:
                     from crumbling_death import CrumblingDeath
                     self.crumbling = True
-                    self.crumbling_death = CrumblingDeath(pygame.display.get_surface(), self.rect, self.image)
+                    self.crumbling_death = CrumblingDeath(screen, self.rect, self.image)
                     print("Using crumbling death effect")
                 except ImportError:
                     # Fallback to original disintegration effect
-                    self.disintegrating = True
-                    self.disintegration_timer = 0
-                    self.opacity = 255  # Reset opacity to full
+                    self.start_disintegration()
                     print("Crumbling death not available, using disintegration")
                 except Exception as e:
                     # Fallback to original disintegration effect
-                    self.disintegrating = True
-                    self.disintegration_timer = 0
-                    self.opacity = 255  # Reset opacity to full
+                    self.start_disintegration()
                     print(f"Error initializing crumbling death: {e}")
                 
                 # Death sound is played in the collision handler
                 return True  # Player died
             else:
                 # Only play hurt sound if not dead
-                audio.play_sound('hurt', 'game')
+                self.hurt_sound.play()
         
         return False  # Player still alive
+
+# Trap destruction particles are [x, y, size, speed_x, speed_y, color, lifetime];
+# these read them for viewport culling
+def spark_motion(particle):
+    return particle[0], particle[1], particle[3], particle[4], particle[2]
+
+def spark_position(particle):
+    return particle[0], particle[1], particle[2]
+
 # Particle effect for trap destruction
 class DestroyEffect(pygame.sprite.Sprite):
+    _layer = LAYER_EFFECTS
+    
     def __init__(self, x, y):
         super().__init__()
         self.particles = []
@@ -737,11 +908,11 @@ class DestroyEffect(pygame.sprite.Sprite):
         self.max_time = 30  # How long the effect lasts in frames
         
         # Create particles
-        for _ in range(15):  # Number of particles
+        for _ in range(quality.settings.spark_count):  # Number of particles (15 at high quality)
             # Random particle properties
-            size = random.randint(3, 8)
-            speed_x = random.uniform(-3, 3)
-            speed_y = random.uniform(-6, -1)  # Negative for upward movement
+            size = px(random.randint(3, 8))
+            speed_x = random.uniform(-3, 3) * UI_SCALE
+            speed_y = random.uniform(-6, -1) * UI_SCALE  # Negative for upward movement
             color = random.choice([(255, 100, 0), (255, 50, 0), (200, 0, 0)])  # Orange/red colors
             
             # Add particle [x, y, size, speed_x, speed_y, color, lifetime]
@@ -761,7 +932,7 @@ class DestroyEffect(pygame.sprite.Sprite):
         # Update each particle
         for particle in self.particles:
             # Apply gravity
-            particle[4] += 0.2  # Increase y speed (gravity)
+            particle[4] += 0.2 * UI_SCALE  # Increase y speed (gravity)
             
             # Move particle
             particle[0] += particle[3]  # x position
@@ -769,38 +940,50 @@ class DestroyEffect(pygame.sprite.Sprite):
             
             # Decrease lifetime
             particle[6] -= 1
+        
+        # Drop particles that burnt out or fell off the screen
+        live = [particle for particle in self.particles if particle[6] > 0]
+        self.particles = viewport.drop_escaped('sparks', live, spark_motion)
     
     def draw(self, screen):
-        # Draw each particle
-        for particle in self.particles:
-            if particle[6] > 0:  # If particle is still alive
-                pygame.draw.circle(screen, particle[5], (int(particle[0]), int(particle[1])), particle[2])
+        # Draw each live particle that is on screen
+        for particle in viewport.visible_items('sparks', self.particles, spark_position):
+            screen.draw_shape(pygame.draw.circle, particle[5], (int(particle[0]), int(particle[1])), particle[2])
+
+# Trap images and their size on the reference screen (smaller than before)
+TRAP_SIZES = {
+    'trap1.png': (90, 80),
+    'trap2.png': (85, 75),
+    'trap3.png': (80, 70)
+}
+
+# Trap images are loaded and scaled once, then shared by every trap
+trap_images = {}
+
+def load_trap_images():
+    """Load (once) and return the trap images scaled to the internal resolution"""
+    if not trap_images:
+        for name, (width, height) in TRAP_SIZES.items():
+            try:
+                image = pygame.image.load(f'traps/{name}').convert_alpha()
+                trap_images[name] = pygame.transform.scale(image, (px(width), px(height)))
+            except pygame.error:
+                # Fallback to a rectangle if image loading fails
+                print(f"Could not load trap image {name}. Using fallback.")
+                image = pygame.Surface((px(60), px(90))).convert()
+                image.fill(BLACK)
+                trap_images[name] = image
+    return trap_images
 
 # Trap class (obstacles)
 class Trap(pygame.sprite.Sprite):
+    _layer = LAYER_TRAPS
+    
     def __init__(self, speed):
         super().__init__()
         # Choose a random trap image from the available options
-        trap_options = ['trap1.png', 'trap2.png', 'trap3.png']
-        chosen_trap = random.choice(trap_options)
-        
-        # Try to load the trap image
-        try:
-            self.image = pygame.image.load(f'traps/{chosen_trap}').convert_alpha()
-            
-            # Scale the image to an appropriate size based on which trap it is (smaller than before)
-            if chosen_trap == 'trap1.png':
-                self.image = pygame.transform.scale(self.image, (90, 80))
-            elif chosen_trap == 'trap2.png':
-                self.image = pygame.transform.scale(self.image, (85, 75))
-            else:  # trap3.png
-                self.image = pygame.transform.scale(self.image, (80, 70))
-                
-        except pygame.error:
-            # Fallback to a rectangle if image loading fails
-            print(f"Could not load trap image {chosen_trap}. Using fallback.")
-            self.image = pygame.Surface((60, 90))
-            self.image.fill(BLACK)
+        chosen_trap = random.choice(list(TRAP_SIZES))
+        self.image = load_trap_images()[chosen_trap]
         
         self.rect = self.image.get_rect()
         self.rect.bottom = GROUND_HEIGHT  # Ensure trap touches the ground
@@ -808,13 +991,13 @@ class Trap(pygame.sprite.Sprite):
         
         # Add mild speed variation to each trap (±5% of base speed)
         speed_variation = random.uniform(0.95, 1.05)
-        self.speed = speed * speed_variation
+        self.speed = speed * speed_variation * UI_SCALE
         
         # Store which trap type this is for collision detection
         self.trap_type = chosen_trap
         
         # Add subtle vertical bobbing motion
-        self.bob_height = random.randint(0, 3)  # Reduced bobbing height
+        self.bob_height = px(random.randint(0, 3))  # Reduced bobbing height
         self.bob_speed = random.uniform(0.03, 0.08)  # Slower bobbing
         self.bob_offset = random.uniform(0, 6.28)
         self.original_y = self.rect.y
@@ -836,6 +1019,78 @@ class Trap(pygame.sprite.Sprite):
         # Always ensure trap is on the ground
         self.rect.bottom = GROUND_HEIGHT
 
+# Credits content: text, color and font of each line (empty strings add spacing)
+CREDITS = [
+    ["Tomb Bound", HIGHLIGHT_COLOR, title_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["Developer", HIGHLIGHT_COLOR, main_font],
+    ["N Chandra Prakash Reddy", WHITE, main_font],
+    ["Tirupati, Andhra Pradesh, India", WHITE, main_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["Programming Language", HIGHLIGHT_COLOR, main_font],
+    ["Python 3", WHITE, main_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["Game Library", HIGHLIGHT_COLOR, main_font],
+    ["Pygame", WHITE, main_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["Development Tool", HIGHLIGHT_COLOR, main_font],
+    ["Amazon Q Developer", WHITE, main_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["2D Assets", HIGHLIGHT_COLOR, main_font],
+    ["Craftpix", WHITE, main_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["Music and Sound Effects", HIGHLIGHT_COLOR, main_font],
+    ["Pixabay", WHITE, main_font],
+    ["", WHITE, main_font],  # Empty line for spacing
+    ["Thank you for playing this game!", HIGHLIGHT_COLOR, main_font]
+]
+
+# Credits rendered once into a tall strip and scrolled by blitting part of it
+class CreditsStrip:
+    def __init__(self, credits, line_spacing=40):
+        line_spacing = px(line_spacing)
+        self.line_spacing = line_spacing
+        self.total_height = len(credits) * line_spacing
+        
+        # Credits are kept out of the title area at the top and the Back button area at the bottom
+        self.clip_top = px(120)
+        self.clip_bottom = SCREEN_HEIGHT - px(100)
+        
+        # Render every line once
+        lines = []
+        for text, color, font in credits:
+            lines.append(render_text_with_border(font, text, color, BLACK) if text else None)
+        
+        width = max(line.get_width() for line in lines if line)
+        height = self.total_height + max(line.get_height() for line in lines if line)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        for i, line in enumerate(lines):
+            if line:
+                self.surface.blit(line, (width // 2 - line.get_width() // 2, i * line_spacing))
+        self.surface = display_format(self.surface)
+        self.x = SCREEN_WIDTH // 2 - width // 2
+    
+    def draw(self, surface, scroll_pos):
+        """Blit the part of the strip that is visible between the clip lines"""
+        scroll_pos = int(scroll_pos)
+        top = max(self.clip_top, scroll_pos)
+        bottom = min(self.clip_bottom, scroll_pos + self.surface.get_height())
+        if bottom <= top:
+            return
+        
+        area = pygame.Rect(0, top - scroll_pos, self.surface.get_width(), bottom - top)
+        surface.blit(self.surface, (self.x, top), area)
+
+credits_strip = None
+
+def get_credits_strip():
+    """Get the credits strip shared by the main menu and the pause menu"""
+    global credits_strip
+    if credits_strip is None:
+        credits_strip = CreditsStrip(CREDITS)
+    return credits_strip
+
 # Settings manager to save/load game settings
 class SettingsManager:
     def __init__(self):
@@ -844,6 +1099,12 @@ class SettingsManager:
             'music_enabled': True,  # Added music_enabled setting
             'music_volume': 0.5,
             'fullscreen': False,  # Ensure fullscreen is False by default
+            'lighting_quality': 'high',  # 'off', 'low' or 'high'
+            'idle_throttle': 'on',  # 'on' slows the menus when idle and the game when unfocused
+            'frame_pacing': 'tick',  # 'tick', 'busy', 'hybrid' or 'vsync' (see pacing.py)
+            'capture_format': 'raw',  # Gameplay recordings as 'raw' RGB frames or a 'png' sequence
+            'graphics_preset': 'auto',  # 'auto', 'high', 'medium', 'low' or 'custom'
+            'graphics_custom': {},  # Quality values for the 'custom' preset (see quality.py)
             'high_score': 0,
             'high_score_name': 'Unknown'
         }
@@ -893,6 +1154,7 @@ class MenuSystem:
     def __init__(self, screen, settings_manager):
         self.screen = screen
         self.settings = settings_manager
+        self.quality = quality.settings  # Resolved graphics quality (parallax layers drawn)
         self.current_menu = 'main'  # 'main', 'settings', 'credits', 'name_input'
         self.player_name = ""
         self.input_active = True
@@ -917,53 +1179,59 @@ class MenuSystem:
                 self.backgrounds.append(
                     Background(
                         background_layers[layer_name]['image'], 
-                        background_layers[layer_name]['speed']
+                        background_layers[layer_name]['speed'],
+                        layer_name
                     )
                 )
         
         # Create buttons for main menu
-        button_width = 250
-        button_height = 60
+        button_width = px(250)
+        button_height = px(60)
         button_x = SCREEN_WIDTH // 2 - button_width // 2
-        button_spacing = 80
+        button_top = px(200)
+        button_spacing = px(80)
         
         # Main menu buttons
         self.main_menu_buttons = [
-            Button(button_x, 200, button_width, button_height, "Start Game", action="start"),
-            Button(button_x, 200 + button_spacing, button_width, button_height, "Settings", action="settings"),
-            Button(button_x, 200 + button_spacing * 2, button_width, button_height, "Credits", action="credits"),
-            Button(button_x, 200 + button_spacing * 3, button_width, button_height, "Quit Game", action="quit")
+            Button(button_x, button_top, button_width, button_height, "Start Game", action="start"),
+            Button(button_x, button_top + button_spacing, button_width, button_height, "Settings", action="settings"),
+            Button(button_x, button_top + button_spacing * 2, button_width, button_height, "Credits", action="credits"),
+            Button(button_x, button_top + button_spacing * 3, button_width, button_height, "Quit Game", action="quit")
         ]
         
         # Settings menu controls
         self.settings_buttons = [
-            ToggleButton(button_x, 200, button_width, button_height, "", action="Music", 
+            ToggleButton(button_x, button_top, button_width, button_height, "", action="Music", 
                         state=self.settings.get('music_enabled', True)),
-            Button(button_x, 200 + button_spacing * 3, button_width, button_height, "Back", action="back")
+            Button(button_x, button_top + button_spacing * 3, button_width, button_height, "Back", action="back")
         ]
         
         # Create slider for music volume
         self.music_slider = Slider(
-            SCREEN_WIDTH // 2 - 150, 
-            200 + button_spacing, 
-            300, 
-            20, 
+            SCREEN_WIDTH // 2 - px(150), 
+            button_top + button_spacing, 
+            px(300), 
+            px(20), 
             0.0, 
             1.0, 
             self.settings.get('music_volume', 0.5),
             "Music Volume"
         )
         
+        # Graphics preset button (cycles Auto/High/Medium/Low/Custom)
+        self.graphics_button = ChoiceButton(button_x, button_top + button_spacing * 2, button_width, button_height,
+                                            PRESETS, action="Graphics", choice=quality.preset)
+        
         # Credits menu button
         self.credits_buttons = [
-            Button(button_x, SCREEN_HEIGHT - 100, button_width, button_height, "Back", action="back")
+            Button(button_x, SCREEN_HEIGHT - px(100), button_width, button_height, "Back", action="back")
         ]
         
         # Name input box
-        self.name_input_box = pygame.Rect(SCREEN_WIDTH // 2 - 150, 250, 300, 50)
+        self.name_input_box = pygame.Rect(SCREEN_WIDTH // 2 - px(150), px(250), px(300), px(50))
         self.name_confirm_button = Button(
             SCREEN_WIDTH // 2 - button_width // 2,
-            350,
+            px(350),
             button_width,
             button_height,
             "Confirm",
@@ -1045,7 +1313,7 @@ class MenuSystem:
             button.hovered = (i == focused_index)
         
         # Play hover sound from menu category
-        audio.play_sound('hover', 'menu')
+        hover_sound.play()
     
     def activate_focused_button(self, buttons):
         """Activate the currently focused button"""
@@ -1076,6 +1344,10 @@ class MenuSystem:
             audio.set_music_volume(self.music_slider.current_val)
             self.settings.set('music_volume', self.music_slider.current_val)
         
+        # Update graphics preset button
+        if self.graphics_button.update(mouse_pos, mouse_clicked):
+            set_graphics_preset(self.settings, self.graphics_button.choice)
+        
         # Update back button
         if self.settings_buttons[1].update(mouse_pos, mouse_clicked):
             return self.handle_button_action('back')
@@ -1087,7 +1359,7 @@ class MenuSystem:
         # Update scroll position if not already initialized
         if not hasattr(self, 'credits_scroll_pos'):
             self.credits_scroll_pos = SCREEN_HEIGHT
-            self.credits_scroll_speed = 2
+            self.credits_scroll_speed = 2 * UI_SCALE
         
         for button in self.credits_buttons:
             if button.update(mouse_pos, mouse_clicked):
@@ -1132,9 +1404,11 @@ class MenuSystem:
     
     def draw(self):
         """Draw the current menu"""
-        # Draw backgrounds
+        # Draw backgrounds (lower quality levels leave out some distant layers)
+        dropped = self.quality.dropped_layers
         for bg in self.backgrounds:
-            bg.draw(self.screen)
+            if bg.name not in dropped:
+                bg.draw(self.screen)
         
         # Draw menu content based on current state
         if self.current_menu == 'main':
@@ -1155,7 +1429,7 @@ class MenuSystem:
         else:
             # Fallback to simple title if renderer not available
             title_text = render_text_with_border(title_font, "TOMB BOUND", HIGHLIGHT_COLOR, BLACK)
-            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 80))
+            self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, px(80)))
         
         # Draw buttons
         for button in self.main_menu_buttons:
@@ -1172,24 +1446,24 @@ class MenuSystem:
                 BLACK
             )
             self.screen.blit(high_score_text, 
-                           (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, SCREEN_HEIGHT - 50))
+                           (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, SCREEN_HEIGHT - px(50)))
     
     def draw_settings_menu(self):
         """Draw settings menu with centered layout and proper alignment"""
         # Draw title
         title_text = render_text_with_border(title_font, "SETTINGS", TEXT_COLOR, BLACK)
-        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 80))
+        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, px(80)))
         
         # Calculate positions for centered layout
         center_x = SCREEN_WIDTH // 2
-        button_width = 250
-        control_spacing = 120  # Increased spacing between controls
-        current_y = 180
+        button_width = px(250)
+        control_spacing = px(120)  # Increased spacing between controls
+        current_y = px(180)
         
         # Sound Settings Section
         section_title = render_text_with_border(main_font, "Audio Settings", HIGHLIGHT_COLOR, BLACK)
         self.screen.blit(section_title, (center_x - section_title.get_width() // 2, current_y))
-        current_y += 60  # Spacing after section title
+        current_y += px(60)  # Spacing after section title
         
         # Draw music toggle
         self.settings_buttons[0].rect.x = center_x - button_width // 2
@@ -1198,13 +1472,19 @@ class MenuSystem:
         current_y += control_spacing
         
         # Draw music volume slider
-        slider_width = 300
+        slider_width = px(300)
         self.music_slider.rect.x = center_x - slider_width // 2
         self.music_slider.rect.y = current_y
         self.music_slider.draw(self.screen)
+        current_y += px(50)
+        
+        # Draw graphics preset button
+        self.graphics_button.rect.x = center_x - button_width // 2
+        self.graphics_button.rect.y = current_y
+        self.graphics_button.draw(self.screen)
         
         # Draw back button at the bottom with enough space
-        back_button_y = SCREEN_HEIGHT - 100
+        back_button_y = SCREEN_HEIGHT - px(100)
         self.settings_buttons[1].rect.x = center_x - button_width // 2
         self.settings_buttons[1].rect.y = back_button_y
         self.settings_buttons[1].draw(self.screen)
@@ -1213,91 +1493,51 @@ class MenuSystem:
         """Draw credits screen with automatic scrolling animation"""
         # Draw title
         title_text = render_text_with_border(title_font, "CREDITS", TEXT_COLOR, BLACK)
-        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 80))
+        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, px(80)))
         
         # Initialize scroll position if not already set
         if not hasattr(self, 'credits_scroll_pos'):
             self.credits_scroll_pos = SCREEN_HEIGHT  # Start from bottom
-            self.credits_scroll_speed = 2  # Pixels per frame - match pause menu speed
-        
-        # Updated credits content
-        credits = [
-            ["Tomb Bound", HIGHLIGHT_COLOR, title_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["Developer", HIGHLIGHT_COLOR, main_font],
-            ["N Chandra Prakash Reddy", WHITE, main_font],
-            ["Tirupati, Andhra Pradesh, India", WHITE, main_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["Programming Language", HIGHLIGHT_COLOR, main_font],
-            ["Python 3", WHITE, main_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["Game Library", HIGHLIGHT_COLOR, main_font],
-            ["Pygame", WHITE, main_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["Development Tool", HIGHLIGHT_COLOR, main_font],
-            ["Amazon Q Developer", WHITE, main_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["2D Assets", HIGHLIGHT_COLOR, main_font],
-            ["Craftpix", WHITE, main_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["Music and Sound Effects", HIGHLIGHT_COLOR, main_font],
-            ["Pixabay", WHITE, main_font],
-            ["", WHITE, main_font],  # Empty line for spacing
-            ["Thank you for playing this game!", HIGHLIGHT_COLOR, main_font]
-        ]
-        
-        # Calculate total height of credits
-        line_spacing = 40
-        total_height = len(credits) * line_spacing
+            self.credits_scroll_speed = 2 * UI_SCALE  # Pixels per frame - match pause menu speed
         
         # Update scroll position
+        strip = get_credits_strip()
         self.credits_scroll_pos -= self.credits_scroll_speed
         
         # Reset position if credits have scrolled completely off screen
-        if self.credits_scroll_pos < -total_height:
+        if self.credits_scroll_pos < -strip.total_height:
             self.credits_scroll_pos = SCREEN_HEIGHT
         
-        # Create a clipping area to prevent text from appearing behind the back button
-        button_area_height = 100  # Height of the area reserved for the back button
-        
-        # Draw scrolling credits
-        y_pos = self.credits_scroll_pos
-        
-        for line in credits:
-            text, color, font = line
-            if text:  # Skip empty strings in y position calculation
-                text_surf = render_text_with_border(font, text, color, BLACK)
-                # Only draw if within visible area and not overlapping with button area
-                if 120 < y_pos < SCREEN_HEIGHT - button_area_height:
-                    self.screen.blit(text_surf, (SCREEN_WIDTH // 2 - text_surf.get_width() // 2, y_pos))
-            y_pos += line_spacing
+        # Draw scrolling credits with a single clipped blit
+        strip.draw(self.screen, self.credits_scroll_pos)
         
         # Draw back button (fixed position)
         for button in self.credits_buttons:
-            button.rect.y = SCREEN_HEIGHT - 80
+            button.rect.y = SCREEN_HEIGHT - px(80)
             button.draw(self.screen)
     
     def draw_name_input(self):
         """Draw name input screen"""
         # Draw title
         title_text = render_text_with_border(title_font, "ENTER YOUR NAME", TEXT_COLOR, BLACK)
-        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 80))
+        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, px(80)))
         
         # Draw input box
         color = HIGHLIGHT_COLOR if self.input_active else LIGHT_GRAY
-        pygame.draw.rect(self.screen, DARK_GRAY, self.name_input_box, border_radius=5)
-        pygame.draw.rect(self.screen, color, self.name_input_box, 3, border_radius=5)
+        self.screen.draw_shape(pygame.draw.rect, DARK_GRAY, self.name_input_box, border_radius=px(5))
+        self.screen.draw_shape(pygame.draw.rect, color, self.name_input_box, max(1, px(3)), border_radius=px(5))
         
         # Draw current name
+        padding = px(10)
         name_text = render_text_with_border(main_font, self.player_name, TEXT_COLOR, BLACK)
-        self.screen.blit(name_text, (self.name_input_box.x + 10, self.name_input_box.y + 10))
+        self.screen.blit(name_text, (self.name_input_box.x + padding, self.name_input_box.y + padding))
         
         # Draw blinking cursor if input is active
         if self.input_active and pygame.time.get_ticks() % 1000 < 500:
-            cursor_x = self.name_input_box.x + 10 + name_text.get_width()
-            pygame.draw.line(self.screen, TEXT_COLOR, 
-                           (cursor_x, self.name_input_box.y + 10),
-                           (cursor_x, self.name_input_box.y + 40), 2)
+            cursor_x = self.name_input_box.x + padding + name_text.get_width()
+            self.screen.draw_shape(pygame.draw.line, TEXT_COLOR, 
+                           (cursor_x, self.name_input_box.y + padding),
+                           (cursor_x, self.name_input_box.y + px(40)), max(1, px(2)))
         
         # Draw confirm button
         self.name_confirm_button.draw(self.screen)
@@ -1310,7 +1550,7 @@ class MenuSystem:
             BLACK
         )
         self.screen.blit(instruction_text, 
-                       (SCREEN_WIDTH // 2 - instruction_text.get_width() // 2, 420))
+                       (SCREEN_WIDTH // 2 - instruction_text.get_width() // 2, px(420)))
 # Game class
 class Game:
     def __init__(self):
@@ -1320,57 +1560,116 @@ class Game:
         # Initialize menu system
         self.menu_system = MenuSystem(screen, self.settings_manager)
         
+        # Resolved graphics quality, shared with the effects (updated in place when it changes)
+        self.quality = quality.settings
+        
         # Apply saved settings
         audio.set_music_volume(self.settings_manager.get('music_volume', 0.5))
         audio.sound_enabled = True  # Always enable sound effects
         audio.music_enabled = self.settings_manager.get('music_enabled', True)
         
-        # Always use windowed mode
-        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        
         # Game state
         self.game_state = 'menu'  # 'menu', 'playing', 'paused', 'game_over'
         self.paused = False
         self.pause_menu_state = 'main'  # 'main', 'settings', 'credits'
         self.player = Player()
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.LayeredUpdates()  # Traps and player, drawn by layer
         self.traps = pygame.sprite.Group()
-        self.hearts = pygame.sprite.Group()
+        self.hearts = pygame.sprite.LayeredUpdates()  # HUD layer
         self.effects = pygame.sprite.Group()  # Group for visual effects
         self.all_sprites.add(self.player)
         
+        # Render the crack variants for the player frames and the screen before play starts,
+        # at the depth of every quality level so a level change never renders them at death
+        crack_depths = {level['crack_depth'] for level in QUALITY_LEVELS} | {self.quality.crack_depth}
+        crack_library.prepare('player', {(frame.width, frame.height)
+                                         for frames in self.player.animations.values() for frame in frames},
+                              crack_depths)
+        crack_library.prepare('screen', [(SCREEN_WIDTH, SCREEN_HEIGHT)], crack_depths)
+        
+        # Build the stone statues for the hurt frames (the usual frame at death) ahead of time
+        try:
+            from crumbling_death import prepare_statues
+            prepare_statues(frame.image for frame in self.player.animations['hurt'])
+        except ImportError:
+            pass
+        self.hud = HudLayer()  # Score, names and hearts, rebuilt only when they change
+        
+        # Full-screen tint layers, created once and reused every frame
+        self.overlays = OverlayCache()
+        
+        # Two offscreen layers the game world is composed into, then presented with one blit.
+        # With the surface renderer a worker thread composes the parallax layers into one of
+        # them while the sprites update; SDL's renderer is used from the main thread only
+        self.parallax = ParallaxCompositor(
+            [screen.create_layer((SCREEN_WIDTH, SCREEN_HEIGHT)) for _ in range(2)],
+            BACKDROP_COLOR, threaded=screen.name == 'surface')
+        
+        # Flickering torch light multiplied over the world (L cycles off/low/high while playing)
+        self.lighting = TorchLighting(screen, (SCREEN_WIDTH, SCREEN_HEIGHT), UI_SCALE,
+                                      lighting_quality(self.settings_manager.get('lighting_quality')))
+        
+        # Low frame rates while nobody is playing or looking (see idle.py)
+        self.idle = IdlePolicy(idle_setting(self.settings_manager.get('idle_throttle')))
+        
+        # Waits out each frame and records how evenly frames are presented
+        self.pacer = FramePacer(clock, pacing_mode(self.settings_manager.get('frame_pacing')))
+        self.present_ms = 0.0  # Time this frame spent presenting, left out of the quality measurement
+        
+        # Gameplay recording (F9, or TOMB_BOUND_CAPTURE to record from startup)
+        self.recorder = FrameRecorder(screen, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                      capture_format(self.settings_manager.get('capture_format')))
+        if capture_directory():
+            self.recorder.start(self.quality.fps_cap, capture_directory())
+        
+        # Frozen, pre-dimmed frame behind the pause menu and game over screen, and the
+        # screen it was captured for (None once the world changes underneath it)
+        self.backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.backdrop_key = None
+        
+        # Sound handles for game events
+        self.hurt_sound = audio.get_handle('hurt')
+        self.death_sound = audio.get_handle('death')
+        self.game_over_sound = audio.get_handle('game_over')
+        
         # Screen shake effect
         self.screen_shake_amount = 0
         self.screen_shake_duration = 0
         self.screen_shake_decay = 0.9
         
         # Create pause menu buttons
-        button_width = 250
-        button_height = 60
+        button_width = px(250)
+        button_height = px(60)
         button_x = SCREEN_WIDTH // 2 - button_width // 2
-        button_spacing = 70
+        button_top = px(200)
+        button_spacing = px(70)
         
         self.pause_buttons = {
             'main': [
-                Button(button_x, 200, button_width, button_height, "Resume Game", action="resume"),
-                Button(button_x, 200 + button_spacing, button_width, button_height, "Settings", action="settings"),
-                Button(button_x, 200 + button_spacing * 2, button_width, button_height, "Credits", action="credits"),
-                Button(button_x, 200 + button_spacing * 3, button_width, button_height, "Quit Game", action="quit")
+                Button(button_x, button_top, button_width, button_height, "Resume Game", action="resume"),
+                Button(button_x, button_top + button_spacing, button_width, button_height, "Settings", action="settings"),
+                Button(button_x, button_top + button_spacing * 2, button_width, button_height, "Credits", action="credits"),
+                Button(button_x, button_top + button_spacing * 3, button_width, button_height, "Quit Game", action="quit")
             ],
             'settings': [
-                Button(button_x, SCREEN_HEIGHT - 100, button_width, button_height, "Back", action="back")
+                Button(button_x, SCREEN_HEIGHT - px(100), button_width, button_height, "Back", action="back")
             ],
             'credits': [
-                Button(button_x, SCREEN_HEIGHT - 100, button_width, button_height, "Back", action="back")
+                Button(button_x, SCREEN_HEIGHT - px(100), button_width, button_height, "Back", action="back")
             ]
         }
         
+        # Pulsing pause title, smoothscaled once instead of every paused frame
+        title_text = render_text_with_border(title_font, "PAUSED", HIGHLIGHT_COLOR, BLACK)
+        self.pause_title_frames = ScaledFrames(title_text, 0.8, 1.0)
+        self.pause_title_height = title_text.get_height()
+        
         # Create slider for music volume in pause menu
         self.pause_music_slider = Slider(
-            SCREEN_WIDTH // 2 - 150, 
-            250, 
-            300, 
-            20, 
+            SCREEN_WIDTH // 2 - px(150), 
+            px(250), 
+            px(300), 
+            px(20), 
             0.0, 
             1.0, 
             self.settings_manager.get('music_volume', 0.5),
@@ -1380,7 +1679,7 @@ class Game:
         # Create toggle for music in pause menu
         self.pause_music_toggle = ToggleButton(
             button_x, 
-            180, 
+            px(180), 
             button_width, 
             button_height, 
             "", 
@@ -1388,11 +1687,14 @@ class Game:
             state=self.settings_manager.get('music_enabled', True)
         )
         
+        # Graphics preset button in the pause menu
+        self.pause_graphics_button = ChoiceButton(button_x, px(390), button_width, button_height,
+                                                  PRESETS, action="Graphics", choice=quality.preset)
+        
         # Create hearts for health display
         for i in range(self.player.max_health):
-            heart = Heart(SCREEN_WIDTH - 50 - (i * 35), 40)  # Adjusted position to be below player name
+            heart = Heart(SCREEN_WIDTH - px(50) - (i * px(35)), px(40))  # Adjusted position to be below player name
             self.hearts.add(heart)
-            self.all_sprites.add(heart)
         
         self.speed = 5  # Initial speed (slower to start)
         self.score = 0
@@ -1405,7 +1707,7 @@ class Game:
         
         # Credits scrolling variables for pause menu
         self.pause_credits_scroll_pos = SCREEN_HEIGHT  # Start from bottom
-        self.pause_credits_scroll_speed = 2  # Pixels per frame - increased to match main menu
+        self.pause_credits_scroll_speed = 2 * UI_SCALE  # Pixels per frame - increased to match main menu
         
         # Enhanced game over screen
         try:
@@ -1430,9 +1732,13 @@ class Game:
                 self.backgrounds.append(
                     Background(
                         background_layers[layer_name]['image'], 
-                        background_layers[layer_name]['speed']
+                        background_layers[layer_name]['speed'],
+                        layer_name
                     )
                 )
+        
+        # The torches scroll with the pillars
+        self.torch_wall = next((bg for bg in self.backgrounds if bg.name == 'pillar'), None)
     
     def reset_game(self):
         """Reset the game state without changing player name"""
@@ -1441,17 +1747,17 @@ class Game:
         
         # Reset game objects
         self.player = Player()
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.LayeredUpdates()
         self.traps = pygame.sprite.Group()
-        self.hearts = pygame.sprite.Group()
+        self.hearts = pygame.sprite.LayeredUpdates()
         self.effects = pygame.sprite.Group()
         self.all_sprites.add(self.player)
+        self.backdrop_key = None
         
         # Create hearts for health display
         for i in range(self.player.max_health):
-            heart = Heart(SCREEN_WIDTH - 50 - (i * 35), 40)
+            heart = Heart(SCREEN_WIDTH - px(50) - (i * px(35)), px(40))
             self.hearts.add(heart)
-            self.all_sprites.add(heart)
         
         # Reset game variables
         self.speed = 4  # Reduced initial speed for easier start
@@ -1466,8 +1772,20 @@ class Game:
         # Set game state to playing
         self.game_state = 'playing'
         
-        # Start playing background music
-        audio.play_music()
+        # Rewind the already loaded background music for the new run
+        audio.play_music('gameplay')
+    
+    def pause_game(self):
+        """Stop gameplay behind the pause menu"""
+        self.game_state = 'paused'
+        self.pause_menu_state = 'main'
+        audio.pause_music()
+    
+    def animating(self):
+        """True while a menu shows something that should keep moving smoothly (scrolling credits)"""
+        if self.game_state == 'menu':
+            return self.menu_system.current_menu == 'credits'
+        return self.game_state == 'paused' and self.pause_menu_state == 'credits'
     
     def start_game(self, player_name):
         """Start a new game with the given player name"""
@@ -1506,6 +1824,10 @@ class Game:
             if self.pause_music_slider.update(mouse_pos, mouse_pressed):
                 audio.set_music_volume(self.pause_music_slider.current_val)
                 self.settings_manager.set('music_volume', self.pause_music_slider.current_val)
+            
+            # Update graphics preset
+            if self.pause_graphics_button.update(mouse_pos, mouse_clicked):
+                set_graphics_preset(self.settings_manager, self.pause_graphics_button.choice)
         
         elif self.pause_menu_state == 'credits':
             # Update credits buttons
@@ -1524,6 +1846,8 @@ class Game:
             audio.unpause_music()
         elif action == 'settings':
             self.pause_menu_state = 'settings'
+            # The preset may have been changed from the main menu since
+            self.pause_graphics_button.set_choice(quality.preset)
         elif action == 'credits':
             self.pause_menu_state = 'credits'
             # Reset credits scroll position when entering credits
@@ -1535,13 +1859,24 @@ class Game:
             self.pause_menu_state = 'main'
     def run(self):
         # Start playing background music
-        audio.play_music()
+        audio.play_music('menu')
         
         # Main game loop
         running = True
         while running:
-            # Process events
+            frame_start = time.perf_counter()
+            self.present_ms = 0.0
+            
+            # Process events, starting with the one that woke an idle wait
             events = pygame.event.get()
+            if self.idle.woken is not None:
+                events.insert(0, self.idle.woken)
+                self.idle.woken = None
+            
+            # Pause a run in progress when the window loses focus
+            if self.idle.handle(events) and self.game_state == 'playing' and not self.game_over:
+                self.pause_game()
+            
             for event in events:
                 if event.type == pygame.QUIT:
                     running = False
@@ -1549,12 +1884,14 @@ class Game:
                 if event.type == pygame.KEYDOWN:
                     # Handle ESC key for pause menu
                     if event.key == pygame.K_ESCAPE and self.game_state == 'playing':
-                        self.game_state = 'paused'
-                        self.pause_menu_state = 'main'
-                        audio.pause_music()
+                        self.pause_game()
                     elif event.key == pygame.K_ESCAPE and self.game_state == 'paused':
                         self.game_state = 'playing'
                         audio.unpause_music()
+                    
+                    # Start or stop recording
+                    if event.key == pygame.K_F9:
+                        self.recorder.toggle(self.quality.fps_cap)
                 
                 if self.game_state == 'playing':
                     if event.type == pygame.KEYDOWN:
@@ -1567,7 +1904,7 @@ class Game:
                             # Return to main menu
                             self.game_state = 'menu'
                             # Restart the music instead of stopping it
-                            audio.play_music()
+                            audio.play_music('menu', fade_ms=MUSIC_FADE_MS)
                             self.menu_system = MenuSystem(screen, self.settings_manager)
                         # Audio controls - only apply when not in game over state
                         elif event.key == pygame.K_m and not self.game_over:
@@ -1582,11 +1919,15 @@ class Game:
                             # Decrease music volume
                             audio.set_music_volume(audio.music_volume - 0.1)
                             self.settings_manager.set('music_volume', audio.music_volume)
+                        if event.key == pygame.K_l:
+                            # Cycle the lighting quality
+                            self.lighting.set_quality(next_quality(self.lighting.quality))
+                            self.settings_manager.set('lighting_quality', self.lighting.quality)
                     
                     # Handle delayed game over sound and screen
                     if event.type == pygame.USEREVENT and self.game_over:
                         # After red screen effect, play game over sound
-                        audio.play_sound('game_over', 'game')
+                        self.game_over_sound.play()
                         pygame.time.set_timer(pygame.USEREVENT, 0)  # Cancel the timer
                     
                     # Handle delayed game over screen display
@@ -1609,39 +1950,60 @@ class Game:
                 if not self.game_over:
                     self.update_game()
                 else:
-                    # Game over - make sure all hearts are empty
-                    for heart in self.hearts:
-                        heart.update(False)
+                    self.update_game_over()
             
             elif self.game_state == 'paused':
                 # Handle pause menu
                 self.update_pause_menu(events)
             
-            # Draw everything
-            self.draw()
+            # Advance music transitions without blocking the frame
+            audio.update()
             
-            # Cap the frame rate
-            clock.tick(FPS)
+            # Draw everything (nothing is seen while the window is minimised, unless recording)
+            drawn = not self.idle.minimized or self.recorder.recording
+            if drawn:
+                self.draw()
+            telemetry.end_frame()
+            
+            # Let the quality controller see how long the frame took before the wait,
+            # without presenting (with vsync it blocks until the refresh, whatever the load)
+            work_ms = (time.perf_counter() - frame_start) * 1000
+            if drawn:
+                quality.frame(work_ms - self.present_ms)
+            
+            # Idle or unfocused, sleep until the next slow frame or the next input
+            # (not while recording, whose frames are played back at the full rate)
+            rate = self.idle.frame_rate(self.game_state, self.animating(), self.quality.fps_cap)
+            if rate < self.quality.fps_cap and not self.recorder.recording:
+                self.idle.wait(rate, work_ms)
+                self.pacer.interrupt()  # A slow frame on purpose; not a pacing miss
+            
+            # Cap the frame rate (FPS unless the graphics preset sets another cap)
+            self.pacer.tick(self.quality.fps_cap)
         
         # Save settings before quitting
+        print(self.pacer.report())
+        self.recorder.stop()
         self.settings_manager.save_settings()
+        self.parallax.stop()
         pygame.quit()
         sys.exit()
     
     def update_game(self):
         """Update game state during gameplay"""
+        # The world moves every frame, so any captured backdrop is stale
+        self.backdrop_key = None
+        
         # Update screen shake
-        if self.screen_shake_duration > 0:
-            self.screen_shake_duration -= 1
-            if self.screen_shake_duration <= 0:
-                self.screen_shake_amount = 0
-            else:
-                self.screen_shake_amount *= self.screen_shake_decay
+        self.update_screen_shake()
         
         # Update backgrounds
         for bg in self.backgrounds:
             bg.update(self.speed)  # Pass current game speed to backgrounds
         
+        # Their positions are final for this frame, so compose them while the sprites update
+        self.parallax.submit(self.background_copies())
+        
         # Update sprites
         self.all_sprites.update()
         
@@ -1675,7 +2037,7 @@ class Game:
             can_spawn = True
             
             # Ensure enough space between traps for comfortable jumping
-            min_distance = 350 + (self.speed - 8) * 15  # Significantly increased minimum distance
+            min_distance = px(350 + (self.speed - 8) * 15)  # Significantly increased minimum distance
             
             # Check all existing traps to ensure proper spacing
             for trap in self.traps:
@@ -1748,7 +2110,7 @@ class Game:
                 overlap_area = overlap_width * overlap_height
                 
                 # Only count as collision if overlap area is significant
-                if overlap_area > 50:  # Minimum overlap threshold
+                if overlap_area > 50 * UI_SCALE ** 2:  # Minimum overlap threshold
                     # Create destruction effect at trap position
                     effect = DestroyEffect(trap.rect.centerx, trap.rect.centery)
                     self.effects.add(effect)
@@ -1757,13 +2119,17 @@ class Game:
                     if self.player.take_damage():
                         # Player died
                         self.game_over = True
+                        
+                        # The crumbling effect draws the player from here on
+                        if getattr(self.player, 'crumbling', False):
+                            self.all_sprites.remove(self.player)
                         # Make sure all hearts are empty
                         for heart in self.hearts:
                             heart.update(False)
-                        audio.pause_music()  # Pause background music
+                        audio.play_music('game_over', fade_ms=MUSIC_FADE_MS)  # Fade out background music
                         
                         # Play death sound only (not hurt sound)
-                        audio.play_sound('death', 'game')
+                        self.death_sound.play()
                         
                         # Initialize enhanced game over screen if available
                         if self.has_game_over_screen:
@@ -1771,14 +2137,12 @@ class Game:
                             self.game_over_screen = GameOverScreen(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
                         
                         # Apply screen shake for dramatic effect
-                        self.screen_shake_amount = 10
+                        self.screen_shake_amount = px(10)
                         self.screen_shake_duration = 30  # frames
                         
                         # Show red overlay immediately for game over
-                        red_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                        red_overlay.fill((255, 0, 0, 150))  # Brighter red with more opacity
-                        screen.blit(red_overlay, (0, 0))
-                        pygame.display.flip()  # Update the display immediately to show red flash
+                        self.overlays.blit(screen, (255, 0, 0), 150)  # Brighter red with more opacity
+                        self.present()  # Update the display immediately to show red flash
                         
                         # First timer for red screen effect
                         pygame.time.set_timer(pygame.USEREVENT, 500)  # 0.5 second delay with red screen
@@ -1790,7 +2154,7 @@ class Game:
                         self.settings_manager.update_high_score(self.score, self.player_name)
                     else:
                         # Player hurt but not dead
-                        audio.play_sound('hurt')
+                        self.hurt_sound.play()
                     
                     # Always remove the trap that caused damage
                     trap.kill()
@@ -1803,6 +2167,43 @@ class Game:
         if self.score % 300 == 0:  # More frequent speed increases
             self.speed += 0.5  # Smaller speed increments for smoother acceleration
     
+    def update_game_over(self):
+        """Keep the screen shake and the death animation running after the player dies"""
+        if self.screen_shake_amount > 0:
+            self.update_screen_shake()
+            self.backdrop_key = None  # The world is still shaking
+        
+        # The crumbling player is no longer in all_sprites, so advance it here until it is gone
+        if getattr(self.player, 'crumbling', False) and not self.player.crumbling_death.is_finished():
+            self.player.update()
+            self.backdrop_key = None  # The crumble animates underneath the game over screen
+        
+        # Game over - make sure all hearts are empty
+        for heart in self.hearts:
+            heart.update(False)
+    
+    def update_screen_shake(self):
+        """Decay the game's screen shake"""
+        if self.screen_shake_duration > 0:
+            self.screen_shake_duration -= 1
+            if self.screen_shake_duration <= 0:
+                self.screen_shake_amount = 0
+            else:
+                self.screen_shake_amount *= self.screen_shake_decay
+    
+    def shake_offset(self):
+        """Combined world offset of the game's shake and the crumbling death's shake"""
+        offset_x = 0
+        offset_y = 0
+        if self.screen_shake_amount > 0:
+            offset_x = random.randint(-int(self.screen_shake_amount), int(self.screen_shake_amount))
+            offset_y = random.randint(-int(self.screen_shake_amount), int(self.screen_shake_amount))
+        
+        if self.game_over and getattr(self.player, 'crumbling', False):
+            offset_x += self.player.crumbling_death.shake_offset_x
+            offset_y += self.player.crumbling_death.shake_offset_y
+        return offset_x, offset_y
+    
     def spawn_trap(self):
         """Create a new trap"""
         # Randomly decide if we should spawn a special trap pattern
@@ -1820,7 +2221,7 @@ class Game:
                 
                 # Second trap follows with enough space to jump over
                 trap2 = Trap(self.speed * 0.95)  # Slightly slower
-                trap2.rect.x = SCREEN_WIDTH + random.randint(350, 450)  # Significantly increased spacing
+                trap2.rect.x = SCREEN_WIDTH + px(random.randint(350, 450))  # Significantly increased spacing
                 self.traps.add(trap2)
                 self.all_sprites.add(trap2)
                 
@@ -1832,7 +2233,7 @@ class Game:
                 
                 # Second trap follows at a comfortable jumping distance
                 trap2 = Trap(self.speed)
-                trap2.rect.x = SCREEN_WIDTH + random.randint(400, 500)  # Much more space
+                trap2.rect.x = SCREEN_WIDTH + px(random.randint(400, 500))  # Much more space
                 self.traps.add(trap2)
                 self.all_sprites.add(trap2)
         else:
@@ -1842,152 +2243,200 @@ class Game:
             self.all_sprites.add(trap)
     def draw(self):
         """Draw the game"""
-        # Apply screen shake if active
-        shake_offset_x = 0
-        shake_offset_y = 0
-        if self.screen_shake_amount > 0:
-            shake_offset_x = random.randint(-int(self.screen_shake_amount), int(self.screen_shake_amount))
-            shake_offset_y = random.randint(-int(self.screen_shake_amount), int(self.screen_shake_amount))
-        
-        # Clear the screen
-        screen.fill((50, 50, 80))  # Dark blue-gray background
-        
         if self.game_state == 'menu':
+            # Clear the screen
+            screen.fill(BACKDROP_COLOR)
+            
             # Draw menu
             self.menu_system.draw()
         
         elif self.game_state == 'playing' or self.game_state == 'paused':
-            # Draw backgrounds in the correct order (from back to front)
-            layer_order = ['sky', 'wall', 'background1', 'background2', 'pillar', 'ground']
-            for layer_name in layer_order:
-                for bg in self.backgrounds:
-                    if bg.image == background_layers[layer_name]['image']:
-                        # Apply screen shake to background layers except sky
-                        if layer_name != 'sky' and self.screen_shake_amount > 0:
-                            bg.draw(screen, offset_x=shake_offset_x, offset_y=shake_offset_y)
-                        else:
-                            bg.draw(screen)
-                        break
-            
-            # Draw ground line (only if ground image is not loaded)
-            if background_layers['ground']['image'] is None:
-                pygame.draw.line(screen, BLACK, (0, GROUND_HEIGHT), 
-                                (SCREEN_WIDTH, GROUND_HEIGHT), 2)
-            
-            # Draw sprites
-            for sprite in self.all_sprites:
-                if sprite == self.player and self.game_over:
-                    # Skip drawing the player if game is over and player has been removed
-                    if not hasattr(self.player, 'image') or self.player.image is None:
-                        continue
-                    # Otherwise draw with current opacity
-                    screen.blit(self.player.image, self.player.rect)
-                else:
-                    screen.blit(sprite.image, sprite.rect)
-            
-            # Draw particle effects
-            for effect in self.effects:
-                effect.draw(screen)
-                
-            # Draw the player with fade effect if needed
-            if self.game_over and hasattr(self.player, 'crumbling') and self.player.crumbling:
-                if hasattr(self.player, 'crumbling_death'):
-                    self.player.crumbling_death.draw()
-            elif self.game_over and hasattr(self.player, 'disintegrating') and self.player.disintegrating:
-                if hasattr(self.player, 'image') and self.player.image is not None:
-                    screen.blit(self.player.image, self.player.rect)
-                
-            # Draw red overlay when player is dead
-            if self.game_over and not self.show_game_over:
-                # Create a semi-transparent red overlay
-                red_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                red_overlay.fill((255, 0, 0, 150))  # Brighter red with more opacity
-                screen.blit(red_overlay, (0, 0))
-            
-            # Draw score (divided by 10 to slow it down) with smaller font and border
-            visible_score = self.score // 10
-            
-            # Format score as 4 digits (0000)
-            formatted_score = f"{visible_score:04d}"
-            
-            # Create a score display with border
-            score_text = render_text_with_border(score_font, f"Score: {formatted_score}", TEXT_COLOR, BLACK)
-            screen.blit(score_text, (10, 10))
-            
-            # Draw high score with border (without player name during gameplay)
-            high_score = self.settings_manager.get('high_score', 0) // 10
-            formatted_high_score = f"{high_score:04d}"
-            high_score_text = render_text_with_border(score_font, f"High Score: {formatted_high_score}", TEXT_COLOR, BLACK)
-            screen.blit(high_score_text, (10, 40))  # Adjusted position due to smaller font
-            
-            # Draw player name with border
-            name_text = render_text_with_border(score_font, f"Player: {self.player_name}", TEXT_COLOR, BLACK)
-            name_x = SCREEN_WIDTH - name_text.get_width() - 20
-            name_y = 10
-            screen.blit(name_text, (name_x, name_y))
-            
-            # Draw hearts below the player name
-            heart_y = name_y + name_text.get_height() + 5
-            for i, heart in enumerate(self.hearts):
-                heart.rect.x = SCREEN_WIDTH - 50 - (i * 35)
-                heart.rect.y = heart_y
-            
-            # Show game over screen if needed
-            if self.game_over and self.show_game_over:
-                if self.has_game_over_screen and self.game_over_screen:
-                    # Use enhanced game over screen
-                    self.game_over_screen.update()
-                    self.game_over_screen.draw()
-                else:
-                    # Use standard game over screen
-                    # Create a semi-transparent overlay
-                    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                    overlay.fill((0, 0, 0, 128))  # Black with 50% transparency
-                    screen.blit(overlay, (0, 0))
-                    
-                    # Game over text with border
-                    game_over_text = render_text_with_border(title_font, "Game Over!", TEXT_COLOR, BLACK)
-                    screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 80))
-                    
-                    # Restart instruction with border
-                    restart_text = render_text_with_border(main_font, "Press R to restart", TEXT_COLOR, BLACK)
-                    screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 10))
-                    
-                    # Menu instruction with border
-                    menu_text = render_text_with_border(main_font, "Press M for main menu", TEXT_COLOR, BLACK)
-                    screen.blit(menu_text, (SCREEN_WIDTH // 2 - menu_text.get_width() // 2, SCREEN_HEIGHT // 2 + 50))
-                    
-                    # New high score notification with border
-                    if self.score == self.settings_manager.get('high_score', 0) and self.score > 0:
-                        high_score_text = render_text_with_border(main_font, "NEW HIGH SCORE!", (255, 255, 0), BLACK)  # Yellow text with black border
-                        screen.blit(high_score_text, (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, SCREEN_HEIGHT // 2 + 90))
+            # The pause menu and the game over screen sit on a frozen, pre-dimmed copy
+            # of the frame below them, recaptured only when the world has changed
+            frozen = self.frozen_screen()
+            if self.game_over_screen_covers():
+                pass  # Nothing behind the faded-in game over screen shows through
+            elif frozen is None or frozen != self.backdrop_key:
+                self.draw_scene()
+                if frozen is not None:
+                    self.capture_backdrop(frozen)
+            else:
+                screen.blit(self.backdrop, (0, 0))
             
-            # Draw pause menu if game is paused
-            if self.game_state == 'paused':
+            # Draw the live screen on top
+            if frozen == 'game_over':
+                self.draw_game_over()
+            elif frozen == 'paused':
                 self.draw_pause_menu()
         
         # Update the display
-        pygame.display.flip()
+        self.present()
+        self.pacer.presented(self.quality.fps_cap)
+        self.recorder.capture()
+    
+    def present(self):
+        """Show the screen, keeping the time spent in present (which blocks with vsync) apart"""
+        start = time.perf_counter()
+        screen.present()
+        self.present_ms += (time.perf_counter() - start) * 1000
+    
+    def frozen_screen(self):
+        """The screen drawn over a frozen backdrop: 'paused', 'game_over' or None"""
+        if self.game_state == 'paused':
+            return 'paused'
+        if self.game_over and self.show_game_over:
+            return 'game_over'
+        return None
+    
+    def world_animating(self):
+        """True while the world still shakes or the player still crumbles after dying"""
+        if self.screen_shake_amount > 0:
+            return True
+        return getattr(self.player, 'crumbling', False) and not self.player.crumbling_death.is_finished()
+    
+    def game_over_screen_covers(self):
+        """True once the enhanced game over screen has faded in fully and hides the world"""
+        return (self.frozen_screen() == 'game_over' and self.has_game_over_screen
+                and self.game_over_screen is not None and self.game_over_screen.is_opaque())
+    
+    def capture_backdrop(self, frozen):
+        """Dim the composed frame and keep a copy of it as the backdrop for a frozen screen
+        (the game over screen's only once the world under it has stopped moving)"""
+        if self.game_over and self.show_game_over:
+            if not (self.has_game_over_screen and self.game_over_screen):
+                # Dim with the cached semi-transparent overlay
+                self.overlays.blit(screen, BLACK, 128)  # Black with 50% transparency
+            
+            # Pausing freezes the game over screen along with the world
+            if frozen == 'paused':
+                self.draw_game_over()
+        
+        if frozen == 'paused':
+            # Dim the game with the cached semi-transparent overlay
+            self.overlays.blit(screen, BLACK, 180)  # Black with transparency
+        
+        # A copy of a world still shaking or crumbling under the game over screen would
+        # be stale by the next frame; it is taken on the first frame the world is still
+        if frozen == 'game_over' and self.world_animating():
+            return
         
+        screen.capture(self.backdrop)
+        self.backdrop_key = frozen
+        telemetry.count('backdrop.captures')
+    
+    def draw_scene(self):
+        """Draw the shaken world with the red death tint and the HUD on top"""
+        # Compose the world, then present it with the screen shake as a single offset blit
+        world = self.parallax.result(self.background_copies)
+        self.draw_world(world)
+        self.lighting.draw(world, self.torch_lights())
+        offset = self.shake_offset()
+        if offset != (0, 0):
+            # Clear the edges the shifted world leaves uncovered
+            screen.fill(BACKDROP_COLOR)
+        screen.blit(world, offset)
+        
+        # Draw red overlay when player is dead
+        if self.game_over and not self.show_game_over:
+            # Tint with the cached semi-transparent red overlay
+            self.overlays.blit(screen, (255, 0, 0), 150)  # Brighter red with more opacity
+        
+        # Draw the HUD layer; scores are divided by 10 to slow them down, so the
+        # layer is only rebuilt every 10 frames or when the hearts change
+        self.hud.draw(screen, self.score // 10, self.settings_manager.get('high_score', 0) // 10,
+                      self.player_name, self.hearts)
+    
+    def draw_game_over(self):
+        """Draw the game over screen"""
+        if self.has_game_over_screen and self.game_over_screen:
+            # Use enhanced game over screen
+            self.game_over_screen.update()
+            self.game_over_screen.draw()
+        else:
+            # Use standard game over screen (the backdrop is already dimmed)
+            # Game over text with border
+            game_over_text = render_text_with_border(title_font, "Game Over!", TEXT_COLOR, BLACK)
+            screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - px(80)))
+            
+            # Restart instruction with border
+            restart_text = render_text_with_border(main_font, "Press R to restart", TEXT_COLOR, BLACK)
+            screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + px(10)))
+            
+            # Menu instruction with border
+            menu_text = render_text_with_border(main_font, "Press M for main menu", TEXT_COLOR, BLACK)
+            screen.blit(menu_text, (SCREEN_WIDTH // 2 - menu_text.get_width() // 2, SCREEN_HEIGHT // 2 + px(50)))
+            
+            # New high score notification with border
+            if self.score == self.settings_manager.get('high_score', 0) and self.score > 0:
+                high_score_text = render_text_with_border(main_font, "NEW HIGH SCORE!", (255, 255, 0), BLACK)  # Yellow text with black border
+                screen.blit(high_score_text, (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, SCREEN_HEIGHT // 2 + px(90)))
+    
+    def background_copies(self):
+        """Blit list of every background layer, back to front (self.backgrounds is ordered)"""
+        copies = []
+        dropped = self.quality.dropped_layers  # Distant layers left out at lower quality levels
+        for bg in self.backgrounds:
+            if bg.name in dropped:
+                continue
+            copies.extend(bg.copies())
+            if bg is self.torch_wall and torch_image is not None:
+                torches = viewport.visible_items('torches', self.torch_positions(), torch_extent)
+                copies.extend((torch_image, position) for position, _ in torches)
+        return copies
+    
+    def torch_positions(self):
+        """(top left, flicker offset) of every torch on the pillar copies on screen"""
+        if self.torch_wall is None:
+            return []
+        wall = self.torch_wall
+        height = wall.image.get_height()
+        positions = []
+        for i, (_, (x, y)) in enumerate(wall.copies()):
+            for j, (mount_x, mount_y) in enumerate(TORCH_MOUNTS):
+                # Offsets keep neighbouring torches out of step with each other
+                positions.append(((int(x + wall.width * mount_x) - px(30), int(y + height * mount_y)), i * 5 + j * 7))
+        return positions
+    
+    def torch_lights(self):
+        """(x, y, flicker offset) of every torch flame, for the lighting pass"""
+        flame_x, flame_y = int(px(60) * TORCH_FLAME[0]), int(px(60) * TORCH_FLAME[1])
+        return [(x + flame_x, y + flame_y, offset) for (x, y), offset in self.torch_positions()]
+    
+    def draw_world(self, surface):
+        """Draw the traps, player and effects over the composed parallax layers"""
+        # Draw ground line (only if ground image is not loaded)
+        if background_layers['ground']['image'] is None:
+            surface.draw_shape(pygame.draw.line, BLACK, (0, GROUND_HEIGHT), 
+                            (SCREEN_WIDTH, GROUND_HEIGHT), 2)
+        
+        # Draw traps and the player in layer order with the group's C-level blit loop
+        # (a crumbling or removed player is no longer in the group)
+        self.all_sprites.draw(surface)
+        
+        # Draw particle effects
+        for effect in self.effects:
+            effect.draw(surface)
+            
+        # Draw the player with fade effect if needed
+        if self.game_over and hasattr(self.player, 'crumbling') and self.player.crumbling:
+            if hasattr(self.player, 'crumbling_death'):
+                self.player.crumbling_death.draw(surface)
+        elif self.game_over and hasattr(self.player, 'disintegrating') and self.player.disintegrating:
+            if hasattr(self.player, 'image') and self.player.image is not None:
+                surface.blit(self.player.image, self.player.rect)
+    
     def draw_pause_menu(self):
-        """Draw the pause menu overlay"""
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Black with transparency
-        screen.blit(overlay, (0, 0))
-        
-        # Draw pause menu title with enhanced effect
-        title_text = render_text_with_border(title_font, "PAUSED", HIGHLIGHT_COLOR, BLACK)
-        
-        # Add pulsing effect to the pause title
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.003)) * 0.2 + 0.8
-        scaled_width = int(title_text.get_width() * pulse)
-        scaled_height = int(title_text.get_height() * pulse)
-        scaled_title = pygame.transform.smoothscale(title_text, (scaled_width, scaled_height))
+        """Draw the pause menu overlay (the backdrop is already dimmed)"""
+        # Add pulsing effect to the pause title using the precomputed scaled frames
+        # (lower quality levels keep it still at full size)
+        pulse = 1.0
+        if self.quality.pause_title_pulse:
+            pulse = abs(math.sin(pygame.time.get_ticks() * 0.003)) * 0.2 + 0.8
+        scaled_title = self.pause_title_frames.get(pulse)
         
         # Position the title
         title_x = SCREEN_WIDTH // 2 - scaled_title.get_width() // 2
-        title_y = 80 - (scaled_height - title_text.get_height()) // 2  # Adjust for scaling
+        title_y = px(80) - (scaled_title.get_height() - self.pause_title_height) // 2  # Adjust for scaling
         screen.blit(scaled_title, (title_x, title_y))
         
         # Draw appropriate pause menu content based on state
@@ -1999,16 +2448,19 @@ class Game:
         elif self.pause_menu_state == 'settings':
             # Draw settings title
             settings_title = render_text_with_border(main_font, "SETTINGS", TEXT_COLOR, BLACK)
-            screen.blit(settings_title, (SCREEN_WIDTH // 2 - settings_title.get_width() // 2, 150))
+            screen.blit(settings_title, (SCREEN_WIDTH // 2 - settings_title.get_width() // 2, px(150)))
             
             # Draw music toggle
-            self.pause_music_toggle.rect.y = 220
+            self.pause_music_toggle.rect.y = px(220)
             self.pause_music_toggle.draw(screen)
             
             # Draw music volume slider with more space
-            self.pause_music_slider.rect.y = 320
+            self.pause_music_slider.rect.y = px(320)
             self.pause_music_slider.draw(screen)
             
+            # Draw graphics preset button
+            self.pause_graphics_button.draw(screen)
+            
             # Draw back button
             for button in self.pause_buttons['settings']:
                 button.draw(screen)
@@ -2016,151 +2468,24 @@ class Game:
         elif self.pause_menu_state == 'credits':
             # Draw credits title
             credits_title = render_text_with_border(main_font, "CREDITS", TEXT_COLOR, BLACK)
-            screen.blit(credits_title, (SCREEN_WIDTH // 2 - credits_title.get_width() // 2, 80))
-            
-            # Updated credits content with formatting
-            credits = [
-                ["Tomb Bound", HIGHLIGHT_COLOR, title_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["Developer", HIGHLIGHT_COLOR, main_font],
-                ["N Chandra Prakash Reddy", WHITE, main_font],
-                ["Tirupati, Andhra Pradesh, India", WHITE, main_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["Programming Language", HIGHLIGHT_COLOR, main_font],
-                ["Python 3", WHITE, main_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["Game Library", HIGHLIGHT_COLOR, main_font],
-                ["Pygame", WHITE, main_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["Development Tool", HIGHLIGHT_COLOR, main_font],
-                ["Amazon Q Developer", WHITE, main_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["2D Assets", HIGHLIGHT_COLOR, main_font],
-                ["Craftpix", WHITE, main_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["Music and Sound Effects", HIGHLIGHT_COLOR, main_font],
-                ["Pixabay", WHITE, main_font],
-                ["", WHITE, main_font],  # Empty line for spacing
-                ["Thank you for playing this game!", HIGHLIGHT_COLOR, main_font]
-            ]
-            
-            # Calculate total height of credits
-            line_spacing = 40
-            total_height = len(credits) * line_spacing
+            screen.blit(credits_title, (SCREEN_WIDTH // 2 - credits_title.get_width() // 2, px(80)))
             
             # Update scroll position
+            strip = get_credits_strip()
             self.pause_credits_scroll_pos -= self.pause_credits_scroll_speed
             
             # Reset position if credits have scrolled completely off screen
-            if self.pause_credits_scroll_pos < -total_height:
+            if self.pause_credits_scroll_pos < -strip.total_height:
                 self.pause_credits_scroll_pos = SCREEN_HEIGHT
             
-            # Create a clipping area to prevent text from appearing behind the back button
-            button_area_height = 100  # Height of the area reserved for the back button
-            
-            # Draw scrolling credits
-            y_pos = self.pause_credits_scroll_pos
-            
-            for line in credits:
-                text, color, font = line
-                if text:  # Skip empty strings in y position calculation
-                    text_surf = render_text_with_border(font, text, color, BLACK)
-                    # Only draw if within visible area and not overlapping with button area
-                    if 120 < y_pos < SCREEN_HEIGHT - button_area_height:
-                        screen.blit(text_surf, (SCREEN_WIDTH // 2 - text_surf.get_width() // 2, y_pos))
-                y_pos += line_spacing
+            # Draw scrolling credits with a single clipped blit
+            strip.draw(screen, self.pause_credits_scroll_pos)
             
             # Draw back button (fixed position)
             for button in self.pause_buttons['credits']:
-                button.rect.y = SCREEN_HEIGHT - 80
+                button.rect.y = SCREEN_HEIGHT - px(80)
                 button.draw(screen)
 
-# Fragment class from crumbling_death.py for death animation
-class Fragment:
-    def __init__(self, x, y, size, color, velocity_x=0, velocity_y=0):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.original_size = size
-        self.color = color
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-5, 5)
-        self.gravity = random.uniform(0.2, 0.4)
-        self.fade_speed = random.uniform(2, 5)
-        self.alpha = 255
-        self.shape = random.choice(['rect', 'poly'])
-        
-        # For polygon fragments
-        if self.shape == 'poly':
-            self.points = []
-            point_count = random.randint(3, 6)
-            for i in range(point_count):
-                angle = 2 * math.pi * i / point_count
-                dist = size * random.uniform(0.5, 1.0)
-                self.points.append((
-                    math.cos(angle) * dist,
-                    math.sin(angle) * dist
-                ))
-    
-    def update(self):
-        # Apply gravity
-        self.velocity_y += self.gravity
-        
-        # Update position
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        
-        # Update rotation
-        self.rotation += self.rotation_speed
-        
-        # Fade out
-        self.alpha -= self.fade_speed
-        if self.alpha < 0:
-            self.alpha = 0
-        
-        # Shrink slightly
-        self.size = max(0, self.size - 0.1)
-        
-        return self.alpha > 0 and self.size > 0
-    
-    def draw(self, surface):
-        if self.alpha <= 0:
-            return
-            
-        # Create a temporary surface for this fragment
-        temp_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        # Get color with alpha
-        color_with_alpha = (*self.color, self.alpha)
-        
-        # Draw the fragment
-        if self.shape == 'rect':
-            # Draw a rectangle
-            rect = pygame.Rect(0, 0, self.size, self.size)
-            rect.center = (self.size, self.size)
-            pygame.draw.rect(temp_surface, color_with_alpha, rect)
-        else:
-            # Draw a polygon
-            points = []
-            for px, py in self.points:
-                # Scale points based on current size ratio
-                scale = self.size / self.original_size
-                points.append((
-                    self.size + px * scale,
-                    self.size + py * scale
-                ))
-            pygame.draw.polygon(temp_surface, color_with_alpha, points)
-        
-        # Rotate the surface
-        rotated = pygame.transform.rotate(temp_surface, self.rotation)
-        
-        # Blit to the main surface
-        rect = rotated.get_rect()
-        rect.center = (int(self.x), int(self.y))
-        surface.blit(rotated, rect)
-
 # Run the game
 if __name__ == "__main__":
     game = Game()
@@ -0,0 +1,47 @@
+"""
+Viewport Culling for Tomb Bound
+Effects check their particles against the visible screen area in one pass per frame.
+Particles that left the screen for good are dropped, and ones that may come back are
+only skipped when drawing. Culled counts go to the frame telemetry
+"""
+
+from telemetry import telemetry
+
+
+class Viewport:
+    def __init__(self, width, height):
+        """Visible screen area, from (0, 0) to (width, height)"""
+        self.width = width
+        self.height = height
+
+    def visible(self, x, y, radius):
+        """True if anything within radius of (x, y) is on screen"""
+        return -radius < x < self.width + radius and -radius < y < self.height + radius
+
+    def escaped(self, x, y, velocity_x, velocity_y, radius, gravity=True):
+        """True for something off screen that is moving away and can never come back
+
+        Horizontal speed never changes sign, and gravity only pulls down, so with
+        gravity a particle above the screen still falls back into view
+        """
+        if x + radius <= 0 and velocity_x <= 0:
+            return True
+        if x - radius >= self.width and velocity_x >= 0:
+            return True
+        if y - radius >= self.height and velocity_y >= 0:
+            return True
+        return not gravity and y + radius <= 0 and velocity_y <= 0
+
+    def drop_escaped(self, name, items, motion, gravity=True):
+        """Keep the items that have not escaped; motion(item) gives (x, y, velocity_x, velocity_y, radius)"""
+        kept = [item for item in items if not self.escaped(*motion(item), gravity)]
+        if len(kept) < len(items):
+            telemetry.count(f'cull.{name}.dropped', len(items) - len(kept))
+        return kept
+
+    def visible_items(self, name, items, position):
+        """The items that are on screen; position(item) gives (x, y, radius)"""
+        shown = [item for item in items if self.visible(*position(item))]
+        if len(shown) < len(items):
+            telemetry.count(f'cull.{name}.skipped', len(items) - len(shown))
+        return shown